@@ -0,0 +1,136 @@
+"""
+Benchmark end-to-end de los clientes contra el servidor falso.
+
+Para cada escenario (get_sales, get_articles, get_customers,
+get_price_list_items) reporta registros/segundo, pico de memoria
+(tracemalloc) y el desglose por etapa que entrega InMemoryMetrics:
+requests HTTP, decodificación JSON y validación Pydantic.
+
+Con max_workers > 1 las etapas corren en paralelo, así que sus tiempos
+son acumulados por hilo y pueden sumar más que el tiempo total.
+
+Uso:
+    python -m benchmarks.bench_client
+    python -m benchmarks.bench_client --lotes 20 --records 1000 --latency 0.05 --workers 4
+    python -m benchmarks.bench_client --scenarios sales articles --json resultados.json
+"""
+import argparse
+import gc
+import json
+import logging
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_server import FakeChessServer
+from chesserp.client import ChessClient
+from chesserp.metrics import InMemoryMetrics
+from chesserp.web_client import ChessWebClient
+
+SCENARIOS: Dict[str, Callable[[Any, bool], List[Any]]] = {
+    "sales": lambda clients, raw: clients["api"].get_sales("2025-01-01", "2025-01-31", raw=raw),
+    "articles": lambda clients, raw: clients["api"].get_articles(raw=raw),
+    "customers": lambda clients, raw: clients["api"].get_customers(raw=raw),
+    "price_list_items": lambda clients, raw: clients["web"].get_price_list_items(1, 100, raw=raw),
+}
+
+
+def _clients(server: FakeChessServer, workers: int, metrics: InMemoryMetrics) -> Dict[str, Any]:
+    return {
+        "api": ChessClient(api_url=server.url, username="bench", password="bench",
+                           max_workers=workers, metrics=metrics),
+        "web": ChessWebClient(api_url=server.url, username="bench", password="bench", metrics=metrics),
+    }
+
+
+def run_scenario(server: FakeChessServer, name: str, workers: int = 1, raw: bool = False,
+                 repeat: int = 3) -> Dict[str, Any]:
+    """
+    Corre un escenario repeat veces (se toma la corrida más rápida) y una vez
+    más con tracemalloc para medir el pico de memoria.
+    """
+    scenario = SCENARIOS[name]
+    best = None
+    for _ in range(repeat):
+        metrics = InMemoryMetrics()
+        clients = _clients(server, workers, metrics)
+        gc.collect()
+        start = time.perf_counter()
+        records = scenario(clients, raw)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, len(records), metrics.summary())
+        del records
+
+    clients = _clients(server, workers, InMemoryMetrics())
+    gc.collect()
+    tracemalloc.start()
+    records = scenario(clients, raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    elapsed, count, summary = best
+    endpoints = {endpoint: stats for endpoint, stats in summary["endpoints"].items() if endpoint != "auth/login"}
+    return {
+        "scenario": name,
+        "raw": raw,
+        "workers": workers,
+        "records": count,
+        "elapsed": elapsed,
+        "records_per_sec": count / elapsed if elapsed else 0.0,
+        "peak_mb": peak / 1024 / 1024,
+        "requests": sum(stats["count"] for stats in endpoints.values()),
+        "bytes": sum(stats["bytes"] for stats in endpoints.values()),
+        "stages": {
+            "http": sum(stats["total"] for stats in endpoints.values()),
+            "decode": sum(stats["decode"] for stats in endpoints.values()),
+            "parse": sum(stats["total"] for stats in summary["parse"].values()),
+        },
+    }
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    header = (f"{'escenario':<18}{'raw':>5}{'workers':>8}{'registros':>11}{'seg':>8}{'reg/s':>10}"
+              f"{'pico MB':>9}{'MB red':>8}{'http s':>8}{'decode s':>9}{'parse s':>9}")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['scenario']:<18}{str(r['raw']):>5}{r['workers']:>8}{r['records']:>11}{r['elapsed']:>8.2f}"
+              f"{r['records_per_sec']:>10.0f}{r['peak_mb']:>9.1f}{r['bytes'] / 1024 / 1024:>8.1f}"
+              f"{r['stages']['http']:>8.2f}{r['stages']['decode']:>9.2f}{r['stages']['parse']:>9.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark offline de ChessClient / ChessWebClient")
+    parser.add_argument("--lotes", type=int, default=10, help="Lotes por endpoint paginado")
+    parser.add_argument("--records", type=int, default=500, help="Registros por lote")
+    parser.add_argument("--price-items", type=int, default=5000, help="Artículos de la lista de precios")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latencia del servidor por request (s)")
+    parser.add_argument("--workers", type=int, default=1, help="max_workers de ChessClient")
+    parser.add_argument("--repeat", type=int, default=3, help="Corridas por escenario (se toma la mejor)")
+    parser.add_argument("--raw", action="store_true", help="Medir también raw=True (sin validar)")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--json", help="Guardar los resultados en este archivo")
+    args = parser.parse_args()
+
+    # Los logs por lote distorsionan la medición
+    logging.disable(logging.INFO)
+
+    print(f"Generando payloads ({args.lotes} lotes x {args.records} registros)...")
+    with FakeChessServer(lotes=args.lotes, records_per_lote=args.records, price_items=args.price_items,
+                         latency=args.latency) as server:
+        results = []
+        for name in args.scenarios:
+            for raw in ([False, True] if args.raw else [False]):
+                results.append(run_scenario(server, name, workers=args.workers, raw=raw, repeat=args.repeat))
+        print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
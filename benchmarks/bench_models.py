@@ -0,0 +1,179 @@
+"""
+Micro-benchmarks de validación de los modelos grandes: Sale, Cliente y Articulo.
+
+Para cada modelo mide, sobre payloads sintéticos generados desde su schema:
+
+- parse_list: validación en bloque (lo que usa _parse_list)
+- parse_item: validación ítem por ítem (el camino de fallback de parse_list)
+- model_dump: serialización de los modelos validados
+- flatten: las funciones _flatten_* de live_test
+- lazy_flatten: las mismas funciones sobre registros lazy (parse_lazy), que
+  solo validan los campos que el flatten lee
+- projected_parse: parse_list con fields=[...] (los primeros PROJECTED_FIELDS
+  campos del modelo), como get_sales(fields=...)
+- to_frame (solo sale): frames.sales_to_frame sobre los dicts raw, la misma
+  tabla que flatten + pd.DataFrame sin validar con Sale
+
+Reporta ítems/segundo (mejor de N corridas) y el pico de memoria asignada
+por ítem (tracemalloc). Con --baseline compara contra una corrida guardada
+y termina con código 1 si algún caso empeora más que --threshold.
+
+Uso:
+    python -m benchmarks.bench_models --save-baseline benchmarks/baseline_models.json
+    python -m benchmarks.bench_models --baseline benchmarks/baseline_models.json --threshold 0.2
+"""
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks import payloads
+from chesserp.frames import sales_to_frame
+from chesserp.lazy import parse_lazy
+from chesserp.models.clients import Cliente
+from chesserp.models.inventory import Articulo
+from chesserp.models.sales import Sale
+from chesserp.parsing import parse_list, project_records, projection
+
+MODELS = {
+    "sale": (Sale, payloads.sale_records, "_flatten_sales"),
+    "cliente": (Cliente, lambda count: payloads.make_records(Cliente, count), "_flatten_clients"),
+    "articulo": (Articulo, lambda count: payloads.make_records(Articulo, count), "_flatten_articles"),
+}
+
+# Campos que conserva el caso projected_parse
+PROJECTED_FIELDS = 8
+
+
+def _flatteners() -> Any:
+    """Instancia de live_test.Testing sin cliente: las funciones _flatten_* no lo usan."""
+    from live_test import Testing
+    return object.__new__(Testing)
+
+
+def build_cases(count: int, models: List[str]) -> Dict[str, Tuple[Callable[[], Any], int]]:
+    """Casos {"modelo.etapa": (función, ítems procesados)} con los datos ya generados."""
+    testing = _flatteners()
+    cases = {}
+    for name in models:
+        model_class, generate, flatten_name = MODELS[name]
+        records = generate(count)
+        parsed = parse_list(records, model_class)
+        flatten = getattr(testing, flatten_name)
+        cases[f"{name}.parse_list"] = (lambda r=records, m=model_class: parse_list(r, m), count)
+        cases[f"{name}.parse_item"] = (lambda r=records, m=model_class: parse_list(r, m, bulk=False), count)
+        cases[f"{name}.model_dump"] = (lambda p=parsed: [item.model_dump() for item in p], count)
+        cases[f"{name}.flatten"] = (lambda p=parsed, f=flatten: f(p), count)
+        cases[f"{name}.lazy_flatten"] = (lambda r=records, m=model_class, f=flatten: f(parse_lazy(r, m)), count)
+        projected, aliases = projection(model_class, list(model_class.model_fields)[:PROJECTED_FIELDS])
+        cases[f"{name}.projected_parse"] = (
+            lambda r=records, m=projected, a=aliases: parse_list(project_records(r, a), m), count)
+        if name == "sale":
+            cases["sale.to_frame"] = (lambda r=records: sales_to_frame(r), count)
+    return cases
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int = 5) -> Dict[str, float]:
+    """Mejor tiempo de repeat corridas, y el pico de memoria de una corrida con tracemalloc."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "items_per_sec": items / best if best else 0.0,
+        "seconds": best,
+        "peak_bytes_per_item": peak / items if items else 0.0,
+    }
+
+
+def run_benchmarks(count: int = 2000, repeat: int = 5, models: List[str] = None) -> Dict[str, Dict[str, float]]:
+    cases = build_cases(count, models or list(MODELS))
+    return {name: measure(func, items, repeat) for name, (func, items) in cases.items()}
+
+
+def compare(results: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            threshold: float = 0.2) -> List[str]:
+    """
+    Compara contra un baseline y retorna la descripción de cada regresión:
+    ítems/segundo por debajo de baseline * (1 - threshold) o memoria por
+    ítem por encima de baseline * (1 + threshold). Los casos que no están
+    en el baseline se ignoran.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["items_per_sec"] < previous["items_per_sec"] * (1 - threshold):
+            regressions.append(f"{name}: {current['items_per_sec']:.0f} ítems/s "
+                               f"(baseline {previous['items_per_sec']:.0f})")
+        if current["peak_bytes_per_item"] > previous["peak_bytes_per_item"] * (1 + threshold):
+            regressions.append(f"{name}: {current['peak_bytes_per_item']:.0f} bytes/ítem "
+                               f"(baseline {previous['peak_bytes_per_item']:.0f})")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]] = None) -> None:
+    header = f"{'caso':<22}{'ítems/s':>12}{'ms':>10}{'bytes/ítem':>12}{'vs baseline':>13}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        delta = ""
+        if baseline and name in baseline and baseline[name]["items_per_sec"]:
+            delta = f"{r['items_per_sec'] / baseline[name]['items_per_sec'] - 1:+.1%}"
+        print(f"{name:<22}{r['items_per_sec']:>12.0f}{r['seconds'] * 1000:>10.1f}"
+              f"{r['peak_bytes_per_item']:>12.0f}{delta:>13}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de validación de modelos")
+    parser.add_argument("--count", type=int, default=2000, help="Registros por caso")
+    parser.add_argument("--repeat", type=int, default=5, help="Corridas por caso (se toma la mejor)")
+    parser.add_argument("--models", nargs="+", choices=sorted(MODELS), default=list(MODELS))
+    parser.add_argument("--baseline", help="JSON de una corrida anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Regresión tolerada (0.2 = 20%%)")
+    parser.add_argument("--save-baseline", help="Guardar los resultados como baseline en este archivo")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = run_benchmarks(args.count, args.repeat, args.models)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"config": {"count": args.count, "repeat": args.repeat}, "results": results}, f, indent=2)
+        print(f"Baseline guardado en {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegresiones (> {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nSin regresiones (umbral {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Servidor HTTP local que imita a ChessERP para benchmarks offline.
+
+Sirve la API oficial (auth/login, ventas/, articulos/, clientes/) con el
+string de lotes real y la API web (login Spring Security y precios/), con
+latencia, registros por lote y cantidad de lotes configurables.
+
+Uso:
+    from benchmarks.fake_server import FakeChessServer
+
+    with FakeChessServer(lotes=20, records_per_lote=500, latency=0.05) as server:
+        client = ChessClient(api_url=server.url, username="bench", password="bench")
+        ventas = client.get_sales("2025-01-01", "2025-01-31")
+
+    python -m benchmarks.fake_server --port 8765 --lotes 20   # standalone
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks import payloads
+
+API_PATH = "/web/api/chess/v1/"
+WEB_API_PATH = "/web/api/"
+LOGIN_PATH = API_PATH + "auth/login"
+WEB_LOGIN_PATH = "/static/auth/j_spring_security_check"
+
+SESSION_ID = "JSESSIONID=bench-session"
+WEB_SESSION_ID = "bench-web-session"
+
+
+class FakeChessServer:
+    """
+    ThreadingHTTPServer en un hilo de fondo. Los cuerpos de cada lote se
+    serializan una sola vez al arrancar: el servidor casi no consume CPU y
+    el benchmark mide al cliente.
+    """
+
+    def __init__(self,
+                 lotes: int = 10,
+                 records_per_lote: int = 500,
+                 price_items: int = 5000,
+                 latency: float = 0.0,
+                 host: str = "127.0.0.1",
+                 port: int = 0):
+        """
+        Args:
+            lotes: Lotes (nroLote) de cada endpoint paginado
+            records_per_lote: Registros por lote
+            price_items: Artículos de la lista de precios
+            latency: Segundos de espera antes de responder cada request
+            host: Interfaz de escucha
+            port: Puerto (0 = uno libre)
+        """
+        self.lotes = lotes
+        self.records_per_lote = records_per_lote
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        self._bodies: Dict[str, Dict[int, bytes]] = {}
+        for endpoint, (list_keys, count_key, generate) in payloads.PAGINATED.items():
+            self._bodies[endpoint] = {}
+            for nro_lote in range(1, lotes + 1):
+                records = generate(records_per_lote, (nro_lote - 1) * records_per_lote)
+                self._bodies[endpoint][nro_lote] = json.dumps({
+                    list_keys[0]: {list_keys[1]: records},
+                    count_key: f"Numero de lote obtenido: {nro_lote}/{lotes}. "
+                               f"Cantidad de comprobantes totales: {lotes * records_per_lote}",
+                }).encode()
+        self._price_lists = json.dumps({"eListaPrecios": payloads.price_lists()}).encode()
+        self._price_items = json.dumps({"dsPrecios": {"ePrecios": payloads.price_items(price_items)}}).encode()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def records_per_endpoint(self) -> int:
+        return self.lotes * self.records_per_lote
+
+    def start(self) -> "FakeChessServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-chesserp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeChessServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def route(self, method: str, path: str, query: Dict[str, list]) -> Tuple[int, bytes, Dict[str, str]]:
+        """Retorna (status, body, headers) para un request."""
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        if method == "POST" and path == LOGIN_PATH:
+            return 200, json.dumps({"sessionId": SESSION_ID}).encode(), {}
+        if method == "POST" and path == WEB_LOGIN_PATH:
+            return 200, b"", {"Set-Cookie": f"JSESSIONID={WEB_SESSION_ID}; Path=/"}
+
+        if path.startswith(API_PATH):
+            bodies = self._bodies.get(path[len(API_PATH):])
+            if bodies is not None:
+                nro_lote = int((query.get("nroLote") or ["1"])[0])
+                body = bodies.get(nro_lote)
+                return (200, body, {}) if body is not None else (404, b'{"error": "lote inexistente"}', {})
+        elif path == WEB_API_PATH + "precios/obtenerVigenciasListas":
+            return 200, self._price_lists, {}
+        elif path == WEB_API_PATH + "precios/obtenerListaPrecios":
+            return 200, self._price_items, {}
+        return 404, b'{"error": "not found"}', {}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, como el servidor real
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                parsed = urlparse(self.path)
+                status, body, headers = server.route(method, parsed.path, parse_qs(parsed.query))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor ChessERP falso para benchmarks")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--lotes", type=int, default=10)
+    parser.add_argument("--records", type=int, default=500, help="Registros por lote")
+    parser.add_argument("--price-items", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos por request")
+    args = parser.parse_args()
+
+    server = FakeChessServer(lotes=args.lotes, records_per_lote=args.records, price_items=args.price_items,
+                             latency=args.latency, port=args.port)
+    print(f"Servidor falso en {server.url} (Ctrl+C para salir)")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
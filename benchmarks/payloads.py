@@ -0,0 +1,100 @@
+"""
+Payloads sintéticos con la forma real de las respuestas de ChessERP.
+
+Los registros se generan a partir de los modelos Pydantic: cada campo usa
+su alias y un valor del tipo anotado, así que validan contra el modelo y
+tienen la misma cantidad de claves que la API real.
+"""
+import sys
+import typing
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel
+
+from chesserp.frames import HEADER_COLUMNS
+from chesserp.models.clients import Cliente
+from chesserp.models.inventory import Articulo
+from chesserp.models.pricing import PrecioArticulo
+from chesserp.models.sales import Sale
+
+# Elementos de cada lista anidada (ej: eAgrupaciones de un artículo)
+NESTED_ITEMS = 3
+
+
+def _value(annotation: Any, name: str, i: int, module: str) -> Any:
+    origin = typing.get_origin(annotation)
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if origin is typing.Union:
+        return _value(args[0], name, i, module)
+    if origin in (list, List):
+        item = args[0] if args else str
+        if isinstance(item, typing.ForwardRef):
+            # Ej: List["RelacionEnvase"] en AgrupacionArticulo
+            item = getattr(sys.modules[module], item.__forward_arg__)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return [make_record(item, i * NESTED_ITEMS + n) for n in range(NESTED_ITEMS)]
+        return []
+    if annotation is bool:
+        return i % 2 == 0
+    if annotation is int:
+        return i
+    if annotation is float:
+        return round(i * 1.21, 2)
+    if name.lower().startswith("fec"):
+        return f"2025-01-{i % 28 + 1:02d}"
+    return f"{name.upper()} {i}"
+
+
+def make_record(model_class: Type[BaseModel], i: int) -> Dict[str, Any]:
+    """Registro raw (claves = alias de la API) que valida contra model_class."""
+    return {
+        field.alias or name: _value(field.annotation, name, i, model_class.__module__)
+        for name, field in model_class.model_fields.items()
+    }
+
+
+def make_records(model_class: Type[BaseModel], count: int, start: int = 0) -> List[Dict[str, Any]]:
+    return [make_record(model_class, start + i) for i in range(count)]
+
+
+def sale_records(count: int, start: int = 0) -> List[Dict[str, Any]]:
+    """
+    Líneas de venta: 4 líneas por comprobante, como VentasResumen detallado.
+    Los datos del comprobante (frames.HEADER_COLUMNS) se repiten en sus líneas.
+    """
+    records = make_records(Sale, count, start)
+    header_aliases = [Sale.model_fields[field].alias or field for _, field in HEADER_COLUMNS]
+    header = {}
+    for i, record in enumerate(records):
+        nro_doc, id_linea = divmod(start + i, 4)
+        if id_linea == 0 or not header:
+            header = {alias: record[alias] for alias in header_aliases}
+            header["nrodoc"] = nro_doc
+        record.update(header)
+        record["idLinea"] = id_linea + 1
+    return records
+
+
+# Endpoints paginados: (claves de la lista, clave del string de lotes, generador)
+PAGINATED = {
+    "ventas/": (("dsReporteComprobantesApi", "VentasResumen"), "cantComprobantesVentas", sale_records),
+    "articulos/": (("Articulos", "eArticulos"), "cantArticulos",
+                   lambda count, start=0: make_records(Articulo, count, start)),
+    "clientes/": (("Clientes", "eClientes"), "cantClientes",
+                  lambda count, start=0: make_records(Cliente, count, start)),
+}
+
+
+def price_items(count: int) -> List[Dict[str, Any]]:
+    return make_records(PrecioArticulo, count)
+
+
+def price_lists() -> List[Dict[str, Any]]:
+    return [{
+        "listaspre": 1,
+        "titulis": "LISTA BENCHMARK",
+        "idvigencia": 100,
+        "vigente": True,
+        "fecvigenciadesde": "2025-01-01T00:00:00.000",
+        "fecvigenciahasta": None,
+    }]
@@ -1,5 +1,6 @@
 from chesserp.client import ChessClient
+from chesserp.async_client import AsyncChessClient
 from chesserp.web_client import ChessWebClient
-from chesserp.exceptions import ChessError, AuthError, ApiError
+from chesserp.exceptions import ChessError, AuthError, ApiError, DeadlineExceeded
 
-__all__ = ["ChessClient", "ChessWebClient", "ChessError", "AuthError", "ApiError"]
+__all__ = ["ChessClient", "AsyncChessClient", "ChessWebClient", "ChessError", "AuthError", "ApiError", "DeadlineExceeded"]
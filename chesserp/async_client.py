@@ -0,0 +1,655 @@
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple, Union
+
+from dotenv import load_dotenv
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependencia opcional
+    httpx = None
+
+# Local imports
+from chesserp.client import DEFAULT_API_PATH, DEFAULT_LOGIN_PATH
+from chesserp.exceptions import AuthError, ApiError
+from chesserp.models.sales import Sale
+from chesserp.models.inventory import Articulo, StockFisico
+from chesserp.models.clients import Cliente
+from chesserp.models.orders import Pedido
+from chesserp.models.routes import RutaVenta
+from chesserp.models.staff import PersonalComercial
+from chesserp.models.marketing import JerarquiaMkt
+from chesserp.parsing import loads, parse_list, parse_lote_info
+from chesserp.session_store import BaseSessionStore, make_session_key
+from chesserp.throttle import HostLimiter, limiter_for
+from chesserp.transport import SessionIdMixin, cookie_header
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+load_dotenv()
+
+
+class AsyncChessClient(SessionIdMixin):
+    """
+    Cliente asíncrono para la API de ChessERP (misma API que ChessClient).
+
+    Usa httpx.AsyncClient: un único pool de conexiones compartido por todas
+    las corrutinas. Los lotes de los endpoints paginados se piden en
+    paralelo, acotados por un semáforo (max_concurrency).
+
+    Requiere la dependencia opcional httpx:
+        pip install chesserp-api[async]
+
+    Uso:
+        async with AsyncChessClient.from_env(prefix="EMPRESA1_") as client:
+            ventas = await client.get_sales("2025-01-01", "2025-01-31")
+
+        # Varias empresas en el mismo event loop
+        clients = [AsyncChessClient.from_env(p) for p in ("EMPRESA1_", "EMPRESA2_")]
+        resultados = await asyncio.gather(*(c.get_sales(desde, hasta) for c in clients))
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        username: str,
+        password: str,
+        api_path: str = DEFAULT_API_PATH,
+        login_path: str = DEFAULT_LOGIN_PATH,
+        timeout: int = 30,
+        name: Optional[str] = None,
+        max_concurrency: int = 5,
+        max_connections: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        session_max_age: Optional[float] = None,
+        session_store: Optional[BaseSessionStore] = None,
+    ):
+        """
+        Inicializa el cliente con credenciales directas.
+
+        Args:
+            api_url: URL base de la API (ej: "https://api.chesserp.com")
+            username: Usuario para autenticación
+            password: Contraseña para autenticación
+            api_path: Path base de la API (default: /web/api/chess/v1/)
+            login_path: Path de login (default: /web/api/chess/v1/auth/login)
+            timeout: Timeout en segundos para requests
+            name: Nombre opcional para identificar esta instancia en logs
+            max_concurrency: Lotes en vuelo simultáneamente por cliente
+            max_connections: Tamaño del pool de conexiones (default: max(10, max_concurrency))
+            rate_limit: Requests por segundo al servidor (None = sin límite)
+            max_in_flight: Requests simultáneos al servidor (None = sin límite); ambos
+                           se comparten con los clientes sync del mismo api_url
+            session_max_age: Segundos tras los cuales la sesión se renueva antes de
+                             usarla, sin esperar un 401 (None = solo ante un 401)
+            session_store: Guarda el sessionId entre ejecuciones; se comparte con
+                           ChessClient (misma clave por api_url + usuario)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncChessClient requiere httpx. Instalar con: pip install chesserp-api[async]"
+            )
+
+        self.api_url = api_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.api_path = api_path
+        self.login_path = login_path.rstrip('/')
+        self.timeout = timeout
+        self.name = name or api_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.limiter: Optional[HostLimiter] = None
+        if rate_limit or max_in_flight:
+            self.limiter = limiter_for(self.api_url, rate=rate_limit, max_in_flight=max_in_flight)
+
+        # Headers y estado de sesión
+        self.base_headers = {}
+        self.base_url = self.api_url + self.api_path
+        self.auth_url = self.api_url + self.login_path
+        self._session_id: Optional[str] = None
+        # Un único login a la vez entre corrutinas (ver _ensure_session)
+        self.session_max_age = session_max_age
+        self._session_started: Optional[float] = None
+        self._auth_lock = asyncio.Lock()
+        self.session_store = session_store
+        self._session_key = make_session_key(self.api_url, username)
+
+        pool_size = max_connections or max(10, self.max_concurrency)
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    @classmethod
+    def from_env(cls, prefix: str = "", env_file: Optional[str] = None, **kwargs) -> "AsyncChessClient":
+        """
+        Crea un cliente desde variables de entorno.
+
+        Args:
+            prefix: Prefijo para las variables (ej: "EMPRESA1_" busca
+                    EMPRESA1_API_URL, EMPRESA1_USERNAME, EMPRESA1_PASSWORD)
+            env_file: Ruta opcional a archivo .env
+            **kwargs: Parámetros adicionales del constructor (ej: max_concurrency)
+        """
+        if env_file:
+            load_dotenv(env_file)
+
+        api_url = os.getenv(f"{prefix}API_URL")
+        username = os.getenv(f"{prefix}USERNAME")
+        password = os.getenv(f"{prefix}PASSWORD")
+
+        if not all([api_url, username, password]):
+            missing = []
+            if not api_url:
+                missing.append(f"{prefix}API_URL")
+            if not username:
+                missing.append(f"{prefix}USERNAME")
+            if not password:
+                missing.append(f"{prefix}PASSWORD")
+            raise ValueError(f"Variables de entorno faltantes: {', '.join(missing)}")
+
+        return cls(
+            api_url=api_url,
+            username=username,
+            password=password,
+            name=prefix.rstrip('_') if prefix else None,
+            **kwargs
+        )
+
+    async def aclose(self) -> None:
+        """Cierra el cliente HTTP y libera las conexiones del pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncChessClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _send(self, send: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Ejecuta un request pasando por el limitador del servidor, si hay uno."""
+        if self.limiter is None:
+            return await send(*args, **kwargs)
+        async with self.limiter.aslot():
+            return await send(*args, **kwargs)
+
+    async def login(self) -> str:
+        """
+        Realiza el login y almacena el sessionId.
+        """
+        credentials = {
+            "usuario": self.username,
+            "password": self.password
+        }
+        logger.info(f"[{self.name}] Authenticating as {self.username} (async)...")
+
+        try:
+            response = await self._send(self._http.post, self.auth_url, json=credentials)
+
+            if response.status_code != 200:
+                raise AuthError(f"Login failed: {response.status_code} - {response.text}")
+
+            session_id = response.json().get('sessionId')
+            if not session_id:
+                raise AuthError("No sessionId returned from API")
+            self._set_session(session_id)
+            if self.session_store is not None:
+                self.session_store.set(self._session_key, session_id)
+            logger.info("Authentication successful.")
+            return self._session_id
+
+        except httpx.HTTPError as e:
+            raise AuthError(f"Connection error during login: {str(e)}")
+
+    async def _ensure_session(self, stale_session_id: Optional[str] = None) -> str:
+        """
+        Retorna un sessionId utilizable, haciendo login si hace falta.
+        Single-flight: las corrutinas que necesitan sesión a la vez esperan
+        un único login (ver ChessClient._ensure_session).
+        """
+        if self._session_usable(self._session_id, stale_session_id):
+            return self._session_id
+        async with self._auth_lock:
+            session_id = self._session_id
+            if self._session_usable(session_id, stale_session_id):
+                return session_id
+            self._discard_session(stale_session_id)
+            return self._restore_session(stale_session_id) or await self.login()
+
+    async def _get(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
+        """
+        Realiza petición GET manejando sesión y errores.
+        """
+        session_id = await self._ensure_session()
+
+        if endpoint.startswith("/"):
+            endpoint = endpoint[1:]
+        url = self.base_url + endpoint
+
+        try:
+            response = await self._send(self._http.get, url, params=params, headers=cookie_header(session_id))
+            if response.status_code == 401:
+                session_id = await self._ensure_session(stale_session_id=session_id)
+                response = await self._send(self._http.get, url, params=params, headers=cookie_header(session_id))
+
+            if response.status_code != 200:
+                raise ApiError(response.status_code, f"request to {endpoint} failed", response.text)
+
+            try:
+                return loads(response.content)
+            except ValueError as e:
+                raise ApiError(response.status_code, f"Invalid JSON from {endpoint}: {e}", response.text[:200])
+        except httpx.HTTPError as e:
+            raise ApiError(500, f"Connection error: {str(e)}")
+
+    def _parse_list(self, data: Any, model_class: Any) -> List[Any]:
+        """
+        Parsea una lista de dicts a modelos Pydantic (ver parsing.parse_list).
+        Valida el lote completo de una vez; si un elemento falla, lo loguea
+        y continúa con el resto.
+        """
+        return parse_list(data, model_class)
+
+    async def _fetch_all_lotes(self,
+                               fetch_lote: Callable[[int], Awaitable[Any]],
+                               list_keys: Tuple[str, str],
+                               count_key: str,
+                               model_class: Any,
+                               raw: bool) -> List[Any]:
+        """
+        Recorre todos los lotes (nroLote) de un endpoint paginado.
+
+        El lote 1 se pide primero para conocer el total de lotes; los
+        restantes se piden con asyncio.gather bajo un semáforo de
+        max_concurrency. El resultado respeta el orden de los lotes.
+        """
+        def _extract(response_data: Any) -> List[Any]:
+            if not isinstance(response_data, dict):
+                return []
+            list_ = response_data.get(list_keys[0], {}).get(list_keys[1])
+            if list_ is None:
+                return []
+            return list_ if raw else self._parse_list(list_, model_class)
+
+        response_data = await fetch_lote(1)
+        if not isinstance(response_data, dict):
+            return []
+
+        cant_str = response_data.get(count_key, "")
+        lote_info = parse_lote_info(cant_str)
+        if lote_info is None:
+            logger.warning(f"No se pudo parsear total de lotes de: {cant_str}. Asumiendo 1 lote.")
+            return _extract(response_data)
+
+        lote_actual, total_lotes = lote_info
+        logger.info(f"[{self.name}] Total de lotes a procesar: {total_lotes}")
+        items = _extract(response_data)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(nro_lote: int) -> Any:
+            async with semaphore:
+                return await fetch_lote(nro_lote)
+
+        # gather() conserva el orden de los lotes
+        responses = await asyncio.gather(*(_bounded(i) for i in range(lote_actual + 1, total_lotes + 1)))
+        for response_data in responses:
+            items.extend(_extract(response_data))
+        return items
+
+    # --- Ventas ---
+    async def get_sales_raw(self,
+                            fecha_desde: str,
+                            fecha_hasta: str,
+                            empresas: str = "",
+                            detallado: bool = False,
+                            nro_lote: int = 1) -> Dict[str, Any]:
+        """
+        Obtiene un lote de comprobantes de ventas SIN validación (raw JSON).
+        """
+        params = {
+            "fechaDesde": fecha_desde,
+            "fechaHasta": fecha_hasta,
+            "empresas": empresas,
+            "detallado": str(detallado).lower(),
+            "nroLote": nro_lote
+        }
+        return await self._get("ventas/", params)
+
+    async def get_sales(self,
+                        fecha_desde: str,
+                        fecha_hasta: str,
+                        empresas: str = "",
+                        detallado: bool = False,
+                        raw: bool = False) -> Union[List[Sale], List[Dict[str, Any]]]:
+        """
+        Obtiene comprobantes de ventas (todos los lotes).
+
+        Args:
+            fecha_desde: Fecha inicio (formato API)
+            fecha_hasta: Fecha fin (formato API)
+            empresas: Filtro de empresas
+            detallado: Nivel de detalle
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Sale]
+        """
+        sales_data = await self._fetch_all_lotes(
+            lambda nro_lote: self.get_sales_raw(fecha_desde, fecha_hasta, empresas, detallado, nro_lote=nro_lote),
+            ("dsReporteComprobantesApi", "VentasResumen"),
+            "cantComprobantesVentas",
+            Sale,
+            raw
+        )
+        logger.info(f"[{self.name}] Total de ventas obtenidas: {len(sales_data)}")
+        return sales_data
+
+    # --- Inventario ---
+    async def get_articles_raw(self,
+                               articulo: int = 0,
+                               nro_lote: int = 1,
+                               anulado: bool = False) -> Dict[str, Any]:
+        """
+        Obtiene un lote del catálogo de artículos SIN validación (raw JSON).
+        """
+        params = {
+            "articulo": articulo if articulo > 0 else "",
+            "nroLote": nro_lote,
+            "anulado": str(anulado).lower()
+        }
+        return await self._get("articulos/", params)
+
+    async def get_articles(self,
+                           articulo: int = 0,
+                           anulado: bool = False,
+                           raw: bool = False) -> Union[List[Articulo], List[Dict[str, Any]]]:
+        """
+        Obtiene catálogo de artículos (todos los lotes).
+
+        Args:
+            articulo: ID específico (0 para todos)
+            anulado: Incluir anulados
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Articulo]
+        """
+        articles_data = await self._fetch_all_lotes(
+            lambda nro_lote: self.get_articles_raw(articulo, nro_lote=nro_lote, anulado=anulado),
+            ("Articulos", "eArticulos"),
+            "cantArticulos",
+            Articulo,
+            raw
+        )
+        logger.info(f"[{self.name}] Total de artículos obtenidos: {len(articles_data)}")
+        return articles_data
+
+    async def get_stock_raw(self,
+                            id_deposito: int,
+                            frescura: bool = False,
+                            fecha: str = "") -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Obtiene stock físico SIN validación (raw JSON).
+        """
+        params = {
+            "idDeposito": id_deposito,
+            "fechastock": fecha
+        }
+        return await self._get("stock/", params)
+
+    async def get_stock(self,
+                        id_deposito: int,
+                        frescura: bool = False,
+                        fecha: str = "",
+                        raw: bool = False) -> Union[List[StockFisico], List[Dict[str, Any]]]:
+        """
+        Obtiene stock físico.
+
+        Args:
+            id_deposito: Obligatorio
+            frescura: Apertura por frescura
+            fecha: fechastock(Opcional, cálculo histórico)
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[StockFisico]
+        """
+        raw_data = await self.get_stock_raw(id_deposito, frescura, fecha=fecha)
+        raw_data = raw_data.get('dsStockFisicoApi').get("dsStock")
+        if raw:
+            return raw_data
+        return self._parse_list(raw_data, StockFisico)
+
+    # --- Clientes ---
+    async def get_customers_raw(self,
+                                anulado: bool = False,
+                                nro_lote: int = 1) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Obtiene un lote de clientes SIN validación (raw JSON).
+        """
+        params = {
+            "cliente": 0,
+            "anulado": str(anulado).lower(),
+            "nroLote": nro_lote
+        }
+        return await self._get("clientes/", params)
+
+    async def get_customers(self,
+                            anulado: bool = False,
+                            nro_lote: int = 0,
+                            raw: bool = False) -> Union[List[Cliente], List[Dict[str, Any]]]:
+        """
+        Busca clientes (todos los lotes o uno específico).
+
+        Args:
+            anulado: Incluir anulados
+            nro_lote: Lote específico (0 para todos)
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Cliente]
+        """
+        if nro_lote == 0:
+            customers_data = await self._fetch_all_lotes(
+                lambda i: self.get_customers_raw(anulado=anulado, nro_lote=i),
+                ("Clientes", "eClientes"),
+                "cantClientes",
+                Cliente,
+                raw
+            )
+            logger.info(f"[{self.name}] Total de clientes obtenidas: {len(customers_data)}")
+            return customers_data
+
+        response_data = await self.get_customers_raw(anulado=anulado, nro_lote=nro_lote)
+        list_ = response_data.get("Clientes", {}).get("eClientes") or []
+        if raw:
+            return list_
+        return self._parse_list(list_, Cliente)
+
+    # --- Pedidos ---
+    async def get_orders_raw(self,
+                             fecha_entrega: str = "",
+                             fecha_pedido: str = "",
+                             facturado: bool = False) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Busca pedidos SIN validación (raw JSON).
+        """
+        params = {
+            "fechaEntrega": fecha_entrega,
+            "fechaPedido": fecha_pedido,
+            "facturado": str(facturado).lower()
+        }
+        return await self._get("pedidos/", params)
+
+    async def get_orders(self,
+                         fecha_entrega: str = "",
+                         fecha_pedido: str = "",
+                         facturado: bool = False,
+                         raw: bool = False) -> Union[List[Pedido], List[Dict[str, Any]]]:
+        """
+        Busca pedidos.
+
+        Args:
+            fecha_entrega: Fecha de entrega
+            fecha_pedido: Fecha de alta
+            facturado: Filtrar facturados
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Pedido]
+        """
+        raw_data = await self.get_orders_raw(fecha_entrega, fecha_pedido, facturado)
+        pedidos_list = raw_data.get('pedidos', []) if isinstance(raw_data, dict) else raw_data
+        if raw:
+            return pedidos_list
+        return self._parse_list(pedidos_list, Pedido)
+
+    # --- Personal ---
+    async def get_staff_raw(self,
+                            sucursal: int = 0,
+                            personal: int = 0) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Busca personal comercial SIN validación (raw JSON).
+        """
+        params = {
+            "sucursal": sucursal if sucursal > 0 else "",
+            "personal": personal if personal > 0 else ""
+        }
+        return await self._get("personalComercial/", params)
+
+    async def get_staff(self,
+                        sucursal: int = 0,
+                        personal: int = 0,
+                        raw: bool = False) -> Union[List[PersonalComercial], List[Dict[str, Any]]]:
+        """
+        Busca personal comercial.
+
+        Args:
+            sucursal: ID de sucursal (0 para todas)
+            personal: ID de personal (0 para todos)
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[PersonalComercial]
+        """
+        raw_data = await self.get_staff_raw(sucursal, personal)
+        staff_list = raw_data.get('PersonalComercial', {}).get('ePersCom', []) if isinstance(raw_data, dict) else raw_data
+        if raw:
+            return staff_list
+        return self._parse_list(staff_list, PersonalComercial)
+
+    # --- Rutas ---
+    async def get_routes_raw(self,
+                             sucursal: int = 1,
+                             fuerza_venta: int = 1,
+                             modo_atencion: int = 0,
+                             anulado: bool = False):
+        """
+        Busca rutas de venta SIN validación (raw JSON).
+        """
+        params = {
+            "sucursal": sucursal,
+            "fuerzaventa": fuerza_venta,
+            "anulada": str(anulado).lower()
+        }
+        return await self._get("rutasVenta/", params)
+
+    async def get_routes(self,
+                         sucursal: int = 1,
+                         fuerza_venta: int = 1,
+                         modo_atencion: str = "PRE",
+                         anulado: bool = False,
+                         raw: bool = False) -> Union[List[RutaVenta], List[Dict[str, Any]]]:
+        """
+        Busca rutas de venta.
+
+        Args:
+            sucursal: ID de sucursal
+            fuerza_venta: ID de fuerza de venta
+            modo_atencion: Modo de atención
+            anulado: Incluir anuladas
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[RutaVenta]
+        """
+        raw_data = await self.get_routes_raw(sucursal=sucursal,
+                                             fuerza_venta=fuerza_venta,
+                                             anulado=anulado)
+        routes_list = raw_data.get('RutasVenta', {}).get('eRutasVenta', [])
+        if raw:
+            return routes_list
+        return self._parse_list(routes_list, RutaVenta)
+
+    # --- Marketing ---
+    async def get_marketing_raw(self,
+                                cod_scan: int = 0) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Busca jerarquía de marketing SIN validación (raw JSON).
+        """
+        params = {
+            "CodScan": cod_scan if cod_scan > 0 else ""
+        }
+        return await self._get("jerarquiaMkt/", params)
+
+    async def get_marketing(self,
+                            cod_scan: int = 0,
+                            raw: bool = False) -> Union[List[JerarquiaMkt], List[Dict[str, Any]]]:
+        """
+        Busca jerarquía de marketing.
+
+        Args:
+            cod_scan: Código de escaneo (opcional, 0 para todos)
+            raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[JerarquiaMkt]
+        """
+        raw_data = await self.get_marketing_raw(cod_scan)
+        segmentos_list = raw_data.get('SubcanalesMkt', {}).get('SegmentosMkt', [])
+        if raw:
+            return segmentos_list
+        return self._parse_list(segmentos_list, JerarquiaMkt)
+
+    # --- Reportes ---
+    async def export_sales_report(self,
+                                  fecha_desde: str,
+                                  fecha_hasta: str,
+                                  idsucur: str = "1",
+                                  empresas: str = "1",
+                                  tiposdoc: str = "DVVTA,FCVTA",
+                                  formasagruart: str = "MARCA,GENERICO,,,,,,,,") -> bytes:
+        """
+        Solicita y descarga el reporte de ventas (Excel/CSV).
+        Mismo flujo que ChessClient.export_sales_report.
+        """
+        session_id = await self._ensure_session()
+
+        url = self.base_url + "reporteComprobantesVta/exportarExcel"
+        payload = {
+            "dsFiltrosRepCbtsVta": {
+                "eFiltros": [
+                    {
+                        "letra": None,
+                        "serie": None,
+                        "numero": None,
+                        "numeroHasta": None,
+                        "fechadesde": fecha_desde,
+                        "fechahasta": fecha_hasta,
+                        "idsucur": idsucur,
+                        "timbrado": "",
+                        "empresas": empresas,
+                        "tiposdoc": tiposdoc,
+                        "formasagruart": formasagruart
+                    }
+                ]
+            },
+            "pcTipo": "D"
+        }
+
+        logger.info(f"[{self.name}] Requesting sales report export: {fecha_desde} to {fecha_hasta}...")
+
+        try:
+            response = await self._send(self._http.post, url, json=payload, headers=cookie_header(session_id))
+            if response.status_code == 401:
+                session_id = await self._ensure_session(stale_session_id=session_id)
+                response = await self._send(self._http.post, url, json=payload, headers=cookie_header(session_id))
+
+            if response.status_code != 200:
+                raise ApiError(response.status_code, "Failed to request report export", response.text)
+
+            pc_archivo = response.json().get("pcArchivo")
+            if not pc_archivo:
+                raise ApiError(500, "API response missing 'pcArchivo' field")
+
+            file_url = f"{self.api_url}/{pc_archivo.lstrip('/')}"
+            logger.info(f"[{self.name}] Downloading report from {file_url}...")
+
+            file_response = await self._send(self._http.get, file_url, headers=cookie_header(session_id))
+            if file_response.status_code != 200:
+                raise ApiError(file_response.status_code, "Failed to download report file", file_response.text)
+
+            return file_response.content
+
+        except httpx.HTTPError as e:
+            raise ApiError(500, f"Connection error during report export: {str(e)}")
@@ -0,0 +1,191 @@
+"""
+Cache local de respuestas GET de ChessClient.
+
+Los backends guardan el body crudo (bytes) de cada respuesta, asociado a
+una clave derivada del servidor, el usuario, el endpoint y sus parámetros
+(dos clientes de distintas empresas pueden compartir el mismo backend). Cada entrada vence según
+el TTL configurado para su endpoint y, al superar el tamaño máximo, se
+descartan las entradas usadas menos recientemente (LRU).
+
+Uso:
+    from chesserp.cache import MemoryCache, SQLiteCache
+
+    client = ChessClient.from_env(prefix="EMPRESA1_", cache=MemoryCache(max_entries=512))
+    client = ChessClient.from_env(prefix="EMPRESA1_", cache=SQLiteCache("data/chess_cache.db"))
+
+    # Forzar lectura desde la API (y refrescar la entrada)
+    articulos = client.get_articles(refresh=True)
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+# TTL por defecto (segundos) de los endpoints de datos maestros.
+# Los endpoints que no figuran aquí no se cachean.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "articulos/": 6 * 3600,
+    "clientes/": 6 * 3600,
+    "personalComercial/": 24 * 3600,
+    "rutasVenta/": 24 * 3600,
+    "jerarquiaMkt/": 24 * 3600,
+}
+
+
+def make_cache_key(api_url: str, username: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Clave estable a partir del servidor, el usuario, el endpoint y sus
+    parámetros (orden independiente), como session_store.make_session_key.
+    """
+    query = json.dumps(params or {}, sort_keys=True, default=str)
+    return f"{api_url.rstrip('/')}|{username}|{endpoint}?{query}"
+
+
+class BaseCache:
+    """
+    Interfaz de los backends de cache.
+    Las implementaciones deben ser seguras para usar desde varios hilos.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Retorna el valor guardado o None si no existe o está vencido."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Guarda value durante ttl segundos."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    Cache LRU en memoria, acotada por cantidad de entradas y (opcional) bytes.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                self._pop(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (time.time() + ttl, value)
+            self._size += len(value)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _pop(self, key: str) -> None:
+        _, value = self._data.pop(key)
+        self._size -= len(value)
+
+    def _evict(self) -> None:
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            key, (_, value) = self._data.popitem(last=False)
+            self._size -= len(value)
+            logger.debug(f"Cache LRU: descartada {key}")
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache persistente en un archivo SQLite (sobrevive entre ejecuciones).
+    Al superar max_entries descarta las entradas usadas menos recientemente.
+    """
+
+    def __init__(self, path: str = "chesserp_cache.db", max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), now + ttl, now),
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
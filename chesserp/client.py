@@ -1,13 +1,22 @@
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-import re
 import os
-from typing import List, Optional, Dict, Any, Union
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Dict, Any, Sequence, Tuple, Union
 from urllib.parse import urljoin
 from dotenv import load_dotenv
 
 # Local imports
-from chesserp.exceptions import AuthError, ApiError, ChessError
+from chesserp.exceptions import AuthError, ApiError, ChessError, DeadlineExceeded
+from chesserp.cache import BaseCache, DEFAULT_CACHE_TTLS, make_cache_key
+from chesserp.compact import CompactRecord, to_compact
+from chesserp.lazy import LazyRecord, parse_lazy
+from chesserp.metrics import BaseMetrics
 from chesserp.models.sales import Sale
 from chesserp.models.inventory import Articulo, StockFisico
 from chesserp.models.clients import Cliente
@@ -15,6 +24,12 @@ from chesserp.models.orders import Pedido
 from chesserp.models.routes import RutaVenta
 from chesserp.models.staff import PersonalComercial
 from chesserp.models.marketing import JerarquiaMkt
+from chesserp.parsing import loads, parse_doc_count, parse_list, parse_lote_info, project_records, projection
+from chesserp.ranges import WorkUnit, halve_range, split_date_range
+from chesserp.retry import RetryPolicy
+from chesserp.session_store import BaseSessionStore, make_session_key
+from chesserp.throttle import HostLimiter, limiter_for
+from chesserp.transport import RequestSender, SessionIdMixin, cookie_header
 from chesserp.logger import get_logger
 
 # Configure logger
@@ -27,7 +42,7 @@ DEFAULT_API_PATH = "/web/api/chess/v1/"
 DEFAULT_LOGIN_PATH = "/web/api/chess/v1/auth/login"
 
 
-class ChessClient:
+class ChessClient(RequestSender, SessionIdMixin):
     """
     Cliente principal para la API de ChessERP.
     Maneja autenticación y llamadas a endpoints.
@@ -53,7 +68,20 @@ class ChessClient:
         api_path: str = DEFAULT_API_PATH,
         login_path: str = DEFAULT_LOGIN_PATH,
         timeout: int = 30,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        max_workers: int = 1,
+        pool_connections: int = 10,
+        pool_maxsize: Optional[int] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        session_max_age: Optional[float] = None,
+        session_store: Optional[BaseSessionStore] = None,
+        metrics: Optional[BaseMetrics] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None
     ):
         """
         Inicializa el cliente con credenciales directas.
@@ -64,8 +92,30 @@ class ChessClient:
             password: Contraseña para autenticación
             api_path: Path base de la API (default: /web/api/chess/v1/)
             login_path: Path de login (default: /web/api/chess/v1/auth/login)
-            timeout: Timeout en segundos para requests
+            timeout: Timeout en segundos para requests (conexión y lectura, salvo que
+                     se indiquen connect_timeout / read_timeout)
             name: Nombre opcional para identificar esta instancia en logs
+            max_workers: Cantidad de lotes que se piden en paralelo en los
+                         endpoints paginados (1 = secuencial)
+            pool_connections: Cantidad de hosts distintos con pool de conexiones propio
+            pool_maxsize: Conexiones keep-alive por host (default: max(10, max_workers))
+            cache: Backend de cache para los GET (MemoryCache, SQLiteCache). None = sin cache
+            cache_ttls: TTL en segundos por endpoint (ej: {"articulos/": 3600}); se combina
+                        con DEFAULT_CACHE_TTLS. Solo se cachean endpoints con TTL > 0
+            retry: Política de reintentos para fallas transitorias (default: RetryPolicy();
+                   retry.NO_RETRY para desactivarlos)
+            rate_limit: Requests por segundo al servidor (None = sin límite)
+            max_in_flight: Requests simultáneos al servidor (None = sin límite).
+                           rate_limit y max_in_flight se comparten entre todos los
+                           clientes del mismo api_url (ver throttle.limiter_for)
+            session_max_age: Segundos tras los cuales la sesión se renueva antes de
+                             usarla, sin esperar un 401 (None = solo ante un 401)
+            session_store: Guarda el sessionId entre ejecuciones (FileSessionStore,
+                           SQLiteSessionStore) y lo reutiliza hasta que la API lo rechace
+            metrics: Recibe latencia, bytes, tiempos de decodificación y parseo,
+                     lotes, reintentos y re-logins (ver chesserp.metrics)
+            connect_timeout: Segundos para establecer la conexión (default: timeout)
+            read_timeout: Segundos sin recibir datos antes de abortar (default: timeout)
         """
         self.api_url = api_url.rstrip('/')
         self.username = username
@@ -73,7 +123,20 @@ class ChessClient:
         self.api_path = api_path
         self.login_path = login_path.rstrip('/')
         self.timeout = timeout
+        # (conexión, lectura) para requests; cada request de la sesión lo recibe
+        self.timeouts: Tuple[float, float] = (
+            connect_timeout if connect_timeout is not None else timeout,
+            read_timeout if read_timeout is not None else timeout,
+        )
         self.name = name or api_url
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self.retry = retry or RetryPolicy()
+        self.metrics = metrics
+        self.limiter: Optional[HostLimiter] = None
+        if rate_limit or max_in_flight:
+            self.limiter = limiter_for(self.api_url, rate=rate_limit, max_in_flight=max_in_flight)
 
         # Headers y estado de sesión
         self.base_headers = {}
@@ -81,9 +144,38 @@ class ChessClient:
         self.auth_url = self.api_url + self.login_path
         self._session_id: Optional[str] = None
         self.cookies = None
+        # Un único login a la vez: los hilos que reciben un 401 esperan y
+        # reutilizan la sesión nueva (ver _ensure_session)
+        self.session_max_age = session_max_age
+        self._session_started: Optional[float] = None
+        self._auth_lock = threading.Lock()
+        # Vencimiento (monotonic) del deadline de la llamada paginada en curso, por hilo
+        self._deadline = threading.local()
+        self.session_store = session_store
+        self._session_key = make_session_key(self.api_url, username)
+
+        # Sesión HTTP con pool de conexiones keep-alive, compartida entre hilos.
+        # La cookie de sesión viaja en el header Cookie de cada request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize or max(10, self.max_workers),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y libera las conexiones del pool."""
+        self._session.close()
+
+    def __enter__(self) -> "ChessClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @classmethod
-    def from_env(cls, prefix: str = "", env_file: Optional[str] = None) -> "ChessClient":
+    def from_env(cls, prefix: str = "", env_file: Optional[str] = None, **kwargs) -> "ChessClient":
         """
         Crea un cliente desde variables de entorno.
 
@@ -91,6 +183,7 @@ class ChessClient:
             prefix: Prefijo para las variables (ej: "CHESS_PROD_" busca
                     CHESS_PROD_API_URL, CHESS_PROD_USERNAME, CHESS_PROD_PASSWORD)
             env_file: Ruta opcional a archivo .env
+            **kwargs: Parámetros adicionales del constructor (ej: max_workers)
 
         Returns:
             ChessClient configurado
@@ -124,7 +217,8 @@ class ChessClient:
             api_url=api_url,
             username=username,
             password=password,
-            name=prefix.rstrip('_') if prefix else None
+            name=prefix.rstrip('_') if prefix else None,
+            **kwargs
         )
 
     def login(self) -> str:
@@ -138,8 +232,10 @@ class ChessClient:
         logger.info(f"[{self.name}] Authenticating as {self.username}...")
         
         try:
-            # Usar requests.post directamente, no una sesión persistente
-            response = requests.post(self.auth_url, json=credentials)
+            response = self.retry.call(
+                lambda: self._send(self._session.post, self.auth_url, json=credentials, timeout=self.timeouts,
+                                   metric="auth/login"),
+                "login", on_retry=self._on_retry, expires=self._deadline_expires())
             
             if response.status_code != 200:
                 raise AuthError(f"Login failed: {response.status_code} - {response.text}")
@@ -151,77 +247,256 @@ class ChessClient:
 
             if not session_id:
                 raise AuthError("No sessionId returned from API")
-            self._session_id = session_id
             logger.info("Authentication successful.")
 
-            # Construimos el header para todas las request
-            self.base_headers = {
-                "Cookie": self._session_id}
+            self._set_session(session_id)
+            if self.session_store is not None:
+                self.session_store.set(self._session_key, session_id)
 
             return self._session_id
             
         except requests.RequestException as e:
             raise AuthError(f"Connection error during login: {str(e)}")
 
-    def _get(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
+    def _ensure_session(self, stale_session_id: Optional[str] = None) -> str:
+        """
+        Retorna un sessionId utilizable, haciendo login si hace falta.
+
+        Single-flight: si varios hilos necesitan sesión a la vez (primer uso,
+        sesión vencida o 401), solo uno hace login y el resto reutiliza el
+        sessionId nuevo.
+
+        Args:
+            stale_session_id: sessionId que la API rechazó con 401. Si al tomar
+                              el lock ya fue reemplazado, no se vuelve a loguear.
+        """
+        session_id = self._session_id
+        if self._session_usable(session_id, stale_session_id):
+            return session_id
+        with self._auth_lock:
+            session_id = self._session_id
+            if self._session_usable(session_id, stale_session_id):
+                return session_id
+            self._discard_session(stale_session_id)
+            return self._restore_session(stale_session_id) or self.login()
+
+    def _get(self, endpoint: str, params: Dict[str, Any] = None, refresh: bool = False) -> Any:
         """
         Realiza petición GET manejando sesión y errores.
+
+        Si el cliente tiene cache y el endpoint tiene TTL, la respuesta se
+        sirve desde la cache mientras no venza. refresh=True ignora la
+        entrada guardada y la reemplaza con la respuesta nueva.
         """
-        if not self._session_id:
-            logger.debug("Not find sessionId")
-            self.login()
-            
         # Clean endpoint
         if endpoint.startswith("/"):
             endpoint = endpoint[1:]
+
+        ttl = self.cache_ttls.get(endpoint) if self.cache is not None else None
+        cache_key = make_cache_key(self.api_url, self.username, endpoint, params) if ttl else None
+        if cache_key and not refresh:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Cache hit: {cache_key}")
+                return loads(cached)
+
+        session_id = self._ensure_session()
+
         url = self.base_url + endpoint
-        headers = self.base_headers 
-        logger.debug(f"Processing GET request",)
-        logger.debug(f"GET request: url={url}, headers={headers}")
+        logger.debug(f"GET request: url={url}")
+
+        def _send_get() -> requests.Response:
+            # Headers propios de cada request: la cookie puede cambiar entre intentos
+            return self._send(self._session.get, url, params=params, headers=cookie_header(session_id),
+                              timeout=self._request_timeouts(endpoint), metric=endpoint)
 
         try:
-            # Usar requests.get directamente
-            response = requests.get(url, params=params, headers=headers)
-            logger.debug(f"Response text: {response.text[0:10]}")
+            response = self.retry.call(_send_get, f"GET {endpoint}", on_retry=self._on_retry,
+                                       expires=self._deadline_expires())
+            if logger.isEnabledFor(logging.DEBUG):
+                # Solo los primeros bytes: response.text decodificaría el body completo
+                logger.debug(f"Response body: {response.content[:10]!r}")
             if response.status_code == 401:
-                logger.warning("Token expired (401). Retrying login...")
-                self.login() # Re-login para obtener un nuevo _session_id
-                # Reconstruir headers con la nueva cookie y reintentar la petición
-                headers["Cookie"] = self._session_id if "JSESSIONID=" in self._session_id else f"JSESSIONID={self._session_id}"
-                response = requests.get(url, params=params, headers=headers)
+                session_id = self._ensure_session(stale_session_id=session_id)
+                response = self.retry.call(_send_get, f"GET {endpoint}", on_retry=self._on_retry,
+                                       expires=self._deadline_expires())
 
             if response.status_code != 200:
                 raise ApiError(response.status_code, f"request to {endpoint} failed", response.text)
 
-            json_data = response.json()
-        #    logger.debug(f"{json_data}")
+            start = time.perf_counter()
+            try:
+                json_data = loads(response.content)
+            except ValueError as e:
+                raise ApiError(response.status_code, f"Invalid JSON from {endpoint}: {e}", response.text[:200])
+            if self.metrics is not None:
+                self.metrics.on_decode(self.name, endpoint, time.perf_counter() - start)
+            if cache_key:
+                self.cache.set(cache_key, response.content, ttl)
             if isinstance(json_data, list) and len(json_data) == 0:
-                logger.debug(f"Empty list returned. Raw response: {response.text}")
-            
+                logger.debug("Empty list returned.")
+
             return json_data
         except requests.RequestException as e:
+            if self._deadline_expired():
+                raise DeadlineExceeded(f"Deadline vencido durante GET {endpoint}: {e}")
             raise ApiError(500, f"Connection error: {str(e)}")
 
+    def _request_timeouts(self, endpoint: str) -> Tuple[float, float]:
+        """
+        Timeouts (conexión, lectura) del próximo intento. Dentro de una llamada
+        con deadline se recortan al tiempo restante, así un socket colgado no
+        retiene al hilo más allá del deadline.
+        """
+        expires = self._deadline_expires()
+        if expires is None:
+            return self.timeouts
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline vencido antes de GET {endpoint}")
+        return min(self.timeouts[0], remaining), min(self.timeouts[1], remaining)
+
+    def _deadline_expired(self) -> bool:
+        expires = self._deadline_expires()
+        return expires is not None and time.monotonic() >= expires
+
+    @staticmethod
+    def _projection(model_class: Any, fields: Optional[Sequence[str]]) -> Tuple[Any, Optional[Tuple[str, ...]]]:
+        """(modelo, aliases) para fields=[...]; sin fields, el modelo completo y sin proyección."""
+        if fields is None:
+            return model_class, None
+        return projection(model_class, fields)
+
     def _parse_list(self, data: Any, model_class: Any) -> List[Any]:
         """
-        Intenta parsear una lista de diccionarios a modelos Pydantic.
-        Si un elemento falla, lo loguea y continúa con el resto.
+        Parsea una lista de dicts a modelos Pydantic (ver parsing.parse_list).
+        Valida el lote completo de una vez; si un elemento falla, lo loguea
+        y continúa con el resto.
         """
-        if not isinstance(data, list):
-            logger.warning(f"Se esperaba una lista, se recibió: {type(data)}")
-            return []
-            
-        parsed_items = []
-        for index, item in enumerate(data):
+        if self.metrics is None:
+            return parse_list(data, model_class)
+        start = time.perf_counter()
+        parsed = parse_list(data, model_class)
+        self.metrics.on_parse(self.name, model_class.__name__, len(parsed), time.perf_counter() - start)
+        return parsed
+
+    def _iter_lotes(self,
+                    fetch_lote: Callable[[int], Any],
+                    list_keys: Tuple[str, str],
+                    count_key: str,
+                    model_class: Any,
+                    raw: bool,
+                    max_workers: Optional[int] = None,
+                    first_response: Any = None,
+                    deadline: Optional[float] = None,
+                    aliases: Optional[Tuple[str, ...]] = None) -> Iterator[List[Any]]:
+        """
+        Recorre los lotes (nroLote) de un endpoint paginado y los entrega de a uno.
+
+        El lote 1 se pide primero para conocer el total de lotes. Los restantes
+        se piden en un pool de hilos acotado por max_workers, con a lo sumo
+        max_workers lotes en vuelo: la memoria queda acotada a esa ventana
+        aunque el consumidor sea más lento que la red. Los lotes se entregan
+        siempre en orden y cada uno se parsea con _parse_list.
+
+        Args:
+            fetch_lote: Función que recibe nro_lote y retorna el JSON crudo del lote
+            list_keys: Claves para llegar a la lista (ej: ("Articulos", "eArticulos"))
+            count_key: Clave del string de lotes (ej: "cantArticulos")
+            model_class: Modelo Pydantic para parsear cada registro
+            raw: Si True, no se valida y se entregan los dicts
+            max_workers: Lotes en paralelo (None usa self.max_workers)
+            first_response: JSON del lote 1 ya descargado (ej: por un sondeo); si se pasa, no se vuelve a pedir
+            deadline: Segundos para recorrer todos los lotes, desde el primer lote pedido.
+                      Al vencer se cancelan los lotes pendientes y se lanza DeadlineExceeded
+            aliases: Si se pasa, cada registro se reduce a estas claves antes de parsearlo
+                     (ver parsing.projection)
+
+        Yields:
+            Lista de registros de cada lote
+        """
+        workers = self.max_workers if max_workers is None else max(1, max_workers)
+        expires = time.monotonic() + deadline if deadline is not None else None
+
+        def _fetch(nro_lote: int) -> Tuple[Any, float]:
+            if expires is None:
+                start = time.perf_counter()
+                return fetch_lote(nro_lote), time.perf_counter() - start
+            if time.monotonic() >= expires:
+                raise DeadlineExceeded(f"Deadline de {deadline}s vencido antes del lote {nro_lote}")
+            # _get lee el vencimiento del hilo para recortar los timeouts de cada intento
+            previous = getattr(self._deadline, "expires", None)
+            self._deadline.expires = expires if previous is None else min(previous, expires)
             try:
-                parsed_items.append(model_class(**item))
-            except Exception as e:
-                # Loguear el error específico y el ítem que falló
-                logger.error(f"Error parseando ítem #{index} en {model_class.__name__}: {e}. Ítem fallido: {item}") # Añadido el ítem fallido para mejor debug
-                # Opcional: Podrías agregar el item crudo si quieres no perderlo
-                # parsed_items.append(item) 
-                
-        return parsed_items
+                start = time.perf_counter()
+                return fetch_lote(nro_lote), time.perf_counter() - start
+            finally:
+                self._deadline.expires = previous
+
+        def _extract(fetched: Tuple[Any, Optional[float]], nro_lote: int, total_lotes: int) -> List[Any]:
+            response_data, elapsed = fetched
+            if not isinstance(response_data, dict):
+                return []
+            list_ = response_data.get(list_keys[0], {}).get(list_keys[1])
+            if list_ is None:
+                return []
+            logger.info(f"Lote {nro_lote}/{total_lotes} procesado: {len(list_)} registros")
+            if self.metrics is not None:
+                self.metrics.on_batch(self.name, list_keys[1], nro_lote, total_lotes, len(list_), elapsed)
+            if aliases is not None:
+                list_ = project_records(list_, aliases)
+            return list_ if raw else self._parse_list(list_, model_class)
+
+        # Primera request para obtener el primer lote y el total de lotes
+        first_fetch = _fetch(1) if first_response is None else (first_response, None)
+        response_data = first_fetch[0]
+        if not isinstance(response_data, dict):
+            return
+
+        cant_str = response_data.get(count_key, "")
+        logger.debug(f"{count_key} raw: {cant_str}")
+        lote_info = parse_lote_info(cant_str)
+
+        if lote_info is None:
+            logger.warning(f"No se pudo parsear total de lotes de: {cant_str}. Asumiendo 1 lote.")
+            yield _extract(first_fetch, 1, 1)
+            return
+
+        lote_actual, total_lotes = lote_info
+        logger.info(f"Total de lotes a procesar: {total_lotes}")
+        first = _extract(first_fetch, lote_actual, total_lotes)
+        del response_data, first_fetch
+        yield first
+        del first
+
+        pending = range(lote_actual + 1, total_lotes + 1)
+        if workers == 1 or len(pending) <= 1:
+            for i in pending:
+                yield _extract(_fetch(i), i, total_lotes)
+            return
+
+        logger.debug(f"Descargando {len(pending)} lotes con {workers} workers")
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            lotes = iter(pending)
+            in_flight = deque((i, executor.submit(_fetch, i)) for i in islice(lotes, workers))
+            while in_flight:
+                i, future = in_flight.popleft()
+                try:
+                    data = future.result(timeout=None if expires is None else max(0.0, expires - time.monotonic()))
+                except FutureTimeoutError:
+                    raise DeadlineExceeded(f"Deadline de {deadline}s vencido esperando el lote {i}/{total_lotes} "
+                                           f"({i - 1} lotes completos)")
+                # Reponer la ventana antes de entregar el lote al consumidor
+                next_lote = next(lotes, None)
+                if next_lote is not None:
+                    in_flight.append((next_lote, executor.submit(_fetch, next_lote)))
+                yield _extract(data, i, total_lotes)
+        finally:
+            # Con el deadline vencido no se espera a los lotes en vuelo: sus
+            # timeouts ya están recortados y terminan solos
+            expired = expires is not None and time.monotonic() >= expires
+            executor.shutdown(wait=not expired, cancel_futures=True)
 
     # --- Ventas ---
     def get_sales_raw(self,
@@ -257,8 +532,13 @@ class ChessClient:
                   fecha_hasta: str,
                   empresas: str = "",
                   detallado: bool = False,
-                  raw: bool = False
-                  ) -> Union[List[Sale], List[Dict[str, Any]]]:
+                  raw: bool = False,
+                  max_workers: Optional[int] = None,
+                  deadline: Optional[float] = None,
+                  lazy: bool = False,
+                  fields: Optional[Sequence[str]] = None,
+                  compact: bool = False
+                  ) -> Union[List[Sale], List[Dict[str, Any]], List[LazyRecord], List[CompactRecord]]:
         """
         Obtiene comprobantes de ventas (todos los lotes).
 
@@ -268,59 +548,259 @@ class ChessClient:
             empresas: Filtro de empresas
             detallado: Nivel de detalle
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Sale]
+            max_workers: Lotes a pedir en paralelo (None usa el valor del cliente)
+            deadline: Segundos máximos para la llamada completa; al vencer se
+                      cancelan los lotes pendientes y se lanza DeadlineExceeded
+            lazy: Si True, retorna registros lazy (chesserp.lazy) que validan cada
+                  campo recién al leerlo, con los mismos nombres que Sale
+            fields: Campos de Sale a conservar (ej: ["nro_doc", "subtotal_final"]). El
+                    resto de las claves de cada registro se descarta antes de validar;
+                    con raw=True se retornan dicts con solo esos alias
+            compact: Si True, retorna registros compactos (chesserp.compact): validados
+                     como Sale pero guardados en __slots__, con una fracción de la memoria
         """
-        # Primera request para obtener el primer lote y el total de lotes
-        response_data = self.get_sales_raw(fecha_desde, fecha_hasta, empresas, detallado, nro_lote=1)
+        sales_data = []
+        for batch in self.iter_sales_batches(fecha_desde, fecha_hasta, empresas, detallado, raw, max_workers,
+                                             deadline=deadline, lazy=lazy, fields=fields, compact=compact):
+            sales_data.extend(batch)
+        logger.info(f"Total de ventas obtenidas: {len(sales_data)}")
+        return sales_data
+
+    def iter_sales_batches(self,
+                           fecha_desde: str,
+                           fecha_hasta: str,
+                           empresas: str = "",
+                           detallado: bool = False,
+                           raw: bool = False,
+                           max_workers: Optional[int] = None,
+                           deadline: Optional[float] = None,
+                           lazy: bool = False,
+                           fields: Optional[Sequence[str]] = None,
+                           compact: bool = False
+                           ) -> Iterator[Union[List[Sale], List[Dict[str, Any]], List[LazyRecord],
+                                               List[CompactRecord]]]:
+        """
+        Igual que get_sales pero entrega un lote por vez, a medida que llega.
+        La memoria queda acotada a los lotes en vuelo y el consumidor puede
+        empezar a escribir sin esperar al último lote.
+
+        Uso:
+            for lote in client.iter_sales_batches("2025-01-01", "2025-12-31", detallado=True):
+                writer.write(lote)
+        """
+        if raw + lazy + compact > 1:
+            raise ValueError("raw, lazy y compact son excluyentes")
+        model_class, aliases = self._projection(Sale, fields)
+        batches = self._iter_lotes(
+            lambda nro_lote: self.get_sales_raw(fecha_desde, fecha_hasta, empresas, detallado, nro_lote=nro_lote),
+            ("dsReporteComprobantesApi", "VentasResumen"),
+            "cantComprobantesVentas",
+            model_class,
+            raw or lazy,
+            max_workers,
+            deadline=deadline,
+            aliases=aliases
+        )
+        if lazy:
+            return (parse_lazy(batch, model_class) for batch in batches)
+        if compact:
+            return (to_compact(batch, model_class) for batch in batches)
+        return batches
+
+    def iter_sales(self,
+                   fecha_desde: str,
+                   fecha_hasta: str,
+                   empresas: str = "",
+                   detallado: bool = False,
+                   raw: bool = False,
+                   max_workers: Optional[int] = None,
+                   deadline: Optional[float] = None,
+                   lazy: bool = False,
+                   fields: Optional[Sequence[str]] = None,
+                   compact: bool = False
+                   ) -> Iterator[Union[Sale, Dict[str, Any], LazyRecord, CompactRecord]]:
+        """
+        Igual que get_sales pero entrega las ventas de a una (ver iter_sales_batches).
+        """
+        for batch in self.iter_sales_batches(fecha_desde, fecha_hasta, empresas, detallado, raw, max_workers,
+                                             deadline=deadline, lazy=lazy, fields=fields, compact=compact):
+            yield from batch
+
+    def get_sales_range(self,
+                        fecha_desde: str,
+                        fecha_hasta: str,
+                        window: str = "month",
+                        empresas: str = "",
+                        detallado: bool = False,
+                        raw: bool = False,
+                        max_windows: int = 4,
+                        max_workers: Optional[int] = None,
+                        max_lotes: Optional[int] = None
+                        ) -> Union[List[Sale], List[Dict[str, Any]]]:
+        """
+        Obtiene ventas de un rango largo dividiéndolo en ventanas (ver ranges.split_date_range).
+
+        Cada ventana es una consulta independiente con su propia paginación
+        por lotes; se piden hasta max_windows ventanas a la vez y el resultado
+        se arma en orden de fecha.
+
+        Args:
+            fecha_desde: Fecha inicio (YYYY-MM-DD)
+            fecha_hasta: Fecha fin (YYYY-MM-DD)
+            window: Tamaño de ventana: "day", "week" o "month"
+            empresas: Filtro de empresas
+            detallado: Nivel de detalle
+            raw: Si True, retorna lista de dicts sin validar
+            max_windows: Ventanas en paralelo (1 = secuencial)
+            max_workers: Lotes en paralelo dentro de cada ventana (None usa el valor del cliente)
+            max_lotes: Si se indica, las ventanas se ajustan según su cantidad de lotes
+                       (ver plan_sales_range)
+
+        Uso:
+            ventas = client.get_sales_range("2024-01-01", "2025-12-31", window="month", max_windows=6)
+        """
+        if max_lotes is not None:
+            units = self.plan_sales_range(fecha_desde, fecha_hasta, window, max_lotes, empresas, detallado,
+                                          max_windows)
+            return self.fetch_sales_plan(units, empresas, detallado, raw, max_windows, max_workers)
+
+        windows = split_date_range(fecha_desde, fecha_hasta, window)
+        logger.info(f"Ventas {fecha_desde} a {fecha_hasta}: {len(windows)} ventanas ({window})")
+
+        def _fetch(date_range: Tuple[str, str]) -> List[Any]:
+            return self.get_sales(date_range[0], date_range[1], empresas, detallado, raw, max_workers)
 
-        # Inicializar lista acumuladora
         sales_data = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_windows, len(windows)))) as executor:
+            # executor.map entrega en el orden de las ventanas
+            for window_sales in executor.map(_fetch, windows):
+                sales_data.extend(window_sales)
+        logger.info(f"Total de ventas obtenidas en el rango: {len(sales_data)}")
+        return sales_data
+
+    def plan_sales_range(self,
+                         fecha_desde: str,
+                         fecha_hasta: str,
+                         window: str = "month",
+                         max_lotes: int = 10,
+                         empresas: str = "",
+                         detallado: bool = False,
+                         max_windows: int = 4) -> List[WorkUnit]:
+        """
+        Arma unidades de trabajo de tamaño parejo para descargar un rango de ventas.
 
-        # Extraer el primer lote de datos
-        if isinstance(response_data, dict):
-            sales_list = response_data.get("dsReporteComprobantesApi", {}).get("VentasResumen")
+        Sondea el lote 1 de cada ventana (el string cantComprobantesVentas trae
+        el total de lotes y de comprobantes). Las ventanas con más de max_lotes
+        lotes se parten a la mitad y se vuelven a sondear hasta quedar por
+        debajo (o llegar a un día); las ventanas chicas contiguas se agrupan
+        en una misma unidad hasta sumar max_lotes. Así un mes pesado no queda
+        como cola larga y los días casi vacíos no ocupan un worker cada uno.
 
-            if sales_list is not None:
-                if raw:
-                    sales_data.extend(sales_list)
-                else:
-                    sales_data.extend(self._parse_list(sales_list, Sale))
-                logger.info(f"Lote 1 procesado: {len(sales_list)} registros")
-
-            # Obtener el total de lotes usando regex
-            # Formato: "Numero de lote obtenido: 1/70. Cantidad de comprobantes totales: 69041"
-            cant_comprobantes_str = response_data.get("cantComprobantesVentas", "")
-            logger.debug(f"cantComprobantesVentas raw: {cant_comprobantes_str}")
-
-            match = re.search(r'(\d+)/(\d+)', cant_comprobantes_str)
-            if match:
-                lote_actual = int(match.group(1))
-                total_lotes = int(str(match.group(2)).replace('.', ''))
-                logger.info(f"Total de lotes a procesar: {total_lotes}")
-
-                # Iterar sobre los lotes restantes (si hay más de 1)
-                for i in range(lote_actual + 1, total_lotes + 1):
-                    response_data = self.get_sales_raw(fecha_desde, fecha_hasta, empresas, detallado, nro_lote=i)
-
-                    if isinstance(response_data, dict):
-                        list_ = response_data.get("dsReporteComprobantesApi", {}).get("VentasResumen")
-
-                        if list_ is not None:
-                            if raw:
-                                sales_data.extend(list_)
-                            else:
-                                sales_data.extend(self._parse_list(list_, Sale))
-                            logger.info(f"Lote {i}/{total_lotes} procesado: {len(list_)} registros")
-            else:
-                logger.warning(f"No se pudo parsear total de lotes de: {cant_comprobantes_str}. Asumiendo 1 lote.")
+        El lote 1 de cada ventana queda guardado en la unidad y
+        fetch_sales_plan no lo vuelve a pedir.
+
+        Args:
+            fecha_desde: Fecha inicio (YYYY-MM-DD)
+            fecha_hasta: Fecha fin (YYYY-MM-DD)
+            window: Ventana inicial: "day", "week" o "month"
+            max_lotes: Tamaño objetivo de cada unidad, en lotes
+            empresas: Filtro de empresas
+            detallado: Nivel de detalle
+            max_windows: Sondeos en paralelo
+
+        Returns:
+            Lista de WorkUnit en orden de fecha
+        """
+        def _probe(date_range: Tuple[str, str]) -> Tuple[Tuple[str, str], int, Optional[int], Any]:
+            response_data = self.get_sales_raw(date_range[0], date_range[1], empresas, detallado, nro_lote=1)
+            cant_str = response_data.get("cantComprobantesVentas", "") if isinstance(response_data, dict) else ""
+            lote_info = parse_lote_info(cant_str)
+            return date_range, (lote_info[1] if lote_info else 1), parse_doc_count(cant_str), response_data
+
+        probed = []
+        pending = split_date_range(fecha_desde, fecha_hasta, window)
+        with ThreadPoolExecutor(max_workers=max(1, max_windows)) as executor:
+            while pending:
+                next_pending = []
+                for date_range, lotes, docs, response_data in executor.map(_probe, pending):
+                    halves = halve_range(*date_range) if lotes > max_lotes else [date_range]
+                    if len(halves) > 1:
+                        logger.debug(f"Ventana {date_range[0]}..{date_range[1]}: {lotes} lotes, se parte en dos")
+                        next_pending.extend(halves)
+                    else:
+                        probed.append((date_range, lotes, docs, response_data))
+                pending = next_pending
+
+        # ISO YYYY-MM-DD ordena igual que las fechas
+        probed.sort(key=lambda p: p[0][0])
+        units: List[WorkUnit] = []
+        for date_range, lotes, docs, response_data in probed:
+            if not units or units[-1].lotes + lotes > max_lotes:
+                units.append(WorkUnit())
+            units[-1].add(date_range, lotes, docs, response_data)
+
+        logger.info(f"Plan de ventas {fecha_desde} a {fecha_hasta}: {len(probed)} ventanas en {len(units)} unidades "
+                    f"({sum(u.lotes for u in units)} lotes)")
+        return units
+
+    def fetch_sales_plan(self,
+                         units: List[WorkUnit],
+                         empresas: str = "",
+                         detallado: bool = False,
+                         raw: bool = False,
+                         max_units: int = 4,
+                         max_workers: Optional[int] = None
+                         ) -> Union[List[Sale], List[Dict[str, Any]]]:
+        """
+        Descarga las unidades de plan_sales_range, hasta max_units a la vez.
+
+        Cada unidad recorre sus ventanas en secuencia reutilizando el lote 1
+        sondeado. Al terminar, cada WorkUnit tiene elapsed (segundos) y
+        records, útiles para ajustar max_lotes. El plan no se consume: se
+        puede volver a descargar. empresas y detallado deben ser los mismos
+        usados en el plan.
+
+        Uso:
+            units = client.plan_sales_range("2024-01-01", "2025-12-31", max_lotes=8)
+            ventas = client.fetch_sales_plan(units, max_units=6)
+            for unit in units:
+                print(unit)
+        """
+        def _fetch(unit: WorkUnit) -> List[Any]:
+            start = time.perf_counter()
+            records = []
+            for i, (desde, hasta) in enumerate(unit.windows):
+                # Sin respuesta guardada (unidad armada a mano) se pide el lote 1
+                first_response = unit.first_responses[i] if i < len(unit.first_responses) else None
+                for batch in self._iter_lotes(
+                    lambda nro_lote, d=desde, h=hasta: self.get_sales_raw(d, h, empresas, detallado, nro_lote=nro_lote),
+                    ("dsReporteComprobantesApi", "VentasResumen"),
+                    "cantComprobantesVentas",
+                    Sale,
+                    raw,
+                    max_workers,
+                    first_response=first_response
+                ):
+                    records.extend(batch)
+            unit.elapsed = time.perf_counter() - start
+            unit.records = len(records)
+            logger.info(f"Unidad {unit.fecha_desde}..{unit.fecha_hasta}: {unit.records} registros "
+                        f"en {unit.elapsed:.1f}s")
+            return records
+
+        sales_data = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_units, len(units) or 1))) as executor:
+            for unit_sales in executor.map(_fetch, units):
+                sales_data.extend(unit_sales)
+        logger.info(f"Total de ventas obtenidas en el plan: {len(sales_data)}")
+        return sales_data
 
-        logger.info(f"Total de ventas obtenidas: {len(sales_data)}")
-        return sales_data 
-        
     # --- Inventario ---
     def get_articles_raw(self,
                          articulo: int = 0,
                          nro_lote: int = 1,
-                         anulado: bool = False) -> Dict[str, Any]:
+                         anulado: bool = False,
+                         refresh: bool = False) -> Dict[str, Any]:
         """
         Obtiene catálogo de artículos SIN validación (raw JSON).
         Retorna un lote específico.
@@ -337,12 +817,16 @@ class ChessClient:
             "nroLote": nro_lote,
             "anulado": str(anulado).lower()
         }
-        return self._get("articulos/", params)
+        return self._get("articulos/", params, refresh=refresh)
 
     def get_articles(self,
                      articulo: int = 0,
                      anulado: bool = False,
-                     raw: bool = False) -> Union[List[Articulo], List[Dict[str, Any]]]:
+                     raw: bool = False,
+                     max_workers: Optional[int] = None,
+                     refresh: bool = False,
+                     deadline: Optional[float] = None,
+                     fields: Optional[Sequence[str]] = None) -> Union[List[Articulo], List[Dict[str, Any]]]:
         """
         Obtiene catálogo de artículos (todos los lotes).
 
@@ -350,54 +834,58 @@ class ChessClient:
             articulo: ID específico (0 para todos)
             anulado: Incluir anulados
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Articulo]
+            max_workers: Lotes a pedir en paralelo (None usa el valor del cliente)
+            refresh: Si True, ignora la cache y la actualiza con la respuesta de la API
+            deadline: Segundos máximos para la llamada completa (ver get_sales)
+            fields: Campos de Articulo a conservar (ver get_sales)
         """
-        # Primera request para obtener el primer lote y el total de lotes
-        response_data = self.get_articles_raw(articulo, nro_lote=1, anulado=anulado)
-
-        # Inicializar lista acumuladora
         articles_data = []
-
-        # Extraer el primer lote de datos
-        if isinstance(response_data, dict):
-            articles_list = response_data.get("Articulos", {}).get("eArticulos")
-
-            if articles_list is not None:
-                if raw:
-                    articles_data.extend(articles_list)
-                else:
-                    articles_data.extend(self._parse_list(articles_list, Articulo))
-                logger.info(f"Lote 1 procesado: {len(articles_list)} artículos")
-
-            # Obtener el total de lotes usando regex
-            # Formato: "Numero de lote obtenido: 2/22. Cantidad de articulos totales: 2103"
-            cant_articulos_str = response_data.get("cantArticulos", "")
-            logger.debug(f"cantArticulos raw: {cant_articulos_str}")
-
-            match = re.search(r'(\d+)/(\d+)', cant_articulos_str)
-            if match:
-                lote_actual = int(match.group(1))
-                total_lotes = int(match.group(2))
-                logger.info(f"Total de lotes a procesar: {total_lotes}")
-
-                # Iterar sobre los lotes restantes (si hay más de 1)
-                for i in range(lote_actual + 1, total_lotes + 1):
-                    response_data = self.get_articles_raw(articulo, nro_lote=i, anulado=anulado)
-
-                    if isinstance(response_data, dict):
-                        list_ = response_data.get("Articulos", {}).get("eArticulos")
-
-                        if list_ is not None:
-                            if raw:
-                                articles_data.extend(list_)
-                            else:
-                                articles_data.extend(self._parse_list(list_, Articulo))
-                            logger.info(f"Lote {i} procesado: {len(list_)} artículos")
-            else:
-                logger.warning(f"No se pudo parsear total de lotes de: {cant_articulos_str}. Asumiendo 1 lote.")
-
+        for batch in self.iter_articles_batches(articulo, anulado, raw, max_workers, refresh, deadline=deadline,
+                                                fields=fields):
+            articles_data.extend(batch)
         logger.info(f"Total de artículos obtenidos: {len(articles_data)}")
         return articles_data
 
+    def iter_articles_batches(self,
+                              articulo: int = 0,
+                              anulado: bool = False,
+                              raw: bool = False,
+                              max_workers: Optional[int] = None,
+                              refresh: bool = False,
+                              deadline: Optional[float] = None,
+                              fields: Optional[Sequence[str]] = None
+                              ) -> Iterator[Union[List[Articulo], List[Dict[str, Any]]]]:
+        """
+        Igual que get_articles pero entrega un lote por vez, a medida que llega.
+        """
+        model_class, aliases = self._projection(Articulo, fields)
+        return self._iter_lotes(
+            lambda nro_lote: self.get_articles_raw(articulo, nro_lote=nro_lote, anulado=anulado, refresh=refresh),
+            ("Articulos", "eArticulos"),
+            "cantArticulos",
+            model_class,
+            raw,
+            max_workers,
+            deadline=deadline,
+            aliases=aliases
+        )
+
+    def iter_articles(self,
+                      articulo: int = 0,
+                      anulado: bool = False,
+                      raw: bool = False,
+                      max_workers: Optional[int] = None,
+                      refresh: bool = False,
+                      deadline: Optional[float] = None,
+                      fields: Optional[Sequence[str]] = None
+                      ) -> Iterator[Union[Articulo, Dict[str, Any]]]:
+        """
+        Igual que get_articles pero entrega los artículos de a uno.
+        """
+        for batch in self.iter_articles_batches(articulo, anulado, raw, max_workers, refresh, deadline=deadline,
+                                                fields=fields):
+            yield from batch
+
     def get_stock_raw(self,
                       id_deposito: int,
                       frescura: bool = False,
@@ -416,7 +904,8 @@ class ChessClient:
                   id_deposito: int,
                   frescura: bool = False,
                   fecha: str = "",
-                  raw: bool = False) -> Union[List[StockFisico], List[Dict[str, Any]]]:
+                  raw: bool = False,
+                  compact: bool = False) -> Union[List[StockFisico], List[Dict[str, Any]], List[CompactRecord]]:
         """
         Obtiene stock físico.
 
@@ -425,11 +914,14 @@ class ChessClient:
             frescura: Apertura por frescura
             fecha: fechastock(Opcional, cálculo histórico)
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[StockFisico]
+            compact: Si True, retorna registros compactos de StockFisico (ver get_sales)
         """
         raw_data = self.get_stock_raw(id_deposito, fecha)
         raw_data = raw_data.get('dsStockFisicoApi').get("dsStock")  # retorna la lista de articulos
         if raw:
             return raw_data
+        if compact:
+            return to_compact(self._parse_list(raw_data, StockFisico), StockFisico)
         return self._parse_list(raw_data, StockFisico)
 
     # --- Clientes ---
@@ -437,7 +929,8 @@ class ChessClient:
                           #clientes: int | list | None,
                           #sucursal: int | list | None,
                           anulado: bool = False,
-                          nro_lote: int = 1) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+                          nro_lote: int = 1,
+                          refresh: bool = False) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Busca clientes SIN validación (raw JSON).
         Retorna todos los clientes.
@@ -451,12 +944,16 @@ class ChessClient:
             "nroLote": nro_lote
         }
 
-        return self._get("clientes/", params)
+        return self._get("clientes/", params, refresh=refresh)
     
     def get_customers(self,
                       anulado: bool = False,
                       nro_lote: int = 0,
-                      raw: bool = False) -> Union[List[Cliente], List[Dict[str, Any]]]:
+                      raw: bool = False,
+                      max_workers: Optional[int] = None,
+                      refresh: bool = False,
+                      deadline: Optional[float] = None,
+                      fields: Optional[Sequence[str]] = None) -> Union[List[Cliente], List[Dict[str, Any]]]:
         """
         Busca clientes (todos los lotes o uno específico).
 
@@ -464,66 +961,72 @@ class ChessClient:
             anulado: Incluir anulados
             nro_lote: Lote específico (0 para todos)
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[Cliente]
+            max_workers: Lotes a pedir en paralelo (None usa el valor del cliente)
+            refresh: Si True, ignora la cache y la actualiza con la respuesta de la API
+            deadline: Segundos máximos para traer todos los lotes (ver get_sales)
+            fields: Campos de Cliente a conservar (ver get_sales)
         """
         # Inicializar lista acumuladora
         customers_data = []
 
         if nro_lote == 0:
-            # Primera request  para obtener el primer lote y el total de lotes
-            response_data = self.get_customers_raw(anulado=anulado, nro_lote=1)
-
-            # Extraer el primer lote de datos
-            if isinstance(response_data, dict):
-                customers_list = response_data.get("Clientes", {}).get("eClientes")
-
-                if customers_list is not None:
-                    if raw:
-                        customers_data.extend(customers_list)
-                    else:
-                        customers_data.extend(self._parse_list(customers_list, Cliente))
-                    logger.info(f"Lote 1 procesado: {len(customers_list)} registros")
-
-                # Obtener el total de lotes usando regex
-                # Formato: "Numero de lote obtenido: 1/70. Cantidad de comprobantes totales: 69041"
-                cant_clientes_str = response_data.get("cantClientes", "")
-                logger.debug(f"cantClientes: {cant_clientes_str}")
-
-                match = re.search(r'(\d+)/(\d+)', cant_clientes_str)
-                if match:
-                    lote_actual = int(match.group(1))
-                    total_lotes = int(match.group(2))
-                    logger.info(f"Total de lotes a procesar: {total_lotes}")
-
-                    # Iterar sobre los lotes restantes (si hay más de 1)
-                    for i in range(lote_actual+1, total_lotes+1):
-                        response_data = self.get_customers_raw(anulado=anulado, nro_lote=i)
-
-                        if isinstance(response_data, dict):
-                            list_ = response_data.get("Clientes", {}).get("eClientes")
-
-                            if list_ is not None:
-                                if raw:
-                                    customers_data.extend(list_)
-                                else:
-                                    customers_data.extend(self._parse_list(list_, Cliente))
-                                logger.info(f"Lote {i} procesado: {len(list_)} registros")
-                else:
-                    logger.warning(f"No se pudo parsear total de lotes de: {cant_clientes_str}. Asumiendo 1 lote.")
-
+            for batch in self.iter_customers_batches(anulado, raw, max_workers, refresh, deadline=deadline,
+                                                     fields=fields):
+                customers_data.extend(batch)
             logger.info(f"Total de clientes obtenidas: {len(customers_data)}")
         else:
-            response_data = self.get_customers_raw(anulado=anulado, nro_lote=nro_lote)
+            model_class, aliases = self._projection(Cliente, fields)
+            response_data = self.get_customers_raw(anulado=anulado, nro_lote=nro_lote, refresh=refresh)
             list_ = response_data.get("Clientes", {}).get("eClientes")
 
             if list_ is not None:
+                if aliases is not None:
+                    list_ = project_records(list_, aliases)
                 if raw:
                     customers_data.extend(list_)
                 else:
-                    customers_data.extend(self._parse_list(list_, Cliente))
+                    customers_data.extend(self._parse_list(list_, model_class))
                 logger.info(f"Lote {nro_lote} procesado: {len(list_)} registros")
 
         return customers_data
 
+    def iter_customers_batches(self,
+                               anulado: bool = False,
+                               raw: bool = False,
+                               max_workers: Optional[int] = None,
+                               refresh: bool = False,
+                               deadline: Optional[float] = None,
+                               fields: Optional[Sequence[str]] = None
+                               ) -> Iterator[Union[List[Cliente], List[Dict[str, Any]]]]:
+        """
+        Igual que get_customers (todos los lotes) pero entrega un lote por vez.
+        """
+        model_class, aliases = self._projection(Cliente, fields)
+        return self._iter_lotes(
+            lambda i: self.get_customers_raw(anulado=anulado, nro_lote=i, refresh=refresh),
+            ("Clientes", "eClientes"),
+            "cantClientes",
+            model_class,
+            raw,
+            max_workers,
+            deadline=deadline,
+            aliases=aliases
+        )
+
+    def iter_customers(self,
+                       anulado: bool = False,
+                       raw: bool = False,
+                       max_workers: Optional[int] = None,
+                       refresh: bool = False,
+                       deadline: Optional[float] = None,
+                       fields: Optional[Sequence[str]] = None
+                       ) -> Iterator[Union[Cliente, Dict[str, Any]]]:
+        """
+        Igual que get_customers (todos los lotes) pero entrega los clientes de a uno.
+        """
+        for batch in self.iter_customers_batches(anulado, raw, max_workers, refresh, deadline=deadline,
+                                                 fields=fields):
+            yield from batch
 
 
     # --- Pedidos ---
@@ -567,7 +1070,8 @@ class ChessClient:
 
     def get_staff_raw(self,
                       sucursal: int = 0,
-                      personal: int = 0) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+                      personal: int = 0,
+                      refresh: bool = False) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Busca personal comercial SIN validación (raw JSON).
         """
@@ -575,20 +1079,22 @@ class ChessClient:
             "sucursal": sucursal if sucursal > 0 else "",
             "personal": personal if personal > 0 else ""
         }
-        return self._get("personalComercial/", params)
+        return self._get("personalComercial/", params, refresh=refresh)
 
     def get_staff(self,
                   sucursal: int = 0,
                   personal: int = 0,
-                  raw: bool = False) -> Union[List[PersonalComercial], List[Dict[str, Any]]]:
+                  raw: bool = False,
+                  refresh: bool = False) -> Union[List[PersonalComercial], List[Dict[str, Any]]]:
         """
         Busca personal comercial.
         Args:
             sucursal: ID de sucursal (0 para todas)
             personal: ID de personal (0 para todos)
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[PersonalComercial]
+            refresh: Si True, ignora la cache y la actualiza con la respuesta de la API
         """
-        raw_data = self.get_staff_raw(sucursal, personal)
+        raw_data = self.get_staff_raw(sucursal, personal, refresh=refresh)
         # Extraer lista de personal del JSON
         # Estructura: {"PersonalComercial": {"ePersCom": [...]}}
         staff_list = raw_data.get('PersonalComercial', {}).get('ePersCom', []) if isinstance(raw_data, dict) else raw_data
@@ -602,7 +1108,8 @@ class ChessClient:
                        sucursal: int = 1,
                        fuerza_venta: int = 1,
                        modo_atencion: int = 0,
-                       anulado: bool = False):
+                       anulado: bool = False,
+                       refresh: bool = False):
         """
         Busca rutas de venta SIN validación (raw JSON).
         """
@@ -611,14 +1118,15 @@ class ChessClient:
             "fuerzaventa": fuerza_venta,
             "anulada": str(anulado).lower()  # PDF dice "anulada" en query param pg 36
         }
-        return self._get("rutasVenta/", params)
+        return self._get("rutasVenta/", params, refresh=refresh)
 
     def get_routes(self,
                    sucursal: int = 1,
                    fuerza_venta: int = 1,
                    modo_atencion: str = "PRE",
                    anulado: bool = False,
-                   raw: bool = False) -> Union[List[RutaVenta], List[Dict[str, Any]]]:
+                   raw: bool = False,
+                   refresh: bool = False) -> Union[List[RutaVenta], List[Dict[str, Any]]]:
         """
         Busca rutas de venta.
 
@@ -628,10 +1136,12 @@ class ChessClient:
             modo_atencion: Modo de atención
             anulado: Incluir anuladas
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[RutaVenta]
+            refresh: Si True, ignora la cache y la actualiza con la respuesta de la API
         """
         raw_data = self.get_routes_raw(sucursal=sucursal,
                                        fuerza_venta=fuerza_venta,
-                                       anulado=anulado)
+                                       anulado=anulado,
+                                       refresh=refresh)
         # Extraer lista de rutas del JSON
         # Estructura probable: {"rutasVenta": [...]} o {"RutasVenta": {"eRutas": [...]}}
         # Intentar diferentes estructuras posibles
@@ -643,7 +1153,8 @@ class ChessClient:
     # --- Marketing ---
 
     def get_marketing_raw(self,
-                          cod_scan: int = 0) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+                          cod_scan: int = 0,
+                          refresh: bool = False) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Busca jerarquía de marketing SIN validación (raw JSON).
 
@@ -653,19 +1164,21 @@ class ChessClient:
         params = {
             "CodScan": cod_scan if cod_scan > 0 else ""
         }
-        return self._get("jerarquiaMkt/", params)
+        return self._get("jerarquiaMkt/", params, refresh=refresh)
 
     def get_marketing(self,
                       cod_scan: int = 0,
-                      raw: bool = False) -> Union[List[JerarquiaMkt], List[Dict[str, Any]]]:
+                      raw: bool = False,
+                      refresh: bool = False) -> Union[List[JerarquiaMkt], List[Dict[str, Any]]]:
         """
         Busca jerarquía de marketing.
 
         Args:
             cod_scan: Código de escaneo (opcional, 0 para todos)
             raw: Si True, retorna lista de dicts sin validar. Si False, retorna List[JerarquiaMkt]
+            refresh: Si True, ignora la cache y la actualiza con la respuesta de la API
         """
-        raw_data = self.get_marketing_raw(cod_scan)
+        raw_data = self.get_marketing_raw(cod_scan, refresh=refresh)
         # Extraer lista de segmentos del JSON anidado
         # Estructura: {"SubcanalesMkt": {"SegmentosMkt": [...]}}
         segmentos_list = raw_data.get('SubcanalesMkt', {}).get('SegmentosMkt', [])
@@ -689,8 +1202,7 @@ class ChessClient:
         2. Recibe JSON con path del archivo ('pcArchivo').
         3. GET a ese path para descargar los bytes.
         """
-        if not self._session_id:
-            self.login()
+        session_id = self._ensure_session()
 
         endpoint = "reporteComprobantesVta/exportarExcel"
         url = self.base_url + endpoint
@@ -718,13 +1230,19 @@ class ChessClient:
 
         logger.info(f"[{self.name}] Requesting sales report export: {fecha_desde} to {fecha_hasta}...")
 
+        def _send_export() -> requests.Response:
+            return self._send(self._session.post, url, json=payload, headers=cookie_header(session_id),
+                              timeout=self.timeouts, metric=endpoint)
+
         try:
             # Paso 1: Solicitar exportación
-            response = requests.post(url, json=payload, headers=self.base_headers, timeout=self.timeout)
+            response = self.retry.call(_send_export, f"POST {endpoint}", on_retry=self._on_retry,
+                                       expires=self._deadline_expires())
 
             if response.status_code == 401:
-                self.login()
-                response = requests.post(url, json=payload, headers=self.base_headers, timeout=self.timeout)
+                session_id = self._ensure_session(stale_session_id=session_id)
+                response = self.retry.call(_send_export, f"POST {endpoint}", on_retry=self._on_retry,
+                                       expires=self._deadline_expires())
 
             if response.status_code != 200:
                 raise ApiError(response.status_code, "Failed to request report export", response.text)
@@ -741,7 +1259,10 @@ class ChessClient:
 
             logger.info(f"[{self.name}] Downloading report from {file_url}...")
 
-            file_response = requests.get(file_url, headers=self.base_headers, timeout=self.timeout)
+            file_response = self.retry.call(
+                lambda: self._send(self._session.get, file_url, headers=cookie_header(session_id),
+                                   timeout=self.timeouts, metric=f"{endpoint}/archivo"),
+                f"GET {file_url}", on_retry=self._on_retry, expires=self._deadline_expires())
 
             if file_response.status_code != 200:
                 raise ApiError(file_response.status_code, "Failed to download report file", file_response.text)
@@ -749,6 +1270,8 @@ class ChessClient:
             return file_response.content
 
         except requests.RequestException as e:
+            if self._deadline_expired():
+                raise DeadlineExceeded(f"Deadline vencido durante la exportación del reporte: {e}")
             raise ApiError(500, f"Connection error during report export: {str(e)}")
 
 
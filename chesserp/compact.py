@@ -0,0 +1,109 @@
+"""
+Registros compactos: clases con __slots__ generadas a partir de los modelos
+Pydantic, para tener millones de registros en memoria.
+
+Un modelo Pydantic guarda sus valores en un __dict__ por instancia (más
+__pydantic_fields_set__ y el resto del estado de BaseModel). Un registro
+compacto guarda solo los valores, en un slot por campo, con los mismos
+nombres snake_case del modelo. Los valores ya vienen validados: se parsea
+con el modelo y se convierte lote por lote, así el pico de memoria queda en
+un lote de modelos Pydantic.
+
+Uso:
+    ventas = client.get_sales("2023-01-01", "2025-12-31", compact=True)
+    ventas[0].nro_doc, ventas[0].subtotal_final   # mismos nombres que Sale
+    ventas[0].to_model()                          # Sale, sin revalidar
+"""
+import threading
+from typing import Any, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from chesserp.parsing import parse_list
+
+
+class CompactRecord:
+    """
+    Base de los registros compactos. Cada subclase (ver compact_class) tiene
+    un slot por campo del modelo, en el mismo orden.
+    """
+
+    __slots__ = ()
+    model_class: Type[BaseModel] = None
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self._fields, values, strict=True):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "CompactRecord":
+        """Copia los valores de un modelo ya validado."""
+        return cls(*(getattr(model, name) for name in cls._fields))
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "CompactRecord":
+        """Valida un dict de la API (claves = alias) con el modelo y lo compacta."""
+        return cls.from_model(cls.model_class.model_validate(raw))
+
+    def to_model(self) -> BaseModel:
+        """Modelo Pydantic con los mismos valores (model_construct: no se revalida)."""
+        return self.model_class.model_construct(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Valores por nombre de campo, como model_dump() pero sin serializar submodelos."""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and tuple(other) == tuple(self)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Las clases se generan en runtime: para pickle (ej: multiprocessing)
+        # se reconstruyen desde el modelo
+        return _rebuild, (self.model_class, tuple(self))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields[:4])
+        more = ", ..." if len(self._fields) > 4 else ""
+        return f"{type(self).__name__}({values}{more})"
+
+
+_compact_classes: Dict[type, type] = {}
+_compact_lock = threading.Lock()
+
+
+def compact_class(model_class: Type[BaseModel]) -> Type[CompactRecord]:
+    """Clase compacta (cacheada) para model_class, con un slot por campo."""
+    cls = _compact_classes.get(model_class)
+    if cls is None:
+        with _compact_lock:
+            cls = _compact_classes.get(model_class)
+            if cls is None:
+                fields = tuple(model_class.model_fields)
+                namespace = {"__slots__": fields, "_fields": fields, "model_class": model_class}
+                cls = type(f"Compact{model_class.__name__}", (CompactRecord,), namespace)
+                _compact_classes[model_class] = cls
+    return cls
+
+
+def _rebuild(model_class: Type[BaseModel], values: Tuple[Any, ...]) -> CompactRecord:
+    return compact_class(model_class)(*values)
+
+
+def to_compact(models: List[BaseModel], model_class: Type[BaseModel]) -> List[CompactRecord]:
+    """Convierte modelos ya validados de model_class a registros compactos."""
+    from_model = compact_class(model_class).from_model
+    return [from_model(model) for model in models]
+
+
+def parse_compact(data: Any, model_class: Type[BaseModel]) -> List[CompactRecord]:
+    """
+    Parsea una lista de dicts con parse_list (mismas reglas: los ítems
+    inválidos se loguean y descartan) y la retorna compactada.
+    """
+    return to_compact(parse_list(data, model_class), model_class)
@@ -6,6 +6,10 @@ class AuthError(ChessError):
     """Authentication failed"""
     pass
 
+class DeadlineExceeded(ChessError):
+    """The overall deadline of a call expired before all batches were fetched"""
+    pass
+
 class ApiError(ChessError):
     """API returned an error status"""
     def __init__(self, status_code: int, message: str, details: str = None):
@@ -0,0 +1,251 @@
+"""
+Exportación columnar (Parquet / Arrow IPC) de ventas.
+
+Escribe los registros de Sale con tipos de columna derivados del modelo
+Pydantic, particionados por empresa y mes, de a un lote por vez (sin
+acumular el rango completo en memoria) y comprimidos.
+
+Estructura en disco (particionado estilo Hive, legible por pyarrow.dataset,
+pandas, DuckDB, Spark):
+    {base_dir}/empresa=EMPRESA1/mes=2025-01/part-{corrida}-00000.parquet
+
+Cada corrida reemplaza las particiones (empresa, mes) que escribe: al
+escribir por primera vez en una partición se borran los archivos de
+corridas anteriores, así que re-exportar un mes no deja filas duplicadas.
+
+Requiere la dependencia opcional pyarrow:
+    pip install chesserp-api[arrow]
+
+Uso:
+    from chesserp.export import export_sales
+
+    export_sales(client, "data/ventas", "2024-01-01", "2025-12-31", detallado=True)
+
+    # Lectura de solo algunas columnas
+    import pyarrow.dataset as ds
+    tabla = ds.dataset("data/ventas", partitioning="hive").to_table(columns=["id_cliente", "subtotal_final"])
+"""
+import glob
+import os
+import re
+import typing
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+
+from chesserp.models.sales import Sale
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMATS = ("parquet", "arrow")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("La exportación columnar requiere pyarrow. Instalar con: pip install chesserp-api[arrow]")
+
+
+def _arrow_type(annotation: Any) -> "pa.DataType":
+    """
+    Tipo Arrow para una anotación de campo Pydantic.
+    Los Union de tipos distintos (ej: Union[int, str]) se guardan como string.
+    """
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if typing.get_origin(annotation) is Union:
+        if len(args) == 1:
+            return _arrow_type(args[0])
+        return pa.string()
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    return pa.string()
+
+
+def arrow_schema(model_class: Type[BaseModel] = Sale, fields: Optional[Sequence[str]] = None) -> "pa.Schema":
+    """
+    Schema Arrow con los nombres snake_case y tipos del modelo.
+
+    Args:
+        model_class: Modelo Pydantic (default: Sale)
+        fields: Subconjunto de campos a incluir (default: todos)
+    """
+    _require_pyarrow()
+    model_fields = model_class.model_fields
+    names = list(fields) if fields else list(model_fields)
+    unknown = [n for n in names if n not in model_fields]
+    if unknown:
+        raise ValueError(f"Campos inexistentes en {model_class.__name__}: {', '.join(unknown)}")
+    return pa.schema([(name, _arrow_type(model_fields[name].annotation)) for name in names])
+
+
+def _coerce(value: Any, arrow_type: "pa.DataType") -> Any:
+    """Convierte un valor crudo de la API al tipo de la columna (None si no se puede)."""
+    if value is None or (value == "" and not pa.types.is_string(arrow_type)):
+        return None
+    try:
+        if pa.types.is_string(arrow_type):
+            return str(value)
+        if pa.types.is_integer(arrow_type):
+            return int(value)
+        if pa.types.is_floating(arrow_type):
+            return float(value)
+        if pa.types.is_boolean(arrow_type):
+            return value if isinstance(value, bool) else str(value).lower() in ("true", "1", "s", "si")
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def records_to_table(records: Sequence[Union[Dict[str, Any], BaseModel]],
+                     model_class: Type[BaseModel] = Sale,
+                     schema: Optional["pa.Schema"] = None) -> "pa.Table":
+    """
+    Arma una tabla Arrow a partir de dicts raw (claves alias de la API) o
+    instancias del modelo.
+    """
+    _require_pyarrow()
+    schema = schema or arrow_schema(model_class)
+    model_fields = model_class.model_fields
+    columns = []
+    for field in schema:
+        if records and isinstance(records[0], BaseModel):
+            values = [getattr(r, field.name) for r in records]
+        else:
+            alias = model_fields[field.name].alias or field.name
+            values = [r.get(alias) for r in records]
+        try:
+            columns.append(pa.array(values, type=field.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+            columns.append(pa.array([_coerce(v, field.type) for v in values], type=field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class SalesDatasetWriter:
+    """
+    Escribe lotes de ventas a un dataset particionado por empresa y mes.
+
+    Cada llamada a write_batch() genera un archivo por mes presente en el
+    lote; nada se acumula entre lotes. Los archivos llevan un id de corrida
+    y la primera escritura en cada partición borra los de corridas
+    anteriores (la partición queda reemplazada, no mezclada).
+    """
+
+    def __init__(self,
+                 base_dir: str,
+                 company: str,
+                 format: str = "parquet",
+                 compression: str = "zstd",
+                 fields: Optional[Sequence[str]] = None):
+        """
+        Args:
+            base_dir: Directorio raíz del dataset
+            company: Nombre de la empresa (partición empresa=...)
+            format: "parquet" o "arrow" (Arrow IPC / Feather v2)
+            compression: Códec ("zstd", "lz4", "snappy" (solo parquet), None)
+            fields: Columnas a exportar (default: todas las de Sale)
+        """
+        _require_pyarrow()
+        if format not in FORMATS:
+            raise ValueError(f"Formato no soportado: {format}. Opciones: {', '.join(FORMATS)}")
+        self.base_dir = base_dir
+        # client.name puede ser la URL de la API: se normaliza para usarla como directorio
+        self.company = re.sub(r"[^\w.-]+", "_", company).strip("_")
+        self.format = format
+        self.compression = compression
+        self.schema = arrow_schema(Sale, fields)
+        self.files: List[str] = []
+        self.rows_written = 0
+        self.run_id = uuid.uuid4().hex[:12]
+        self._part = 0
+        self._replaced: set = set()
+
+    def _replace_partition(self, part_dir: str) -> None:
+        """Borra los archivos de corridas anteriores la primera vez que se escribe en part_dir."""
+        if part_dir in self._replaced:
+            return
+        self._replaced.add(part_dir)
+        stale = [path for path in glob.glob(os.path.join(part_dir, f"part-*.{self.format}"))
+                 if not os.path.basename(path).startswith(f"part-{self.run_id}-")]
+        for path in stale:
+            os.remove(path)
+        if stale:
+            logger.info(f"Partición {part_dir} reemplazada ({len(stale)} archivos anteriores)")
+
+    def _month_of(self, record: Union[Dict[str, Any], BaseModel]) -> str:
+        value = record.fecha_comprobante if isinstance(record, BaseModel) else record.get("fechaComprobate")
+        value = str(value or "")
+        if len(value) >= 7 and value[4] == "-":
+            return value[:7]
+        if len(value) >= 10 and value[2] == "/":  # dd/mm/yyyy
+            return f"{value[6:10]}-{value[3:5]}"
+        return "desconocido"
+
+    def write_batch(self, records: Sequence[Union[Dict[str, Any], Sale]]) -> List[str]:
+        """
+        Escribe un lote (dicts raw o Sale). Retorna los archivos generados.
+        """
+        by_month: Dict[str, List[Any]] = {}
+        for record in records:
+            by_month.setdefault(self._month_of(record), []).append(record)
+
+        written = []
+        for month, month_records in sorted(by_month.items()):
+            table = records_to_table(month_records, Sale, self.schema)
+            part_dir = os.path.join(self.base_dir, f"empresa={self.company}", f"mes={month}")
+            os.makedirs(part_dir, exist_ok=True)
+            self._replace_partition(part_dir)
+            path = os.path.join(part_dir, f"part-{self.run_id}-{self._part:05d}.{self.format}")
+            self._part += 1
+
+            if self.format == "parquet":
+                pq.write_table(table, path, compression=self.compression)
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=self.compression)
+                with pa.ipc.new_file(path, table.schema, options=options) as writer:
+                    writer.write_table(table)
+
+            written.append(path)
+            self.rows_written += table.num_rows
+
+        self.files.extend(written)
+        return written
+
+
+def export_sales(client: Any,
+                 base_dir: str,
+                 fecha_desde: str,
+                 fecha_hasta: str,
+                 empresas: str = "",
+                 detallado: bool = True,
+                 company: Optional[str] = None,
+                 format: str = "parquet",
+                 compression: str = "zstd",
+                 fields: Optional[Sequence[str]] = None,
+                 max_workers: Optional[int] = None) -> SalesDatasetWriter:
+    """
+    Descarga ventas lote por lote (iter_sales_batches, raw) y las escribe
+    al dataset columnar a medida que llegan.
+
+    Returns:
+        El SalesDatasetWriter usado (files, rows_written)
+    """
+    writer = SalesDatasetWriter(base_dir, company or client.name, format, compression, fields)
+    batches: Iterable[List[Dict[str, Any]]] = client.iter_sales_batches(
+        fecha_desde, fecha_hasta, empresas, detallado, raw=True, max_workers=max_workers
+    )
+    for batch in batches:
+        writer.write_batch(batch)
+    logger.info(f"[{writer.company}] Exportadas {writer.rows_written} ventas en {len(writer.files)} archivos ({format})")
+    return writer
@@ -0,0 +1,175 @@
+"""
+Ventas a DataFrame directamente desde el JSON crudo, por columnas.
+
+VentasResumen trae una fila por línea, con los datos del comprobante
+repetidos en cada una. sales_to_frame arma la tabla aplanada (mismas
+columnas que live_test.Testing._flatten_sales) sin pasar por Sale ni
+armar un dict por fila:
+
+- las claves del comprobante (empresa, documento, letra, serie, número)
+  se factorizan a un código por línea
+- las columnas del encabezado se leen y convierten una sola vez por
+  comprobante y se expanden a las líneas con take(códigos)
+- las columnas de línea se leen una vez por columna y se convierten con
+  pd.to_numeric
+
+Uso:
+    from chesserp.frames import sales_to_frame
+
+    ventas = client.get_sales("2025-01-01", "2025-01-31", detallado=True, raw=True)
+    df = sales_to_frame(ventas)
+"""
+import typing
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from chesserp.models.sales import Sale
+
+# Claves que identifican un comprobante
+HEADER_KEY = ("id_empresa", "id_documento", "letra", "serie", "nro_doc")
+
+# (columna, campo de Sale) de los datos del comprobante, iguales en todas sus líneas
+HEADER_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("id_empresa", "id_empresa"),
+    ("ds_empresa", "ds_empresa"),
+    ("id_documento", "id_documento"),
+    ("ds_documento", "ds_documento"),
+    ("letra", "letra"),
+    ("serie", "serie"),
+    ("nro_doc", "nro_doc"),
+    ("fecha_comprobante", "fecha_comprobante"),
+    ("id_sucursal", "id_sucursal"),
+    ("ds_sucursal", "ds_sucursal"),
+    ("id_cliente", "id_cliente"),
+    ("nombre_cliente", "nombre_cliente"),
+    ("id_vendedor", "id_vendedor"),
+    ("ds_vendedor", "ds_vendedor"),
+)
+
+# (columna, campo de Sale) propios de cada línea
+LINE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("subtotal_neto", "subtotal_neto"),
+    ("subtotal_final", "subtotal_final"),
+    ("linea_id_linea", "id_linea"),
+    ("linea_id_articulo", "id_articulo"),
+    ("linea_ds_articulo", "ds_articulo"),
+    ("linea_cantidades_total", "cantidades_total"),
+    ("linea_precio_bruto", "precio_unitario_bruto"),
+    ("linea_precio_neto", "precio_unitario_neto"),
+    ("linea_bonificacion", "bonificacion"),
+    ("linea_subtotal_neto", "subtotal_neto"),
+    ("linea_subtotal_final", "subtotal_final"),
+)
+
+# Orden de columnas de _flatten_sales
+COLUMNS = [name for name, _ in HEADER_COLUMNS] + [name for name, _ in LINE_COLUMNS]
+
+
+def _alias(field: str) -> str:
+    return Sale.model_fields[field].alias or field
+
+
+def _read_column(records: List[Dict[str, Any]], field: str) -> List[Any]:
+    """Valores de un campo de Sale en todos los registros (por alias)."""
+    alias = _alias(field)
+    try:
+        return list(map(itemgetter(alias), records))
+    except KeyError:
+        # Registros incompletos: las claves faltantes quedan como None
+        return [r.get(alias) for r in records]
+
+
+def _numeric_kind(field: str) -> Union[type, None]:
+    """int o float si el campo de Sale es numérico (Optional incluido); None si no."""
+    annotation = Sale.model_fields[field].annotation
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if typing.get_origin(annotation) is Union and len(args) == 1:
+        annotation = args[0]
+    return annotation if annotation in (int, float) else None
+
+
+def _column(values: List[Any], field: str) -> Any:
+    """
+    Convierte los valores crudos de una columna al tipo del campo. Los
+    numéricos inválidos (y los enteros con decimales) quedan como nulos; los
+    enteros con nulos usan Int64.
+    """
+    kind = _numeric_kind(field)
+    if kind is None:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    # Camino rápido: la API ya manda números
+    if kind is int:
+        # Sin dtype, numpy infiere int64 solo si todos son enteros; forzar
+        # int64 truncaría 1.7 a 1 (Sale lo rechaza)
+        array = np.array(values)
+        if array.dtype.kind in "iub":
+            return array.astype(np.int64, copy=False)
+    else:
+        try:
+            # None cuenta como NaN
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    if kind is int:
+        # Con decimales no es un entero válido: nulo, como los no numéricos
+        numbers = numbers.where(numbers % 1 == 0)
+        numbers = numbers.astype("Int64") if numbers.isna().any() else numbers.astype("int64")
+    else:
+        numbers = numbers.astype("float64")
+    return numbers.array
+
+
+def _header_codes(records: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Código de comprobante por línea (en orden de aparición) y la posición
+    de la primera línea de cada comprobante.
+    """
+    codes = np.zeros(len(records), dtype=np.int64)
+    for field in HEADER_KEY:
+        column = np.empty(len(records), dtype=object)
+        column[:] = _read_column(records, field)
+        field_codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        # Combinar con las claves anteriores y re-factorizar deja los códigos < len(records)
+        codes, _ = pd.factorize(codes * (len(uniques) + 1) + (field_codes + 1))
+    _, first = np.unique(codes, return_index=True)
+    return codes, first
+
+
+def sales_to_frame(records: Union[List[Dict[str, Any]], Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Tabla de líneas de venta (una fila por línea, columnas de _flatten_sales)
+    a partir de los dicts raw de VentasResumen.
+
+    Args:
+        records: Lista de dicts (claves alias de la API), ej: get_sales(raw=True),
+                 o la respuesta completa de get_sales_raw()
+
+    Los valores no se validan con Sale: los numéricos que no se pueden
+    convertir quedan como nulos en vez de descartar la línea.
+    """
+    if isinstance(records, dict):
+        records = records.get("dsReporteComprobantesApi", {}).get("VentasResumen") or []
+    records = [r for r in records if isinstance(r, dict)]
+    if not records:
+        return pd.DataFrame(columns=COLUMNS)
+
+    codes, first = _header_codes(records)
+    headers = [records[i] for i in first]
+
+    data = {}
+    for name, field in HEADER_COLUMNS:
+        data[name] = _column(_read_column(headers, field), field).take(codes)
+
+    line_values: Dict[str, Any] = {}
+    for name, field in LINE_COLUMNS:
+        if field not in line_values:
+            line_values[field] = _column(_read_column(records, field), field)
+        data[name] = line_values[field]
+
+    return pd.DataFrame(data, columns=COLUMNS)
@@ -0,0 +1,205 @@
+"""
+Extracciones largas reanudables, con checkpoint por lote.
+
+Cada lote (nroLote) descargado se guarda en disco apenas llega y se anota
+en un manifiesto. Si la corrida se corta o algún lote falla, volver a
+llamar a run() pide solamente los lotes que faltan.
+
+Estructura en disco:
+    {job_dir}/manifest.json       # endpoint, parámetros, total de lotes y lotes completos
+    {job_dir}/lote_00001.json     # registros raw de cada lote
+
+Uso:
+    client = ChessClient.from_env(prefix="EMPRESA1_", max_workers=4)
+    job = ResumableJob.sales(client, "data/jobs/ventas_2024", "2024-01-01", "2024-12-31", detallado=True)
+    job.run()                     # si falla el lote 57/70, los otros 69 quedan guardados
+    job.run()                     # reintento: solo pide el lote 57
+    ventas = list(job.records())
+"""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from chesserp.client import ChessClient
+from chesserp.logger import get_logger
+from chesserp.models.clients import Cliente
+from chesserp.models.inventory import Articulo
+from chesserp.models.sales import Sale
+from chesserp.parsing import parse_doc_count, parse_list, parse_lote_info
+from chesserp.sync import write_json_atomic
+
+logger = get_logger(__name__)
+
+# endpoint -> (método raw de ChessClient, claves de la lista, clave del string de lotes, modelo)
+JOB_ENDPOINTS = {
+    "ventas": ("get_sales_raw", ("dsReporteComprobantesApi", "VentasResumen"), "cantComprobantesVentas", Sale),
+    "articulos": ("get_articles_raw", ("Articulos", "eArticulos"), "cantArticulos", Articulo),
+    "clientes": ("get_customers_raw", ("Clientes", "eClientes"), "cantClientes", Cliente),
+}
+
+
+class ResumableJob:
+    """
+    Descarga todos los lotes de un endpoint paginado con checkpoint en disco
+    (ver docstring del módulo).
+    """
+
+    def __init__(self, client: ChessClient, job_dir: str, endpoint: str = "ventas", **params):
+        """
+        Args:
+            client: ChessClient de la empresa
+            job_dir: Directorio del job (se crea si no existe)
+            endpoint: "ventas", "articulos" o "clientes"
+            **params: Parámetros del método raw, sin nro_lote (ej: fecha_desde, fecha_hasta)
+
+        Raises:
+            ValueError: Si el endpoint no está soportado o job_dir ya tiene un
+                        job con otro endpoint o parámetros
+        """
+        if endpoint not in JOB_ENDPOINTS:
+            raise ValueError(f"Endpoint no soportado: {endpoint}. Opciones: {', '.join(JOB_ENDPOINTS)}")
+        self.client = client
+        self.job_dir = job_dir
+        self.endpoint = endpoint
+        self.params = params
+        self._method, self._list_keys, self._count_key, self._model_class = JOB_ENDPOINTS[endpoint]
+        self._lock = threading.Lock()
+
+        os.makedirs(job_dir, exist_ok=True)
+        self.manifest_path = os.path.join(job_dir, "manifest.json")
+        self.manifest = self._load_manifest()
+
+    @classmethod
+    def sales(cls,
+              client: ChessClient,
+              job_dir: str,
+              fecha_desde: str,
+              fecha_hasta: str,
+              empresas: str = "",
+              detallado: bool = False) -> "ResumableJob":
+        """Job de ventas (equivalente reanudable de get_sales)."""
+        return cls(client, job_dir, "ventas", fecha_desde=fecha_desde, fecha_hasta=fecha_hasta,
+                   empresas=empresas, detallado=detallado)
+
+    # --- Manifiesto ---
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {"endpoint": self.endpoint, "params": self.params, "total_lotes": None,
+                    "docs": None, "completed": [], "updated_at": None}
+        with open(self.manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("endpoint") != self.endpoint or manifest.get("params") != self.params:
+            raise ValueError(f"{self.job_dir} ya contiene un job distinto: "
+                             f"{manifest.get('endpoint')} {manifest.get('params')}")
+        return manifest
+
+    def _lote_path(self, nro_lote: int) -> str:
+        return os.path.join(self.job_dir, f"lote_{nro_lote:05d}.json")
+
+    def _save_lote(self, nro_lote: int, response_data: Any) -> int:
+        """Guarda los registros del lote y lo marca como completo. Retorna la cantidad de registros."""
+        records = []
+        if isinstance(response_data, dict):
+            records = response_data.get(self._list_keys[0], {}).get(self._list_keys[1]) or []
+        write_json_atomic(self._lote_path(nro_lote), records)
+        with self._lock:
+            completed = set(self.manifest["completed"])
+            completed.add(nro_lote)
+            self.manifest["completed"] = sorted(completed)
+            self.manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            write_json_atomic(self.manifest_path, self.manifest)
+        return len(records)
+
+    # --- Estado ---
+
+    @property
+    def total_lotes(self) -> Optional[int]:
+        return self.manifest["total_lotes"]
+
+    def missing_lotes(self) -> List[int]:
+        """Lotes que todavía no se descargaron (vacío si el job no arrancó)."""
+        if self.total_lotes is None:
+            return []
+        completed = set(self.manifest["completed"])
+        return [i for i in range(1, self.total_lotes + 1) if i not in completed]
+
+    @property
+    def done(self) -> bool:
+        return self.total_lotes is not None and not self.missing_lotes()
+
+    # --- Ejecución ---
+
+    def _fetch(self, nro_lote: int) -> Any:
+        return getattr(self.client, self._method)(**self.params, nro_lote=nro_lote)
+
+    def run(self, max_workers: Optional[int] = None) -> int:
+        """
+        Descarga los lotes que faltan, guardando cada uno apenas llega.
+
+        Si algún lote falla, el resto se sigue descargando y guardando; al
+        final se relanza la primera excepción. Volver a llamar a run()
+        reintenta solo los lotes faltantes.
+
+        Args:
+            max_workers: Lotes en paralelo (None usa el valor del cliente)
+
+        Returns:
+            Cantidad de lotes descargados en esta corrida
+        """
+        workers = self.client.max_workers if max_workers is None else max(1, max_workers)
+        fetched = 0
+
+        if self.total_lotes is None:
+            response_data = self._fetch(1)
+            cant_str = response_data.get(self._count_key, "") if isinstance(response_data, dict) else ""
+            lote_info = parse_lote_info(cant_str)
+            if lote_info is None:
+                logger.warning(f"No se pudo parsear total de lotes de: {cant_str}. Asumiendo 1 lote.")
+            with self._lock:
+                self.manifest["total_lotes"] = lote_info[1] if lote_info else 1
+                self.manifest["docs"] = parse_doc_count(cant_str)
+            self._save_lote(1, response_data)
+            fetched += 1
+
+        missing = self.missing_lotes()
+        if not missing:
+            logger.info(f"Job {self.job_dir}: completo ({self.total_lotes} lotes)")
+            return fetched
+        logger.info(f"Job {self.job_dir}: {len(missing)}/{self.total_lotes} lotes pendientes")
+
+        errors: Dict[int, Exception] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._fetch, i): i for i in missing}
+            for future in as_completed(futures):
+                nro_lote = futures[future]
+                try:
+                    count = self._save_lote(nro_lote, future.result())
+                    fetched += 1
+                    logger.info(f"Lote {nro_lote}/{self.total_lotes} guardado: {count} registros")
+                except Exception as e:
+                    logger.error(f"Lote {nro_lote}/{self.total_lotes} falló: {e}")
+                    errors[nro_lote] = e
+
+        if errors:
+            logger.error(f"Job {self.job_dir}: {len(errors)} lotes fallaron {sorted(errors)}; "
+                         f"volver a llamar a run() para reintentarlos")
+            raise errors[min(errors)]
+        return fetched
+
+    # --- Lectura ---
+
+    def records(self, raw: bool = False) -> Iterator[Union[Dict[str, Any], Any]]:
+        """
+        Itera los registros guardados, en orden de lote.
+
+        Args:
+            raw: Si True entrega dicts sin validar; si False, modelos Pydantic (Sale, Articulo, Cliente)
+        """
+        for nro_lote in self.manifest["completed"]:
+            with open(self._lote_path(nro_lote), encoding="utf-8") as f:
+                records = json.load(f)
+            yield from (records if raw else parse_list(records, self._model_class))
@@ -0,0 +1,138 @@
+"""
+Registros lazy: vistas sobre el JSON crudo que validan cada campo recién
+cuando se lee.
+
+Validar un Sale completo convierte ~140 campos aunque el proceso use 15.
+Un registro lazy guarda el dict de la API tal cual y, al leer un atributo,
+valida solo ese campo con el mismo alias y tipo del modelo Pydantic (un
+TypeAdapter por campo, creado la primera vez que se usa). El valor queda
+cacheado en el registro.
+
+Uso:
+    ventas = client.get_sales("2025-01-01", "2025-01-31", lazy=True)
+    for venta in ventas:
+        print(venta.nro_doc, venta.subtotal_final)   # solo se validan estos dos campos
+    venta.to_model()                                 # Sale completo, si hace falta
+"""
+import threading
+from typing import Annotated, Any, Dict, List, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class _LazyField:
+    """Descriptor de un campo: lee el alias del dict crudo y lo valida al primer acceso."""
+
+    __slots__ = ("name", "alias", "field", "_adapter")
+
+    def __init__(self, name: str, field: Any):
+        self.name = name
+        self.alias = field.alias or name
+        self.field = field
+        self._adapter = None
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        if self._adapter is None:
+            # field.annotation viene sin los validadores/restricciones de Annotated
+            # (ej: BeforeValidator de OptionalInt), que quedan en field.metadata
+            annotation = self.field.annotation
+            if self.field.metadata:
+                annotation = Annotated[(annotation, *self.field.metadata)]
+            self._adapter = TypeAdapter(annotation)
+        return self._adapter
+
+    def __get__(self, instance: "LazyRecord", owner: type) -> Any:
+        if instance is None:
+            return self
+        values = instance._values
+        value = values.get(self.name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        raw_value = instance._raw.get(self.alias, _MISSING)
+        if raw_value is _MISSING:
+            if self.field.is_required():
+                raise ValidationError.from_exception_data(
+                    owner.model_class.__name__,
+                    [{"type": "missing", "loc": (self.alias,), "input": instance._raw}],
+                )
+            value = self.field.get_default(call_default_factory=True)
+        else:
+            value = self.adapter.validate_python(raw_value)
+        values[self.name] = value
+        return value
+
+    def __set__(self, instance: "LazyRecord", value: Any) -> None:
+        raise AttributeError(f"{self.name} es de solo lectura")
+
+
+class LazyRecord:
+    """
+    Base de los registros lazy. Cada subclase (ver lazy_class) tiene un
+    descriptor por campo del modelo.
+    """
+
+    __slots__ = ("_raw", "_values")
+    model_class: Type[BaseModel] = None
+
+    def __init__(self, raw: Dict[str, Any]):
+        self._raw = raw
+        self._values: Dict[str, Any] = {}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Dict original de la API (claves = alias)."""
+        return self._raw
+
+    def to_model(self) -> BaseModel:
+        """Valida el registro completo y retorna el modelo Pydantic."""
+        return self.model_class.model_validate(self._raw)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and other._raw == self._raw
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        loaded = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+        return f"{type(self).__name__}({loaded or '...'})"
+
+
+_lazy_classes: Dict[type, type] = {}
+_lazy_lock = threading.Lock()
+
+
+def lazy_class(model_class: Type[BaseModel]) -> Type[LazyRecord]:
+    """Clase lazy (cacheada) para model_class, con los mismos nombres de campo."""
+    cls = _lazy_classes.get(model_class)
+    if cls is None:
+        with _lazy_lock:
+            cls = _lazy_classes.get(model_class)
+            if cls is None:
+                namespace = {name: _LazyField(name, field) for name, field in model_class.model_fields.items()}
+                namespace.update({"__slots__": (), "model_class": model_class})
+                cls = type(f"Lazy{model_class.__name__}", (LazyRecord,), namespace)
+                _lazy_classes[model_class] = cls
+    return cls
+
+
+def parse_lazy(data: Any, model_class: Type[BaseModel]) -> List[LazyRecord]:
+    """
+    Envuelve una lista de dicts en registros lazy de model_class, sin
+    validar nada todavía. Los ítems que no son dicts se descartan.
+    """
+    if not isinstance(data, list):
+        logger.warning(f"Se esperaba una lista, se recibió: {type(data)}")
+        return []
+    cls = lazy_class(model_class)
+    records = [cls(item) for item in data if isinstance(item, dict)]
+    if len(records) != len(data):
+        logger.error(f"{len(data) - len(records)} ítems de {model_class.__name__} no son objetos JSON; descartados")
+    return records
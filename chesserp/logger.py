@@ -10,17 +10,21 @@ class LoggerConfig:
     """
     _initialized = False
     _logger = None
+    _handlers = []
 
     @classmethod
     def setup(cls, 
-              log_file: str = "chesserp.log", 
+              log_file: Optional[str] = "chesserp.log", 
               level: int = logging.DEBUG,
-              console_output: bool = True) -> logging.Logger:
+              console_output: bool = True,
+              force: bool = False) -> logging.Logger:
         """
         Configura el logger raíz. Debe llamarse una vez al inicio de la aplicación.
         Si no se llama explícitamente, get_logger() lo inicializará con valores por defecto.
+        Con log_file=None no se escribe archivo (ej: tests). force=True reemplaza
+        una configuración anterior (como logging.basicConfig(force=True)).
         """
-        if cls._initialized:
+        if cls._initialized and not force:
             return cls._logger
 
         # Configurar logger raíz
@@ -30,20 +34,27 @@ class LoggerConfig:
         # Limpiar handlers existentes para evitar duplicados
         if root_logger.hasHandlers():
             root_logger.handlers.clear()
+        # Con force, cerrar el archivo de la configuración anterior
+        for handler in cls._handlers:
+            handler.close()
+        cls._handlers = []
 
         formatter = logging.Formatter(
             '%(asctime)s | %(levelname)s | %(name)s | %(module)s | %(message)s'
         )
 
         # Handler Archivo
-        try:
-            log_path = os.path.join(os.getcwd(), log_file)
-            file_handler = logging.FileHandler(log_path, encoding='utf-8')
-            file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
-        except IOError as e:
-            print(f"Warning: Could not create log file {log_file}: {e}")
+        if log_file is not None:
+            try:
+                log_path = os.path.join(os.getcwd(), log_file)
+                # delay: el archivo se crea con el primer mensaje, no al configurar
+                file_handler = logging.FileHandler(log_path, encoding='utf-8', delay=True)
+                file_handler.setLevel(level)
+                file_handler.setFormatter(formatter)
+                root_logger.addHandler(file_handler)
+                cls._handlers.append(file_handler)
+            except IOError as e:
+                print(f"Warning: Could not create log file {log_file}: {e}")
 
         # Handler Consola
         if console_output:
@@ -0,0 +1,259 @@
+"""
+Métricas de requests, decodificación y parseo.
+
+Los clientes (ChessClient, ChessWebClient) reportan cada etapa a un objeto
+de métricas opcional:
+
+- on_request: latencia y bytes recibidos de cada intento HTTP
+- on_decode: tiempo de decodificar el JSON de la respuesta
+- on_parse: tiempo y registros validados por _parse_list
+- on_batch: registros y tiempo de descarga de cada lote (nroLote)
+- on_retry / on_relogin: reintentos y renovaciones de sesión
+
+BaseMetrics no hace nada; para recibir los eventos se hereda y se
+sobreescriben los hooks necesarios. InMemoryMetrics acumula un resumen por
+endpoint y los lotes más lentos; OpenTelemetryMetrics los publica como
+histogramas y contadores de OpenTelemetry.
+
+Uso:
+    from chesserp.metrics import InMemoryMetrics
+
+    metrics = InMemoryMetrics()
+    client = ChessClient.from_env(prefix="EMPRESA1_", metrics=metrics)
+    client.get_sales("2025-01-01", "2025-01-31")
+    print(metrics.summary()["endpoints"])
+    print(metrics.slowest_batches(5))
+"""
+import heapq
+import threading
+from typing import Any, Dict, List, Optional
+
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BaseMetrics:
+    """
+    Interfaz de hooks de métricas. Todos los métodos son no-op.
+    Se llaman desde los hilos de los clientes: las implementaciones deben
+    ser thread-safe y rápidas.
+    """
+
+    def on_request(self, client: str, endpoint: str, status: Optional[int],
+                   elapsed: float, size: int) -> None:
+        """Un intento HTTP terminado (status None si falló la conexión)."""
+
+    def on_decode(self, client: str, endpoint: str, elapsed: float) -> None:
+        """JSON de la respuesta decodificado."""
+
+    def on_parse(self, client: str, model: str, records: int, elapsed: float) -> None:
+        """Lista validada a modelos Pydantic."""
+
+    def on_batch(self, client: str, dataset: str, nro_lote: int, total_lotes: int,
+                 records: int, elapsed: Optional[float]) -> None:
+        """
+        Lote de un endpoint paginado recibido. elapsed es el tiempo de
+        descarga y decodificación (None si el lote venía de un sondeo previo).
+        """
+
+    def on_retry(self, client: str, description: str, reason: str, delay: float) -> None:
+        """Reintento programado por la RetryPolicy."""
+
+    def on_relogin(self, client: str, reason: str) -> None:
+        """Sesión renovada: reason es "401" o "max_age"."""
+
+
+class _Stat:
+    """Contador + suma + máximo de una serie de duraciones."""
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class InMemoryMetrics(BaseMetrics):
+    """
+    Acumula las métricas en memoria: latencia, bytes y errores por endpoint,
+    tiempo de decodificación, tiempo de parseo por modelo, reintentos,
+    re-logins y los top_batches lotes más lentos.
+    """
+
+    def __init__(self, top_batches: int = 20):
+        self.top_batches = top_batches
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests: Dict[str, _Stat] = {}
+            self._bytes: Dict[str, int] = {}
+            self._errors: Dict[str, int] = {}
+            self._decode: Dict[str, _Stat] = {}
+            self._parse: Dict[str, _Stat] = {}
+            self._records: Dict[str, int] = {}
+            self._batches: Dict[str, _Stat] = {}
+            self._slow_batches: List[tuple] = []
+            self._seq = 0
+            self._retries: Dict[str, int] = {}
+            self._relogins: Dict[str, int] = {}
+
+    def on_request(self, client, endpoint, status, elapsed, size):
+        with self._lock:
+            self._requests.setdefault(endpoint, _Stat()).add(elapsed)
+            self._bytes[endpoint] = self._bytes.get(endpoint, 0) + size
+            if status is None or status >= 400:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def on_decode(self, client, endpoint, elapsed):
+        with self._lock:
+            self._decode.setdefault(endpoint, _Stat()).add(elapsed)
+
+    def on_parse(self, client, model, records, elapsed):
+        with self._lock:
+            self._parse.setdefault(model, _Stat()).add(elapsed)
+            self._records[model] = self._records.get(model, 0) + records
+
+    def on_batch(self, client, dataset, nro_lote, total_lotes, records, elapsed):
+        if elapsed is None:
+            return
+        with self._lock:
+            self._batches.setdefault(dataset, _Stat()).add(elapsed)
+            # Min-heap acotado: en la raíz queda el más rápido de los guardados
+            self._seq += 1
+            entry = (elapsed, self._seq, {
+                "client": client, "dataset": dataset, "nro_lote": nro_lote,
+                "total_lotes": total_lotes, "records": records, "elapsed": elapsed,
+            })
+            if len(self._slow_batches) < self.top_batches:
+                heapq.heappush(self._slow_batches, entry)
+            elif self._slow_batches and elapsed > self._slow_batches[0][0]:
+                heapq.heapreplace(self._slow_batches, entry)
+
+    def on_retry(self, client, description, reason, delay):
+        with self._lock:
+            self._retries[reason] = self._retries.get(reason, 0) + 1
+
+    def on_relogin(self, client, reason):
+        with self._lock:
+            self._relogins[reason] = self._relogins.get(reason, 0) + 1
+
+    def slowest_endpoints(self, n: int = 5) -> List[Dict[str, Any]]:
+        """Endpoints ordenados por tiempo total de requests (mayor primero)."""
+        endpoints = self.summary()["endpoints"]
+        ranked = sorted(endpoints.items(), key=lambda item: item[1]["total"], reverse=True)
+        return [{"endpoint": endpoint, **stats} for endpoint, stats in ranked[:n]]
+
+    def slowest_batches(self, n: int = 5) -> List[Dict[str, Any]]:
+        """Los n lotes más lentos (mayor primero), de entre los top_batches guardados."""
+        with self._lock:
+            ranked = sorted(self._slow_batches, reverse=True)
+        return [dict(entry[2]) for entry in ranked[:n]]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resumen acumulado:
+            endpoints: {endpoint: {count, total, mean, max, bytes, errors, decode}}
+            parse: {modelo: {count, total, mean, max, records}}
+            batches: {dataset: {count, total, mean, max}}
+            retries: {motivo: cantidad}
+            relogins: {motivo: cantidad}
+        """
+        with self._lock:
+            return {
+                "endpoints": {
+                    endpoint: {
+                        **stat.as_dict(),
+                        "bytes": self._bytes.get(endpoint, 0),
+                        "errors": self._errors.get(endpoint, 0),
+                        "decode": self._decode[endpoint].total if endpoint in self._decode else 0.0,
+                    }
+                    for endpoint, stat in self._requests.items()
+                },
+                "parse": {
+                    model: {**stat.as_dict(), "records": self._records.get(model, 0)}
+                    for model, stat in self._parse.items()
+                },
+                "batches": {dataset: stat.as_dict() for dataset, stat in self._batches.items()},
+                "retries": dict(self._retries),
+                "relogins": dict(self._relogins),
+            }
+
+
+class OpenTelemetryMetrics(BaseMetrics):
+    """
+    Publica los hooks como instrumentos de OpenTelemetry:
+
+    - chesserp.request.duration (s) y chesserp.response.size (By), por client/endpoint/status
+    - chesserp.decode.duration y chesserp.parse.duration (s)
+    - chesserp.batch.records y chesserp.batch.duration (s), por dataset
+    - chesserp.retries y chesserp.relogins (contadores, por motivo)
+
+    Requiere opentelemetry-api (pip install chesserp-api[otel]) salvo que se
+    pase un meter propio. La exportación (OTLP, Prometheus, ...) se configura
+    en el MeterProvider de la aplicación.
+    """
+
+    def __init__(self, meter: Any = None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics as otel_metrics
+            except ImportError:  # pragma: no cover - dependencia opcional
+                raise ImportError("OpenTelemetryMetrics requiere opentelemetry-api. "
+                                  "Instalar con: pip install chesserp-api[otel]")
+            meter = otel_metrics.get_meter("chesserp")
+
+        self._request_duration = meter.create_histogram(
+            "chesserp.request.duration", unit="s", description="Latencia de cada intento HTTP")
+        self._response_size = meter.create_histogram(
+            "chesserp.response.size", unit="By", description="Bytes recibidos por respuesta")
+        self._decode_duration = meter.create_histogram(
+            "chesserp.decode.duration", unit="s", description="Decodificación JSON de la respuesta")
+        self._parse_duration = meter.create_histogram(
+            "chesserp.parse.duration", unit="s", description="Validación Pydantic de una lista")
+        self._batch_records = meter.create_histogram(
+            "chesserp.batch.records", unit="{record}", description="Registros por lote")
+        self._batch_duration = meter.create_histogram(
+            "chesserp.batch.duration", unit="s", description="Descarga de un lote")
+        self._retries = meter.create_counter(
+            "chesserp.retries", unit="{retry}", description="Reintentos por fallas transitorias")
+        self._relogins = meter.create_counter(
+            "chesserp.relogins", unit="{login}", description="Renovaciones de sesión")
+
+    def on_request(self, client, endpoint, status, elapsed, size):
+        attributes = {"client": client, "endpoint": endpoint, "status": status or 0}
+        self._request_duration.record(elapsed, attributes)
+        self._response_size.record(size, attributes)
+
+    def on_decode(self, client, endpoint, elapsed):
+        self._decode_duration.record(elapsed, {"client": client, "endpoint": endpoint})
+
+    def on_parse(self, client, model, records, elapsed):
+        self._parse_duration.record(elapsed, {"client": client, "model": model})
+
+    def on_batch(self, client, dataset, nro_lote, total_lotes, records, elapsed):
+        attributes = {"client": client, "dataset": dataset}
+        self._batch_records.record(records, attributes)
+        if elapsed is not None:
+            self._batch_duration.record(elapsed, attributes)
+
+    def on_retry(self, client, description, reason, delay):
+        self._retries.add(1, {"client": client, "reason": reason})
+
+    def on_relogin(self, client, reason):
+        self._relogins.add(1, {"client": client, "reason": reason})
@@ -0,0 +1,152 @@
+"""
+Parseo de respuestas de la API a modelos Pydantic.
+
+Compartido por ChessClient, AsyncChessClient y ChessWebClient.
+"""
+import json
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def loads(body: Union[bytes, str]) -> Any:
+    """
+    Decodifica JSON directamente desde los bytes de la respuesta.
+    Usa orjson si está instalado (pip install chesserp-api[fast]); si no, json.
+    Ambos lanzan un ValueError si el body no es JSON válido.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def parse_lote_info(cant_str: str) -> Optional[Tuple[int, int]]:
+    """
+    Extrae (lote_actual, total_lotes) del string de lotes que devuelve la API.
+
+    Formato: "Numero de lote obtenido: 1/70. Cantidad de comprobantes totales: 69041"
+    Retorna None si el string no tiene el formato esperado.
+    """
+    match = re.search(r'(\d+)/(\d+)', cant_str or "")
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_doc_count(cant_str: str) -> Optional[int]:
+    """
+    Extrae la cantidad total de comprobantes del string de lotes
+    ("... Cantidad de comprobantes totales: 69041"). None si no figura.
+    """
+    match = re.search(r'totales:\s*(\d+)', cant_str or "")
+    return int(match.group(1)) if match else None
+
+
+# Un TypeAdapter(List[Model]) por modelo. Construirlo compila el validador,
+# así que se hace una sola vez por proceso.
+_list_adapters: Dict[type, TypeAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def list_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter cacheado para validar una lista completa de model_class."""
+    adapter = _list_adapters.get(model_class)
+    if adapter is None:
+        with _adapters_lock:
+            adapter = _list_adapters.get(model_class)
+            if adapter is None:
+                adapter = TypeAdapter(List[model_class])
+                _list_adapters[model_class] = adapter
+    return adapter
+
+
+def parse_list(data: Any, model_class: Type[BaseModel], bulk: bool = True) -> List[Any]:
+    """
+    Parsea una lista de dicts a modelos Pydantic.
+
+    Con bulk=True valida el lote entero en una sola llamada (el loop corre
+    dentro de pydantic-core). Si algún registro del lote es inválido, se
+    vuelve a validar ítem por ítem: el registro fallido se loguea y se
+    descarta, y el resto se conserva.
+    """
+    if not isinstance(data, list):
+        logger.warning(f"Se esperaba una lista, se recibió: {type(data)}")
+        return []
+
+    if bulk:
+        try:
+            return list_adapter(model_class).validate_python(data)
+        except ValidationError as e:
+            logger.debug(f"Validación en bloque de {model_class.__name__} falló ({e.error_count()} errores); "
+                         f"reintentando ítem por ítem")
+
+    parsed_items = []
+    for index, item in enumerate(data):
+        try:
+            parsed_items.append(model_class(**item))
+        except Exception as e:
+            # Loguear el error específico y el ítem que falló
+            logger.error(f"Error parseando ítem #{index} en {model_class.__name__}: {e}. Ítem fallido: {item}")
+    return parsed_items
+
+
+# Modelos proyectados por (modelo, campos pedidos): create_model compila un
+# validador nuevo, así que también se cachean.
+_projections: Dict[Tuple[type, FrozenSet[str]], Tuple[Type[BaseModel], Tuple[str, ...]]] = {}
+
+
+def projection(model_class: Type[BaseModel], fields: Iterable[str]) -> Tuple[Type[BaseModel], Tuple[str, ...]]:
+    """
+    Modelo reducido de model_class con solo los campos pedidos (nombres
+    snake_case del modelo) y los alias de la API a conservar de cada registro.
+
+    Los campos mantienen su alias, tipo y default, y el orden del modelo
+    original. Un nombre que no es campo de model_class lanza ValueError.
+    """
+    requested = frozenset(fields)
+    key = (model_class, requested)
+    cached = _projections.get(key)
+    if cached is not None:
+        return cached
+
+    unknown = requested.difference(model_class.model_fields)
+    if unknown:
+        raise ValueError(f"Campos desconocidos para {model_class.__name__}: {', '.join(sorted(unknown))}")
+    if not requested:
+        raise ValueError("fields no puede estar vacío")
+
+    selected = {name: field for name, field in model_class.model_fields.items() if name in requested}
+    with _adapters_lock:
+        cached = _projections.get(key)
+        if cached is None:
+            projected = create_model(
+                f"{model_class.__name__}Projection",
+                __module__=model_class.__module__,
+                **{name: (field.annotation, field) for name, field in selected.items()},
+            )
+            aliases = tuple(field.alias or name for name, field in selected.items())
+            cached = _projections[key] = (projected, aliases)
+    return cached
+
+
+def project_records(data: Any, aliases: Tuple[str, ...]) -> Any:
+    """
+    Reduce cada dict de la lista a las claves de aliases (las que falten se
+    omiten). Lo que no es lista o dict se deja igual para que el parseo lo
+    reporte como siempre.
+    """
+    if not isinstance(data, list):
+        return data
+    return [{alias: item[alias] for alias in aliases if alias in item} if isinstance(item, dict) else item
+            for item in data]
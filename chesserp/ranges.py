@@ -0,0 +1,120 @@
+"""
+División de rangos de fechas en ventanas para descargas en paralelo.
+
+Uso:
+    from chesserp.ranges import split_date_range
+
+    split_date_range("2025-01-15", "2025-03-10", window="month")
+    # [("2025-01-15", "2025-01-31"), ("2025-02-01", "2025-02-28"), ("2025-03-01", "2025-03-10")]
+"""
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional, Tuple, Union
+
+DATE_FORMAT = "%Y-%m-%d"
+
+WINDOWS = ("day", "week", "month")
+
+DateLike = Union[str, date]
+
+
+def to_date(value: DateLike) -> date:
+    """Convierte un string YYYY-MM-DD (o date/datetime) a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, DATE_FORMAT).date()
+
+
+def _window_end(start: date, window: str) -> date:
+    if window == "day":
+        return start
+    if window == "week":
+        # Semanas calendario (lunes a domingo)
+        return start + timedelta(days=6 - start.weekday())
+    return date(start.year, start.month, monthrange(start.year, start.month)[1])
+
+
+def split_date_range(fecha_desde: DateLike,
+                     fecha_hasta: DateLike,
+                     window: str = "month") -> List[Tuple[str, str]]:
+    """
+    Divide [fecha_desde, fecha_hasta] en ventanas consecutivas sin solaparse.
+
+    Las ventanas siguen el calendario (día, semana lunes-domingo o mes), así
+    que la primera y la última pueden quedar recortadas por el rango.
+
+    Args:
+        fecha_desde: Fecha inicio (YYYY-MM-DD o date)
+        fecha_hasta: Fecha fin inclusive (YYYY-MM-DD o date)
+        window: "day", "week" o "month"
+
+    Returns:
+        Lista de (fecha_desde, fecha_hasta) en formato YYYY-MM-DD, en orden
+    """
+    if window not in WINDOWS:
+        raise ValueError(f"window debe ser uno de {WINDOWS}, se recibió: {window!r}")
+    start, end = to_date(fecha_desde), to_date(fecha_hasta)
+    if start > end:
+        raise ValueError(f"fecha_desde ({start}) es posterior a fecha_hasta ({end})")
+
+    windows = []
+    while start <= end:
+        window_end = min(_window_end(start, window), end)
+        windows.append((start.strftime(DATE_FORMAT), window_end.strftime(DATE_FORMAT)))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+def halve_range(fecha_desde: DateLike, fecha_hasta: DateLike) -> List[Tuple[str, str]]:
+    """
+    Parte un rango en dos mitades contiguas (por días). Un rango de un solo
+    día no se puede partir y se devuelve tal cual.
+    """
+    start, end = to_date(fecha_desde), to_date(fecha_hasta)
+    if start >= end:
+        return [(start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT))]
+    mid = start + timedelta(days=(end - start).days // 2)
+    return [
+        (start.strftime(DATE_FORMAT), mid.strftime(DATE_FORMAT)),
+        ((mid + timedelta(days=1)).strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)),
+    ]
+
+
+class WorkUnit:
+    """
+    Unidad de trabajo de una descarga adaptativa: una o más ventanas
+    contiguas que un mismo worker descarga en secuencia.
+
+    lotes y docs salen del lote 1 de cada ventana (sondeo); elapsed y
+    records se completan al descargar la unidad.
+    """
+
+    def __init__(self):
+        self.windows: List[Tuple[str, str]] = []
+        self.lotes = 0
+        self.docs: Optional[int] = 0
+        self.elapsed: Optional[float] = None
+        self.records: Optional[int] = None
+        # Respuesta del lote 1 de cada ventana, para no volver a pedirla
+        self.first_responses: List[Any] = []
+
+    def add(self, window: Tuple[str, str], lotes: int, docs: Optional[int], first_response: Any) -> None:
+        self.windows.append(window)
+        self.lotes += lotes
+        self.docs = None if docs is None or self.docs is None else self.docs + docs
+        self.first_responses.append(first_response)
+
+    @property
+    def fecha_desde(self) -> str:
+        return self.windows[0][0]
+
+    @property
+    def fecha_hasta(self) -> str:
+        return self.windows[-1][1]
+
+    def __repr__(self) -> str:
+        elapsed = f"{self.elapsed:.2f}s" if self.elapsed is not None else None
+        return (f"WorkUnit({self.fecha_desde}..{self.fecha_hasta}, ventanas={len(self.windows)}, "
+                f"lotes={self.lotes}, docs={self.docs}, elapsed={elapsed}, records={self.records})")
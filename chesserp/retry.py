@@ -0,0 +1,165 @@
+"""
+Política de reintentos para fallas transitorias de la API.
+
+Reintenta errores de conexión, timeouts de lectura y respuestas 429/502/503/504
+con backoff exponencial y jitter, respetando el header Retry-After y un
+tiempo total máximo (deadline). Los 500 no se reintentan: en ChessERP suelen
+ser errores del request, no del servidor sobrecargado.
+
+Uso:
+    from chesserp.retry import RetryPolicy, NO_RETRY
+
+    client = ChessClient.from_env(prefix="EMPRESA1_", retry=RetryPolicy(max_attempts=6, deadline=300))
+    client = ChessClient.from_env(prefix="EMPRESA1_", retry=NO_RETRY)   # sin reintentos
+"""
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Iterable, Optional
+
+import requests
+
+from chesserp.exceptions import DeadlineExceeded
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Segundos a esperar según un header Retry-After (segundos o fecha HTTP).
+    None si el header no está o no se puede interpretar.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Reintentos con backoff exponencial y "full jitter": antes del intento n
+    se espera un tiempo al azar entre 0 y min(backoff_max, backoff_base * 2^(n-1)).
+    El jitter evita que varios hilos que fallaron juntos vuelvan a pegarle
+    al servidor en el mismo instante.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 4,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 deadline: Optional[float] = 120.0,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 retry_connect_errors: bool = True,
+                 retry_read_timeouts: bool = True,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            max_attempts: Intentos totales, contando el primero (1 = sin reintentos)
+            backoff_base: Espera base en segundos para el primer reintento
+            backoff_max: Tope de espera entre intentos
+            deadline: Tiempo total máximo en segundos desde el primer intento (None = sin tope)
+            retry_statuses: Códigos HTTP que se reintentan
+            retry_connect_errors: Reintentar errores de conexión
+            retry_read_timeouts: Reintentar timeouts de lectura
+            sleep: Función de espera (reemplazable en tests)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connect_errors = retry_connect_errors
+        self.retry_read_timeouts = retry_read_timeouts
+        self._sleep = sleep
+
+    def backoff(self, attempt: int) -> float:
+        """Espera antes del reintento número attempt (1 = primer reintento)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        # ConnectTimeout es a la vez ConnectionError y Timeout: cuenta como error de conexión
+        if isinstance(error, requests.ConnectionError):
+            return self.retry_connect_errors
+        if isinstance(error, requests.ReadTimeout):
+            return self.retry_read_timeouts
+        return False
+
+    def _can_retry(self, attempt: int, started: float, delay: float) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        return self.deadline is None or time.monotonic() - started + delay <= self.deadline
+
+    def call(self,
+             send: Callable[[], requests.Response],
+             description: str = "request",
+             on_retry: Optional[Callable[[str, str, float], None]] = None,
+             expires: Optional[float] = None) -> requests.Response:
+        """
+        Ejecuta send() reintentando las fallas transitorias.
+
+        Args:
+            send: Función que hace un intento y retorna la respuesta
+            description: Texto para los logs (ej: "GET ventas/")
+            on_retry: Callback (description, motivo, espera) antes de cada reintento
+            expires: Vencimiento (time.monotonic()) de la llamada que hace el
+                     request, ej: el deadline de get_sales. Una espera que lo
+                     pasaría (backoff o Retry-After) no se hace
+
+        Returns:
+            La última respuesta. Si se agotan los intentos con un status
+            reintentable, se retorna esa respuesta y el llamador decide el error.
+
+        Raises:
+            requests.RequestException: La última excepción, si no es reintentable
+                                       o se agotaron los intentos
+            DeadlineExceeded: Si esperar para reintentar pasaría expires
+        """
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                response = send()
+            except requests.RequestException as e:
+                if not self.is_retryable_error(e):
+                    raise
+                delay = self.backoff(attempt)
+                if not self._can_retry(attempt, started, delay):
+                    logger.warning(f"{description}: {type(e).__name__} tras {attempt} intentos, sin más reintentos")
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status_code not in self.retry_statuses:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = retry_after if retry_after is not None else self.backoff(attempt)
+                if not self._can_retry(attempt, started, delay):
+                    logger.warning(f"{description}: status {response.status_code} tras {attempt} intentos, "
+                                   f"sin más reintentos")
+                    return response
+                reason = f"status {response.status_code}"
+
+            if expires is not None and time.monotonic() + delay >= expires:
+                raise DeadlineExceeded(f"{description}: {reason}; el reintento en {delay:.2f}s "
+                                       f"pasaría el deadline")
+
+            logger.warning(f"{description}: {reason}. Reintento {attempt}/{self.max_attempts - 1} en {delay:.2f}s")
+            if on_retry is not None:
+                on_retry(description, reason, delay)
+            self._sleep(delay)
+            attempt += 1
+
+
+# Política sin reintentos (un único intento)
+NO_RETRY = RetryPolicy(max_attempts=1)
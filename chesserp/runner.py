@@ -0,0 +1,187 @@
+"""
+Extracción en paralelo para varias empresas (prefijos de .env).
+
+Uso:
+    from chesserp.runner import ExtractionTask, MultiCompanyRunner
+
+    tasks = [
+        *ExtractionTask.for_ranges("get_sales", [("2025-01-01", "2025-01-31"),
+                                                 ("2025-02-01", "2025-02-28")], detallado=True),
+        ExtractionTask(endpoint="get_articles"),
+        ExtractionTask(endpoint="get_customers", params={"raw": True}),
+    ]
+    runner = MultiCompanyRunner(["EMPRESA1_", "EMPRESA2_"], tasks, max_per_server=2)
+    results = runner.run()
+    ventas_e1 = results["EMPRESA1_"].results["get_sales[2025-01-01..2025-01-31]"]
+
+    # O enviar cada resultado (o cada lote, con iter_*_batches) a un sink
+    def to_disk(company, task, data): ...
+    MultiCompanyRunner(prefixes, tasks, sinks=[to_disk], keep_results=False).run()
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from chesserp.client import ChessClient
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sink: recibe (prefijo de empresa, tarea, datos). Con endpoints iter_*_batches
+# se llama una vez por lote; con el resto, una vez con el resultado completo.
+Sink = Callable[[str, "ExtractionTask", Any], None]
+
+
+class ExtractionTask(BaseModel):
+    """
+    Una extracción a ejecutar en cada empresa: método de ChessClient + parámetros.
+    """
+    endpoint: str = Field(description="Método de ChessClient (ej: get_sales, iter_sales_batches)")
+    params: Dict[str, Any] = Field(default_factory=dict)
+    name: Optional[str] = Field(None, description="Clave del resultado (default: derivada de endpoint y fechas)")
+
+    @property
+    def key(self) -> str:
+        if self.name:
+            return self.name
+        desde, hasta = self.params.get("fecha_desde"), self.params.get("fecha_hasta")
+        if desde or hasta:
+            return f"{self.endpoint}[{desde}..{hasta}]"
+        return self.endpoint
+
+    @classmethod
+    def for_ranges(cls,
+                   endpoint: str,
+                   date_ranges: Sequence[Tuple[str, str]],
+                   **params) -> List["ExtractionTask"]:
+        """Una tarea por rango (fecha_desde, fecha_hasta) con los mismos parámetros."""
+        return [
+            cls(endpoint=endpoint, params={**params, "fecha_desde": desde, "fecha_hasta": hasta})
+            for desde, hasta in date_ranges
+        ]
+
+
+class CompanyResult:
+    """Resultados de una empresa: datos por tarea, errores por tarea y duración."""
+
+    def __init__(self, company: str):
+        self.company = company
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.elapsed: Dict[str, float] = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"CompanyResult({self.company!r}, results={list(self.results)}, errors={list(self.errors)})"
+
+
+class MultiCompanyRunner:
+    """
+    Ejecuta las mismas extracciones para varias empresas en paralelo.
+
+    Todas las combinaciones (empresa, tarea) comparten un pool de hilos;
+    además, cada servidor (api_url) tiene un límite propio de tareas
+    simultáneas, porque varias empresas pueden vivir en el mismo servidor.
+    El error de una tarea no corta las demás: queda en CompanyResult.errors.
+    """
+
+    def __init__(self,
+                 prefixes: Sequence[str],
+                 tasks: Sequence[ExtractionTask],
+                 max_workers: int = 8,
+                 max_per_server: int = 2,
+                 sinks: Optional[Sequence[Sink]] = None,
+                 keep_results: bool = True,
+                 env_file: Optional[str] = None,
+                 client_kwargs: Optional[Dict[str, Any]] = None,
+                 client_factory: Optional[Callable[[str], ChessClient]] = None):
+        """
+        Args:
+            prefixes: Prefijos de variables de entorno (ej: ["EMPRESA1_", "EMPRESA2_"])
+            tasks: Extracciones a correr en cada empresa
+            max_workers: Tareas simultáneas en total
+            max_per_server: Tareas simultáneas por api_url
+            sinks: Funciones que reciben cada resultado (o lote) a medida que llega
+            keep_results: Si False, los datos solo van a los sinks (no se acumulan)
+            env_file: Archivo .env opcional para ChessClient.from_env
+            client_kwargs: Parámetros extra del constructor (ej: {"max_workers": 4})
+            client_factory: Alternativa a from_env: recibe el prefijo y retorna el cliente
+        """
+        for task in tasks:
+            if not task.endpoint.startswith(("get_", "iter_", "export_")) or not hasattr(ChessClient, task.endpoint):
+                raise ValueError(f"Endpoint no soportado: {task.endpoint}")
+
+        self.prefixes = list(prefixes)
+        self.tasks = list(tasks)
+        self.max_workers = max_workers
+        self.max_per_server = max_per_server
+        self.sinks = list(sinks or [])
+        self.keep_results = keep_results
+        self._client_factory = client_factory or (
+            lambda prefix: ChessClient.from_env(prefix=prefix, env_file=env_file, **(client_kwargs or {}))
+        )
+        self.clients: Dict[str, ChessClient] = {}
+        self._server_limits: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _server_limit(self, client: ChessClient) -> threading.BoundedSemaphore:
+        return self._server_limits.setdefault(client.api_url, threading.BoundedSemaphore(self.max_per_server))
+
+    def _run_task(self, prefix: str, task: ExtractionTask) -> Tuple[Any, float]:
+        client = self.clients[prefix]
+        with self._server_limit(client):
+            start = time.perf_counter()
+            logger.info(f"[{client.name}] {task.key}: inicio")
+            data = getattr(client, task.endpoint)(**task.params)
+
+            if task.endpoint.startswith("iter_"):
+                # Streaming: cada elemento (lote o registro) va directo a los sinks
+                collected = [] if self.keep_results else None
+                for item in data:
+                    for sink in self.sinks:
+                        sink(prefix, task, item)
+                    if collected is not None:
+                        collected.append(item)
+                data = collected
+            else:
+                for sink in self.sinks:
+                    sink(prefix, task, data)
+
+            elapsed = time.perf_counter() - start
+            logger.info(f"[{client.name}] {task.key}: fin en {elapsed:.1f}s")
+            return (data if self.keep_results else None), elapsed
+
+    def run(self) -> Dict[str, CompanyResult]:
+        """
+        Ejecuta todas las tareas en todas las empresas.
+
+        Returns:
+            Dict prefijo -> CompanyResult
+        """
+        results = {prefix: CompanyResult(prefix) for prefix in self.prefixes}
+        for prefix in self.prefixes:
+            if prefix not in self.clients:
+                self.clients[prefix] = self._client_factory(prefix)
+
+        jobs = [(prefix, task) for task in self.tasks for prefix in self.prefixes]
+        logger.info(f"MultiCompanyRunner: {len(jobs)} tareas en {len(self.prefixes)} empresas")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._run_task, prefix, task): (prefix, task) for prefix, task in jobs}
+            for future in as_completed(futures):
+                prefix, task = futures[future]
+                try:
+                    data, elapsed = future.result()
+                    results[prefix].elapsed[task.key] = elapsed
+                    if self.keep_results:
+                        results[prefix].results[task.key] = data
+                except Exception as e:
+                    logger.error(f"[{prefix}] {task.key} falló: {e}")
+                    results[prefix].errors[task.key] = e
+
+        return results
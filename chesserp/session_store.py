@@ -0,0 +1,174 @@
+"""
+Persistencia de sesiones entre ejecuciones.
+
+Cada proceso nuevo arranca con un login (POST a auth/login o el form login
+de Spring en ChessWebClient). Con un session store, el sessionId/JSESSIONID
+se guarda por servidor y usuario y los procesos siguientes lo reutilizan
+hasta que la API lo rechace (401): arrancar no cuesta ningún round-trip de
+autenticación.
+
+Uso:
+    from chesserp.session_store import FileSessionStore, SQLiteSessionStore
+
+    store = FileSessionStore("data/chess_sessions.json")
+    client = ChessClient.from_env(prefix="EMPRESA1_", session_store=store)
+    web = ChessWebClient.from_env(prefix="EMPRESA1_", session_store=store)
+
+El archivo contiene sesiones válidas: se crea con permisos 0600 y no
+debería compartirse ni versionarse.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def make_session_key(api_url: str, username: str, kind: str = "api") -> str:
+    """
+    Clave de una sesión: servidor + usuario + tipo ("api" para el sessionId
+    de ChessClient/AsyncChessClient, "web" para el JSESSIONID de ChessWebClient).
+    """
+    return f"{kind}|{api_url.rstrip('/')}|{username}"
+
+
+class BaseSessionStore:
+    """
+    Interfaz de los session stores.
+    Las implementaciones deben ser seguras para usar desde varios hilos.
+    """
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Retorna (session_id, created_at en epoch) o None si no hay sesión guardada."""
+        raise NotImplementedError
+
+    def set(self, key: str, session_id: str, created_at: Optional[float] = None) -> None:
+        """Guarda la sesión (created_at default: ahora)."""
+        raise NotImplementedError
+
+    def delete(self, key: str, session_id: Optional[str] = None) -> None:
+        """
+        Borra la sesión guardada. Si se pasa session_id, solo la borra si
+        coincide: otro proceso puede haber guardado una más nueva.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class FileSessionStore(BaseSessionStore):
+    """
+    Sesiones en un archivo JSON. Cada escritura relee el archivo y lo
+    reemplaza atómicamente desde un temporal propio, así que varios procesos
+    pueden compartirlo: nunca se lee un archivo a medio escribir, pero si
+    dos procesos guardan a la vez gana la última escritura (el otro vuelve
+    a loguearse la próxima vez). Con muchos procesos concurrentes conviene
+    SQLiteSessionStore.
+    """
+
+    def __init__(self, path: str = "chesserp_sessions.json"):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, object]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"No se pudo leer {self.path}: {e}. Se ignora.")
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, object]]) -> None:
+        # Temporal con nombre único en el mismo directorio: dos procesos que
+        # escriben a la vez no se pisan el temporal, y os.replace es atómico
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".", suffix=".tmp", dir=directory)
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            entry = self._read().get(key)
+        if not entry:
+            return None
+        return entry["session_id"], entry["created_at"]
+
+    def set(self, key: str, session_id: str, created_at: Optional[float] = None) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = {"session_id": session_id, "created_at": created_at or time.time()}
+            self._write(data)
+
+    def delete(self, key: str, session_id: Optional[str] = None) -> None:
+        with self._lock:
+            data = self._read()
+            entry = data.get(key)
+            if entry and (session_id is None or entry["session_id"] == session_id):
+                del data[key]
+                self._write(data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._write({})
+
+
+class SQLiteSessionStore(BaseSessionStore):
+    """
+    Sesiones en un archivo SQLite (conviene con muchos procesos concurrentes).
+    """
+
+    def __init__(self, path: str = "chesserp_sessions.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " key TEXT PRIMARY KEY,"
+                " session_id TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT session_id, created_at FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, session_id: str, created_at: Optional[float] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (key, session_id, created_at) VALUES (?, ?, ?)",
+                (key, session_id, created_at or time.time()),
+            )
+
+    def delete(self, key: str, session_id: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            if session_id is None:
+                self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+            else:
+                self._conn.execute("DELETE FROM sessions WHERE key = ? AND session_id = ?", (key, session_id))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions")
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,265 @@
+"""
+Sincronización incremental de ventas contra un dataset local.
+
+En vez de re-descargar todos los meses en cada corrida, SalesSync guarda un
+checkpoint por empresa y por día y solo pide a la API los días que faltan,
+los marcados para refrescar y una ventana final de días recientes (para
+levantar anulaciones y comprobantes cargados tarde).
+
+Estructura en disco:
+    {data_dir}/{empresa}/sync_state.json        # checkpoints por día
+    {data_dir}/{empresa}/ventas/2025-01-15.json # registros raw de ese día
+
+Uso:
+    client = ChessClient.from_env(prefix="EMPRESA1_")
+    sync = SalesSync(client, data_dir="data/sync", recheck_days=3)
+    sync.sync("2024-01-01")           # primera vez: backfill completo
+    sync.sync("2024-01-01")           # siguientes: solo el delta
+    ventas = list(sync.load("2025-01-01", "2025-01-31"))
+"""
+import json
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from chesserp.client import ChessClient
+from chesserp.logger import get_logger
+from chesserp.ranges import DATE_FORMAT, DateLike, to_date
+
+logger = get_logger(__name__)
+
+
+def _record_day(record: Dict[str, Any]) -> Optional[date]:
+    """Día del comprobante (campo fechaComprobate). None si no se puede interpretar."""
+    raw_value = record.get("fechaComprobate")
+    if not raw_value:
+        return None
+    text = str(raw_value)[:10]
+    for fmt in (DATE_FORMAT, "%d/%m/%Y"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Escritura atómica: un corte a mitad de escritura no deja el archivo
+    corrupto. El temporal tiene nombre único, así dos escritores del mismo
+    archivo no se pisan el temporal.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def group_ranges(days: Iterable[date], max_days: int = 31) -> List[Tuple[date, date]]:
+    """
+    Agrupa días en rangos contiguos (fecha_desde, fecha_hasta) de a lo sumo max_days.
+    """
+    ranges: List[Tuple[date, date]] = []
+    for day in sorted(set(days)):
+        if ranges:
+            start, end = ranges[-1]
+            if day == end + timedelta(days=1) and (day - start).days < max_days:
+                ranges[-1] = (start, day)
+                continue
+        ranges.append((day, day))
+    return ranges
+
+
+class SalesSync:
+    """
+    Sincroniza ventas de una empresa de forma incremental (ver docstring del módulo).
+    """
+
+    def __init__(self,
+                 client: ChessClient,
+                 data_dir: str = "data/sync",
+                 company: Optional[str] = None,
+                 recheck_days: int = 3,
+                 empresas: str = "",
+                 detallado: bool = True,
+                 max_window_days: int = 31):
+        """
+        Args:
+            client: ChessClient de la empresa a sincronizar
+            data_dir: Directorio raíz del dataset local
+            company: Nombre de la empresa en disco (default: client.name)
+            recheck_days: Días anteriores a hoy que se vuelven a pedir siempre (hoy
+                          se pide en todas las corridas, también con 0)
+            empresas: Filtro de empresas para get_sales
+            detallado: Nivel de detalle para get_sales
+            max_window_days: Tamaño máximo de cada rango pedido a la API
+        """
+        self.client = client
+        self.company = company or client.name
+        self.recheck_days = recheck_days
+        self.empresas = empresas
+        self.detallado = detallado
+        self.max_window_days = max_window_days
+
+        self.base_dir = os.path.join(data_dir, self.company)
+        self.sales_dir = os.path.join(self.base_dir, "ventas")
+        self.state_path = os.path.join(self.base_dir, "sync_state.json")
+        os.makedirs(self.sales_dir, exist_ok=True)
+        self.state = self._load_state()
+
+    # --- Estado ---
+
+    def _load_state(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_path):
+            return {"days": {}, "refresh": []}
+        with open(self.state_path, encoding="utf-8") as f:
+            state = json.load(f)
+        state.setdefault("days", {})
+        state.setdefault("refresh", [])
+        return state
+
+    def _save_state(self) -> None:
+        write_json_atomic(self.state_path, self.state)
+
+    def mark_for_refresh(self, *days: DateLike) -> None:
+        """Marca días ya sincronizados para que la próxima sync los vuelva a pedir."""
+        refresh: Set[str] = set(self.state["refresh"])
+        refresh.update(to_date(d).strftime(DATE_FORMAT) for d in days)
+        self.state["refresh"] = sorted(refresh)
+        self._save_state()
+
+    def synced_days(self) -> Dict[str, str]:
+        """Días sincronizados -> timestamp ISO de la última descarga."""
+        return dict(self.state["days"])
+
+    # --- Planificación ---
+
+    def pending_days(self,
+                     fecha_desde: DateLike,
+                     fecha_hasta: Optional[DateLike] = None,
+                     today: Optional[date] = None) -> List[date]:
+        """
+        Días del rango que hay que pedir a la API: nuevos, marcados para
+        refrescar o dentro de la ventana de re-chequeo: hoy (siempre, porque
+        todavía se cargan comprobantes) y los recheck_days días anteriores.
+        """
+        today = today or date.today()
+        start = to_date(fecha_desde)
+        end = min(to_date(fecha_hasta), today) if fecha_hasta else today
+        recheck_from = today - timedelta(days=self.recheck_days)
+        synced = self.state["days"]
+        refresh = set(self.state["refresh"])
+
+        pending = []
+        day = start
+        while day <= end:
+            key = day.strftime(DATE_FORMAT)
+            if key not in synced or key in refresh or day >= recheck_from:
+                pending.append(day)
+            day += timedelta(days=1)
+        return pending
+
+    # --- Sincronización ---
+
+    def sync(self,
+             fecha_desde: DateLike,
+             fecha_hasta: Optional[DateLike] = None,
+             today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Descarga los días pendientes y los mezcla en el dataset local.
+
+        Cada día descargado reemplaza por completo su archivo (así se
+        reflejan anulaciones). El checkpoint se guarda después de cada
+        rango, de modo que un corte solo pierde el rango en curso.
+
+        Un día sin registros en la respuesta se guarda como archivo vacío y
+        queda sincronizado: get_sales recorrió todos los lotes del rango, así
+        que la API confirmó que no tiene ventas. La excepción es un rango con
+        registros de fecha ilegible (podrían ser de cualquier día): ahí los
+        días vacíos no se marcan y se vuelven a pedir en la próxima corrida.
+
+        Returns:
+            Dict día (YYYY-MM-DD) -> cantidad de registros guardados
+        """
+        pending = self.pending_days(fecha_desde, fecha_hasta, today)
+        ranges = group_ranges(pending, self.max_window_days)
+        logger.info(f"[{self.company}] Sync de ventas: {len(pending)} días pendientes en {len(ranges)} rangos")
+
+        written: Dict[str, int] = {}
+        for start, end in ranges:
+            desde, hasta = start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+            logger.info(f"[{self.company}] Descargando ventas {desde} a {hasta}")
+            records = self.client.get_sales(desde, hasta, empresas=self.empresas,
+                                            detallado=self.detallado, raw=True)
+            written.update(self._merge(records, start, end))
+
+        return written
+
+    def _merge(self, records: List[Dict[str, Any]], start: date, end: date) -> Dict[str, int]:
+        """Reparte los registros por día, reescribe cada archivo y actualiza el checkpoint."""
+        by_day: Dict[date, List[Dict[str, Any]]] = {}
+        day = start
+        while day <= end:
+            by_day[day] = []
+            day += timedelta(days=1)
+
+        outside = unreadable = 0
+        for record in records:
+            record_day = _record_day(record)
+            if record_day in by_day:
+                by_day[record_day].append(record)
+            elif record_day is None:
+                unreadable += 1
+            else:
+                outside += 1
+        if outside:
+            logger.warning(f"[{self.company}] {outside} registros con fecha fuera de {start}..{end}; no se guardan")
+        if unreadable:
+            # Un día vacío puede no serlo: no se confirma hasta una corrida sin fechas ilegibles
+            empty = [day for day, day_records in by_day.items() if not day_records]
+            for day in empty:
+                del by_day[day]
+            logger.warning(f"[{self.company}] {unreadable} registros con fecha ilegible en {start}..{end}; "
+                           f"no se guardan y {len(empty)} días sin registros quedan pendientes")
+
+        now = datetime.now().isoformat(timespec="seconds")
+        refresh = set(self.state["refresh"])
+        written = {}
+        for day, day_records in by_day.items():
+            key = day.strftime(DATE_FORMAT)
+            write_json_atomic(os.path.join(self.sales_dir, f"{key}.json"), day_records)
+            self.state["days"][key] = now
+            refresh.discard(key)
+            written[key] = len(day_records)
+
+        self.state["refresh"] = sorted(refresh)
+        self._save_state()
+        return written
+
+    # --- Lectura ---
+
+    def load(self,
+             fecha_desde: Optional[DateLike] = None,
+             fecha_hasta: Optional[DateLike] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Itera los registros raw del dataset local, en orden de fecha.
+        """
+        start = to_date(fecha_desde) if fecha_desde else None
+        end = to_date(fecha_hasta) if fecha_hasta else None
+        for filename in sorted(os.listdir(self.sales_dir)):
+            if not filename.endswith(".json"):
+                continue
+            day = to_date(filename[:-5])
+            if (start and day < start) or (end and day > end):
+                continue
+            with open(os.path.join(self.sales_dir, filename), encoding="utf-8") as f:
+                yield from json.load(f)
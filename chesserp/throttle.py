@@ -0,0 +1,264 @@
+"""
+Limitador de tasa y de requests simultáneos por servidor ERP.
+
+Cada empresa tiene un único servidor ChessERP on-premise; al paralelizar
+lotes, ventanas y empresas es fácil saturarlo. HostLimiter combina:
+
+- token bucket: a lo sumo `rate` requests por segundo, con ráfagas de hasta `burst`
+- max_in_flight: a lo sumo N requests en curso a la vez
+
+Los limitadores se comparten por api_url (limiter_for), así que todos los
+clientes (ChessClient, ChessWebClient, AsyncChessClient) de un mismo
+servidor, en cualquier hilo o tarea async, respetan el mismo límite.
+
+Uso:
+    client = ChessClient.from_env(prefix="EMPRESA1_", max_workers=8, rate_limit=10, max_in_flight=4)
+    ...
+    print(client.limiter.stats())   # tiempo esperado por tasa y por slots
+"""
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from chesserp.exceptions import DeadlineExceeded
+from chesserp.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _wake(waiter: "asyncio.Future") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class HostLimiter:
+    """
+    Token bucket + límite de requests en curso para un servidor.
+    Thread-safe; usable desde hilos (slot) y desde asyncio (aslot).
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 max_in_flight: Optional[int] = None,
+                 name: str = ""):
+        """
+        Args:
+            rate: Requests por segundo (None = sin límite de tasa)
+            burst: Requests que pueden salir de golpe (default: max(1, rate))
+            max_in_flight: Requests simultáneos (None = sin límite)
+            name: Nombre para logs (ej: api_url)
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+        # Slots libres, compartidos por hilos y tareas async: los hilos esperan
+        # en la condición y las tareas en un future que release() despierta
+        # en su loop (sin sondeo)
+        self._free = max_in_flight or 0
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        # Métricas
+        self._requests = 0
+        self._in_flight = 0
+        self._rate_wait = 0.0
+        self._slot_wait = 0.0
+        self._max_wait = 0.0
+        self._waited = 0
+
+    def _reserve(self) -> float:
+        """
+        Reserva un token y retorna cuánto hay que esperar para usarlo.
+        El saldo puede quedar negativo: representa la cola de reservas.
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _record(self, slot_wait: float, rate_wait: float) -> None:
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._slot_wait += slot_wait
+            self._rate_wait += rate_wait
+            wait = slot_wait + rate_wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait > 0:
+                self._waited += 1
+
+    def _unreserve(self) -> None:
+        """Devuelve un token reservado que no se va a usar."""
+        if self.rate:
+            with self._lock:
+                self._tokens += 1
+
+    def _acquire(self, expires: Optional[float] = None) -> float:
+        """
+        Toma un slot (bloqueando el hilo) y retorna cuánto se esperó.
+        Con expires (time.monotonic()) lanza DeadlineExceeded si no hay slot a tiempo.
+        """
+        if not self.max_in_flight:
+            return 0.0
+        with self._slot_freed:
+            if self._free > 0:
+                self._free -= 1
+                return 0.0
+            start = time.monotonic()
+            while self._free == 0:
+                if expires is None:
+                    self._slot_freed.wait()
+                    continue
+                remaining = expires - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"Deadline vencido esperando un slot de {self.name or 'servidor'}")
+                self._slot_freed.wait(remaining)
+            self._free -= 1
+            return time.monotonic() - start
+
+    async def _aacquire(self) -> float:
+        """Igual que _acquire pero esperando en un future del loop actual."""
+        if not self.max_in_flight:
+            return 0.0
+        loop = asyncio.get_running_loop()
+        start = None
+        while True:
+            with self._lock:
+                if self._free > 0:
+                    self._free -= 1
+                    return 0.0 if start is None else time.monotonic() - start
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            if start is None:
+                start = time.monotonic()
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def _release(self, recorded: bool) -> None:
+        """Libera el slot; recorded indica si el request llegó a contarse en curso."""
+        with self._lock:
+            if recorded:
+                self._in_flight -= 1
+            if not self.max_in_flight:
+                return
+            self._free += 1
+            self._slot_freed.notify()
+            # Se despiertan todas las tareas: una cancelada no puede perder el aviso
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:  # loop cerrado
+                pass
+
+    @contextmanager
+    def slot(self, expires: Optional[float] = None) -> Iterator[None]:
+        """
+        Espera un slot libre y un token; el request se hace dentro del bloque.
+        Con expires (time.monotonic(), ej: el deadline de la llamada) no espera
+        más allá: lanza DeadlineExceeded sin ocupar el slot ni el token.
+        """
+        slot_wait = self._acquire(expires)
+        recorded = False
+        try:
+            rate_wait = self._reserve()
+            if expires is not None and time.monotonic() + rate_wait >= expires:
+                self._unreserve()
+                raise DeadlineExceeded(f"Deadline vencido esperando la tasa de {self.name or 'servidor'} "
+                                       f"({rate_wait:.2f}s)")
+            if rate_wait > 0:
+                time.sleep(rate_wait)
+            self._record(slot_wait, rate_wait)
+            recorded = True
+            yield
+        finally:
+            self._release(recorded)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """
+        Igual que slot() pero sin bloquear el event loop. Si la tarea se
+        cancela mientras espera la tasa o durante el request, el slot se libera.
+        """
+        slot_wait = await self._aacquire()
+        recorded = False
+        try:
+            rate_wait = self._reserve()
+            if rate_wait > 0:
+                await asyncio.sleep(rate_wait)
+            self._record(slot_wait, rate_wait)
+            recorded = True
+            yield
+        finally:
+            self._release(recorded)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Métricas acumuladas: requests, en curso, segundos esperados por tasa
+        y por slots, espera máxima y cantidad de requests que esperaron.
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "in_flight": self._in_flight,
+                "rate_wait": self._rate_wait,
+                "slot_wait": self._slot_wait,
+                "max_wait": self._max_wait,
+                "waited": self._waited,
+            }
+
+    def __repr__(self) -> str:
+        return f"HostLimiter({self.name!r}, rate={self.rate}, burst={self.burst}, max_in_flight={self.max_in_flight})"
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(api_url: str,
+                rate: Optional[float] = None,
+                burst: Optional[int] = None,
+                max_in_flight: Optional[int] = None) -> HostLimiter:
+    """
+    Retorna el HostLimiter compartido de api_url, creándolo la primera vez.
+
+    La configuración se toma de la primera llamada; si una llamada posterior
+    pide otra, se mantiene la existente y se loguea un warning. Sin
+    parámetros, solo busca (o crea uno sin límites).
+    """
+    key = api_url.rstrip("/")
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = HostLimiter(rate, burst, max_in_flight, name=key)
+            _limiters[key] = limiter
+            logger.debug(f"Limitador creado: {limiter}")
+        elif (rate, burst, max_in_flight) != (None, None, None) and (
+                (rate, max_in_flight) != (limiter.rate, limiter.max_in_flight)
+                or (burst is not None and burst != limiter.burst)):
+            logger.warning(f"{key} ya tiene limitador ({limiter}); se ignora rate={rate}, "
+                           f"burst={burst}, max_in_flight={max_in_flight}")
+        return limiter
+
+
+def reset_limiters() -> None:
+    """Descarta todos los limitadores compartidos (útil en tests)."""
+    with _limiters_lock:
+        _limiters.clear()
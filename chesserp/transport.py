@@ -0,0 +1,167 @@
+"""
+Piezas compartidas por los clientes HTTP.
+
+- RequestSender: envío de un request por el limitador del servidor, con
+  latencia y bytes reportados a metrics (ChessClient, ChessWebClient)
+- SessionIdMixin: sessionId de la API oficial (header Cookie), renovación
+  por 401 o session_max_age y reutilización desde el session_store
+  (ChessClient, AsyncChessClient). El login y el lock single-flight quedan
+  en cada cliente: uno usa threading.Lock y el otro asyncio.Lock.
+- load_stored_session: sesión guardada reutilizable (los tres clientes)
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from chesserp.logger import get_logger
+from chesserp.metrics import BaseMetrics
+from chesserp.session_store import BaseSessionStore
+from chesserp.throttle import HostLimiter
+
+logger = get_logger(__name__)
+
+
+def cookie_header(session_id: str) -> Dict[str, str]:
+    """Header Cookie para un sessionId (la API a veces lo devuelve sin el prefijo JSESSIONID=)."""
+    return {"Cookie": session_id if "JSESSIONID=" in session_id else f"JSESSIONID={session_id}"}
+
+
+def load_stored_session(store: Optional[BaseSessionStore],
+                        key: str,
+                        rejected: Optional[str] = None,
+                        max_age: Optional[float] = None) -> Optional[Tuple[str, float]]:
+    """
+    (sesión, edad en segundos) guardada en store para key, salvo que sea la
+    rechazada por la API o tenga max_age o más. None si no hay una utilizable.
+    """
+    if store is None:
+        return None
+    stored = store.get(key)
+    if stored is None:
+        return None
+    session_id, created_at = stored
+    age = max(0.0, time.time() - created_at)
+    if session_id == rejected or (max_age is not None and age >= max_age):
+        return None
+    return session_id, age
+
+
+class RequestSender:
+    """
+    Mixin de envío de requests (requests.Session). La clase define name,
+    limiter (HostLimiter o None), metrics (BaseMetrics o None) y, si sus
+    llamadas tienen deadline, _deadline (threading.local con expires).
+    """
+
+    name: str
+    limiter: Optional[HostLimiter] = None
+    metrics: Optional[BaseMetrics] = None
+    _deadline: Optional[threading.local] = None
+
+    def _send(self,
+              send: Callable[..., requests.Response],
+              *args,
+              metric: Optional[str] = None,
+              **kwargs) -> requests.Response:
+        """
+        Ejecuta un request pasando por el limitador del servidor, si hay uno.
+        Con metric (nombre del endpoint) reporta latencia y bytes a self.metrics;
+        la espera del limitador no se cuenta como latencia. Dentro de una
+        llamada con deadline, la espera del limitador no lo pasa.
+        """
+        if self.limiter is None:
+            return self._observe(metric, send, *args, **kwargs)
+        with self.limiter.slot(self._deadline_expires()):
+            return self._observe(metric, send, *args, **kwargs)
+
+    def _deadline_expires(self) -> Optional[float]:
+        """Vencimiento (time.monotonic()) del deadline de la llamada en curso en este hilo, o None."""
+        return getattr(self._deadline, "expires", None)
+
+    def _observe(self, metric: Optional[str], send: Callable[..., requests.Response], *args, **kwargs) -> requests.Response:
+        if self.metrics is None or metric is None:
+            return send(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = send(*args, **kwargs)
+        except requests.RequestException:
+            self.metrics.on_request(self.name, metric, None, time.perf_counter() - start, 0)
+            raise
+        self.metrics.on_request(self.name, metric, response.status_code,
+                                time.perf_counter() - start, len(response.content))
+        return response
+
+    def _on_retry(self, description: str, reason: str, delay: float) -> None:
+        if self.metrics is not None:
+            self.metrics.on_retry(self.name, description, reason, delay)
+
+
+class SessionIdMixin:
+    """
+    Estado de sesión por sessionId. La clase define name, session_store,
+    session_max_age, _session_key y, si reporta re-logins, metrics.
+    """
+
+    name: str
+    metrics: Optional[BaseMetrics] = None
+    session_store: Optional[BaseSessionStore] = None
+    session_max_age: Optional[float] = None
+    base_headers: Dict[str, str]
+    _session_key: str
+    _session_id: Optional[str] = None
+    _session_started: Optional[float] = None
+
+    @property
+    def session_age(self) -> Optional[float]:
+        """Segundos desde el último login (None si no hay sesión)."""
+        if self._session_started is None:
+            return None
+        return time.monotonic() - self._session_started
+
+    def _session_usable(self, session_id: Optional[str], stale_session_id: Optional[str]) -> bool:
+        if not session_id or session_id == stale_session_id:
+            return False
+        return self.session_max_age is None or self.session_age < self.session_max_age
+
+    def _set_session(self, session_id: str, age: float = 0.0) -> None:
+        # Se reemplaza el dict de headers (no se modifica) porque otros hilos
+        # pueden estar usando el anterior
+        self.base_headers = cookie_header(session_id)
+        self._session_started = time.monotonic() - age
+        self._session_id = session_id
+
+    def _discard_session(self, stale_session_id: Optional[str]) -> None:
+        """
+        Registra por qué se renueva la sesión actual (401 o session_max_age).
+        Se llama con el lock de login tomado y la sesión ya no utilizable.
+        """
+        session_id = self._session_id
+        if session_id and session_id == stale_session_id:
+            logger.warning(f"[{self.name}] Sesión rechazada (401). Renovando login...")
+            if self.session_store is not None:
+                self.session_store.delete(self._session_key, session_id)
+            if self.metrics is not None:
+                self.metrics.on_relogin(self.name, "401")
+        elif session_id:
+            logger.info(f"[{self.name}] Sesión con {self.session_age:.0f}s (máximo {self.session_max_age}s). "
+                        f"Renovando login...")
+            if self.metrics is not None:
+                self.metrics.on_relogin(self.name, "max_age")
+        else:
+            logger.debug("Not find sessionId")
+
+    def _restore_session(self, stale_session_id: Optional[str] = None) -> Optional[str]:
+        """
+        Adopta la sesión del session_store (guardada por este u otro proceso),
+        salvo que sea la rechazada o supere session_max_age. None si no hay.
+        """
+        stored = load_stored_session(self.session_store, self._session_key,
+                                     rejected=stale_session_id, max_age=self.session_max_age)
+        if stored is None:
+            return None
+        session_id, age = stored
+        logger.info(f"[{self.name}] Reutilizando sesión guardada (creada hace {age:.0f}s)")
+        self._set_session(session_id, age)
+        return session_id
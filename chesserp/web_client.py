@@ -1,12 +1,22 @@
 import os
 import logging
-from typing import List, Optional, Dict, Any, Union
+import threading
+import time
+from typing import List, Optional, Dict, Any, Sequence, Union
+from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
 
+from chesserp.compact import CompactRecord, to_compact
 from chesserp.exceptions import AuthError, ApiError
+from chesserp.metrics import BaseMetrics
 from chesserp.models.pricing import ListaPrecio, PrecioArticulo
+from chesserp.parsing import loads, parse_list, project_records, projection
+from chesserp.retry import RetryPolicy
+from chesserp.session_store import BaseSessionStore, make_session_key
+from chesserp.throttle import HostLimiter, limiter_for
+from chesserp.transport import RequestSender, load_stored_session
 from chesserp.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,7 +28,7 @@ WEB_API_PATH = "/web/api/"
 WEB_LOGIN_PATH = "/static/auth/j_spring_security_check"
 
 
-class ChessWebClient:
+class ChessWebClient(RequestSender):
     """
     Cliente para la API web interna de ChessERP (endpoints del frontend).
 
@@ -47,12 +57,26 @@ class ChessWebClient:
         password: str,
         timeout: int = 60,
         name: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        session_max_age: Optional[float] = None,
+        session_store: Optional[BaseSessionStore] = None,
+        metrics: Optional[BaseMetrics] = None,
     ):
         self.api_url = api_url.rstrip("/")
         self.username = username
         self.password = password
         self.timeout = timeout
         self.name = name or api_url
+        # Reintentos para fallas transitorias (conexión, 429/502/503/504)
+        self.retry = retry or RetryPolicy()
+        # Hooks de latencia, bytes, decodificación, parseo, reintentos y re-logins
+        self.metrics = metrics
+        # Límite de tasa / requests simultáneos, compartido con los demás clientes del servidor
+        self.limiter: Optional[HostLimiter] = None
+        if rate_limit or max_in_flight:
+            self.limiter = limiter_for(self.api_url, rate=rate_limit, max_in_flight=max_in_flight)
 
         self.base_url = self.api_url + WEB_API_PATH
         self._login_url = self.api_url + WEB_LOGIN_PATH
@@ -62,9 +86,19 @@ class ChessWebClient:
             "Cache-Control": "no-cache",
         })
         self._authenticated = False
+        # Login single-flight: cada login exitoso incrementa la generación; un
+        # hilo que recibe 401 solo se re-loguea si nadie lo hizo mientras esperaba.
+        # session_max_age (segundos) renueva la sesión antes de que venza.
+        self.session_max_age = session_max_age
+        self._session_generation = 0
+        self._session_started: Optional[float] = None
+        self._auth_lock = threading.Lock()
+        # JSESSIONID persistido entre ejecuciones (ver session_store)
+        self.session_store = session_store
+        self._session_key = make_session_key(self.api_url, username, kind="web")
 
     @classmethod
-    def from_env(cls, prefix: str = "", env_file: Optional[str] = None) -> "ChessWebClient":
+    def from_env(cls, prefix: str = "", env_file: Optional[str] = None, **kwargs) -> "ChessWebClient":
         """
         Crea un cliente desde variables de entorno.
 
@@ -72,6 +106,7 @@ class ChessWebClient:
             prefix: Prefijo para las variables (ej: "EMPRESA1_" busca
                     EMPRESA1_API_URL, EMPRESA1_USERNAME, EMPRESA1_PASSWORD)
             env_file: Ruta opcional a archivo .env
+            **kwargs: Parámetros adicionales del constructor (ej: timeout, retry)
         """
         if env_file:
             load_dotenv(env_file)
@@ -95,6 +130,7 @@ class ChessWebClient:
             username=username,
             password=password,
             name=prefix.rstrip("_") if prefix else None,
+            **kwargs
         )
 
     def login(self) -> None:
@@ -108,12 +144,14 @@ class ChessWebClient:
             "j_password": self.password,
         }
         try:
-            resp = self._session.post(
+            resp = self.retry.call(lambda: self._send(
+                self._session.post,
                 self._login_url,
                 data=payload,
                 allow_redirects=True,
                 timeout=self.timeout,
-            )
+                metric="auth/login",
+            ), "[web] login", on_retry=self._on_retry)
             resp.raise_for_status()
 
             if "JSESSIONID" not in self._session.cookies:
@@ -122,55 +160,115 @@ class ChessWebClient:
                     "Verificar usuario/contraseña."
                 )
 
+            self._session_started = time.monotonic()
+            self._session_generation += 1
             self._authenticated = True
+            if self.session_store is not None:
+                self.session_store.set(self._session_key, self._session.cookies.get("JSESSIONID"))
             logger.info(f"[{self.name}] Web authentication successful.")
 
         except requests.RequestException as e:
             raise AuthError(f"Connection error during web login: {str(e)}")
 
+    def _session_usable(self, stale_generation: Optional[int]) -> bool:
+        if not self._authenticated or self._session_generation == stale_generation:
+            return False
+        return (self.session_max_age is None or self._session_started is None
+                or time.monotonic() - self._session_started < self.session_max_age)
+
+    def _ensure_session(self, stale_generation: Optional[int] = None) -> int:
+        """
+        Garantiza una sesión autenticada y retorna su generación.
+        Solo un hilo hace login a la vez; los demás reutilizan la sesión nueva.
+
+        Args:
+            stale_generation: Generación de la sesión rechazada con 401
+        """
+        if self._session_usable(stale_generation):
+            return self._session_generation
+        with self._auth_lock:
+            if not self._session_usable(stale_generation):
+                rejected = None
+                if self._authenticated and self._session_generation == stale_generation:
+                    logger.warning("[web] Session expired (401). Retrying login...")
+                    rejected = self._session.cookies.get("JSESSIONID")
+                    if self.session_store is not None:
+                        self.session_store.delete(self._session_key, rejected)
+                    if self.metrics is not None:
+                        self.metrics.on_relogin(self.name, "401")
+                elif self._authenticated and self.metrics is not None:
+                    self.metrics.on_relogin(self.name, "max_age")
+                if not self._restore_session(rejected):
+                    self.login()
+            return self._session_generation
+
+    def _restore_session(self, rejected: Optional[str] = None) -> bool:
+        """
+        Carga en la sesión HTTP el JSESSIONID del session_store, salvo que sea
+        el rechazado o supere session_max_age. Retorna True si lo adoptó.
+        """
+        stored = load_stored_session(self.session_store, self._session_key,
+                                     rejected=rejected, max_age=self.session_max_age)
+        if stored is None:
+            return False
+        jsessionid, age = stored
+        logger.info(f"[{self.name}] Reutilizando sesión web guardada (creada hace {age:.0f}s)")
+        # Reemplazar cualquier JSESSIONID previo (puede tener otro path)
+        for cookie in [c for c in self._session.cookies if c.name == "JSESSIONID"]:
+            self._session.cookies.clear(cookie.domain, cookie.path, cookie.name)
+        self._session.cookies.set("JSESSIONID", jsessionid, domain=urlparse(self.api_url).hostname)
+        self._session_started = time.monotonic() - age
+        self._session_generation += 1
+        self._authenticated = True
+        return True
+
     def _get(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
         """
         Realiza un GET autenticado a la API web.
         Reintenta login automaticamente si la sesion expiro (401/redirect a login).
         """
-        if not self._authenticated:
-            self.login()
+        generation = self._ensure_session()
 
         if endpoint.startswith("/"):
             endpoint = endpoint[1:]
         url = self.base_url + endpoint
 
         try:
-            resp = self._session.get(url, params=params, timeout=self.timeout)
+            def _send() -> requests.Response:
+                return self._send(self._session.get, url, params=params, timeout=self.timeout, metric=endpoint)
+
+            resp = self.retry.call(_send, f"[web] GET {endpoint}", on_retry=self._on_retry)
 
             if resp.status_code == 401:
-                logger.warning("[web] Session expired (401). Retrying login...")
-                self.login()
-                resp = self._session.get(url, params=params, timeout=self.timeout)
+                self._ensure_session(stale_generation=generation)
+                resp = self.retry.call(_send, f"[web] GET {endpoint}", on_retry=self._on_retry)
 
             if resp.status_code != 200:
                 raise ApiError(resp.status_code, f"Web request to {endpoint} failed", resp.text)
 
-            return resp.json()
+            start = time.perf_counter()
+            try:
+                data = loads(resp.content)
+            except ValueError as e:
+                raise ApiError(resp.status_code, f"Invalid JSON from {endpoint}: {e}", resp.text[:200])
+            if self.metrics is not None:
+                self.metrics.on_decode(self.name, endpoint, time.perf_counter() - start)
+            return data
 
         except requests.RequestException as e:
             raise ApiError(500, f"Connection error: {str(e)}")
 
     def _parse_list(self, data: Any, model_class: Any) -> List[Any]:
         """
-        Parsea una lista de dicts a modelos Pydantic.
-        Si un elemento falla, lo loguea y continua con el resto.
+        Parsea una lista de dicts a modelos Pydantic (ver parsing.parse_list).
+        Valida el lote completo de una vez; si un elemento falla, lo loguea
+        y continúa con el resto.
         """
-        if not isinstance(data, list):
-            logger.warning(f"Se esperaba una lista, se recibió: {type(data)}")
-            return []
-
-        parsed = []
-        for i, item in enumerate(data):
-            try:
-                parsed.append(model_class(**item))
-            except Exception as e:
-                logger.error(f"Error parseando ítem #{i} en {model_class.__name__}: {e}")
+        if self.metrics is None:
+            return parse_list(data, model_class)
+        start = time.perf_counter()
+        parsed = parse_list(data, model_class)
+        self.metrics.on_parse(self.name, model_class.__name__, len(parsed), time.perf_counter() - start)
         return parsed
 
     # --- Listas de Precios ---
@@ -257,7 +355,9 @@ class ChessWebClient:
         solo_vigentes: bool = True,
         filtro_familia: str = "",
         raw: bool = False,
-    ) -> Union[List[PrecioArticulo], List[Dict[str, Any]]]:
+        fields: Optional[Sequence[str]] = None,
+        compact: bool = False,
+    ) -> Union[List[PrecioArticulo], List[Dict[str, Any]], List[CompactRecord]]:
         """
         Devuelve los articulos con precios de una lista especifica.
 
@@ -267,7 +367,12 @@ class ChessWebClient:
             solo_vigentes: Si True (default), solo precios vigentes al dia de hoy
             filtro_familia: Filtro por familia/grupo (vacio = todos los articulos)
             raw: Si True, retorna lista de dicts sin validar.
+            fields: Campos de PrecioArticulo a conservar (ej: ["cod_articulo", "precio"]);
+                    el resto de las claves se descarta antes de validar
+            compact: Si True, retorna registros compactos (chesserp.compact) en vez
+                     de modelos Pydantic, con los mismos nombres de campo
         """
+        model_class, aliases = (PrecioArticulo, None) if fields is None else projection(PrecioArticulo, fields)
         data = self.get_price_list_items_raw(
             id_lista, id_vigencia, solo_vigentes, filtro_familia
         )
@@ -275,6 +380,10 @@ class ChessWebClient:
 
         logger.info(f"Articulos obtenidos para lista {id_lista}: {len(items)}")
 
+        if aliases is not None:
+            items = project_records(items, aliases)
         if raw:
             return items
-        return self._parse_list(items, PrecioArticulo)
+        if compact:
+            return to_compact(self._parse_list(items, model_class), model_class)
+        return self._parse_list(items, model_class)
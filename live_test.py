@@ -398,12 +398,13 @@ class Testing:
 
     def _flatten_sales(self, data) -> list:
         """
-        Aplana Sale → SaleLine.
-        Una fila por cada combinación Venta/Línea.
+        Aplana Sale a filas Venta/Línea.
+        La API ya devuelve una fila por línea (VentasResumen), así que cada
+        Sale es una fila: encabezado del comprobante + columnas linea_*.
         """
         flat = []
         for venta in data:
-            venta_base = {
+            flat.append({
                 'id_empresa': venta.id_empresa,
                 'ds_empresa': venta.ds_empresa,
                 'id_documento': venta.id_documento,
@@ -420,24 +421,16 @@ class Testing:
                 'ds_vendedor': venta.ds_vendedor,
                 'subtotal_neto': venta.subtotal_neto,
                 'subtotal_final': venta.subtotal_final,
-            }
-            if not venta.lines:
-                flat.append({**venta_base, 'linea_id_articulo': None, 'linea_ds_articulo': None,
-                            'linea_cantidad': None, 'linea_precio_neto': None})
-                continue
-            for linea in venta.lines:
-                flat.append({
-                    **venta_base,
-                    'linea_id_linea': linea.id_linea,
-                    'linea_id_articulo': linea.id_articulo,
-                    'linea_ds_articulo': linea.ds_articulo,
-                    'linea_cantidades_total': linea.cantidades_total,
-                    'linea_precio_bruto': linea.precio_unitario_bruto,
-                    'linea_precio_neto': linea.precio_unitario_neto,
-                    'linea_bonificacion': linea.bonificacion,
-                    'linea_subtotal_neto': linea.subtotal_neto,
-                    'linea_subtotal_final': linea.subtotal_final,
-                })
+                'linea_id_linea': venta.id_linea,
+                'linea_id_articulo': venta.id_articulo,
+                'linea_ds_articulo': venta.ds_articulo,
+                'linea_cantidades_total': venta.cantidades_total,
+                'linea_precio_bruto': venta.precio_unitario_bruto,
+                'linea_precio_neto': venta.precio_unitario_neto,
+                'linea_bonificacion': venta.bonificacion,
+                'linea_subtotal_neto': venta.subtotal_neto,
+                'linea_subtotal_final': venta.subtotal_final,
+            })
         return flat
 
     def _flatten_articles(self, data) -> list:
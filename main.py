@@ -1,51 +1,28 @@
 from chesserp.client import ChessClient
-from live_test import Testing
-from datetime import date
-from calendar import monthrange
-import pandas as pd
+from chesserp.frames import sales_to_frame
 
 # Instanciar cliente desde variables de entorno con prefijo
 # Lee: EMPRESA2_API_URL, EMPRESA2_USERNAME, EMPRESA2_PASSWORD
 chess_client = ChessClient.from_env(prefix="EMPRESA2_")
-test = Testing(client=chess_client)
 
-# Lista para acumular todos los registros aplanados
-all_sales = []
-
-# Recorrer mes a mes desde enero 2024 hasta diciembre 2025
-for year in [2024, 2025]:
-    for month in range(1, 13):
-        # Calcular primer y último día del mes
-        first_day = date(year, month, 1)
-        last_day = date(year, month, monthrange(year, month)[1])
-
-        fecha_desde = first_day.strftime("%Y-%m-%d")
-        fecha_hasta = last_day.strftime("%Y-%m-%d")
-
-        print(f"Obteniendo ventas de {fecha_desde} a {fecha_hasta}...")
-
-        try:
-            data = chess_client.get_sales(
-                fecha_desde=fecha_desde,
-                fecha_hasta=fecha_hasta,
-                detallado=True,
-                empresas="1",
-            )
-
-            if data:
-                # Aplanar ventas -> una fila por cada línea de venta
-                flat_data = test._flatten_sales(data)
-                all_sales.extend(flat_data)
-                print(f"  -> {len(data)} ventas, {len(flat_data)} líneas")
-            else:
-                print(f"  -> Sin datos")
-
-        except Exception as e:
-            print(f"  -> Error: {e}")
-
-# Crear DataFrame y exportar a CSV
-if all_sales:
-    df_total = pd.DataFrame(all_sales)
+# Enero 2024 a diciembre 2025, en ventanas mensuales pedidas en paralelo
+print("Obteniendo ventas de 2024-01-01 a 2025-12-31...")
+data = chess_client.get_sales_range(
+    fecha_desde="2024-01-01",
+    fecha_hasta="2025-12-31",
+    window="month",
+    max_windows=4,
+    detallado=True,
+    empresas="1",
+    raw=True,
+)
+
+# Aplanar ventas -> una fila por cada línea de venta, directo desde el JSON crudo
+df_total = sales_to_frame(data)
+print(f"  -> {len(df_total)} líneas")
+
+# Exportar a CSV
+if len(df_total):
     df_total.to_csv('ventas_2024_2025.csv', index=False)
     print(f"\nExportado ventas_2024_2025.csv con {len(df_total)} líneas totales")
 else:
@@ -2,6 +2,12 @@ import pytest
 import requests_mock as rm
 
 from chesserp.client import ChessClient
+from chesserp.logger import setup_logger
+
+# Importar chesserp ya configuró el logging por defecto (el archivo se crea recién
+# con el primer mensaje): se reemplaza por uno sin archivo, así los tests no
+# escriben chesserp.log en el directorio de trabajo
+setup_logger(log_file=None, force=True)
 
 
 BASE_URL = "http://test-api.local"
@@ -0,0 +1,26 @@
+"""Test data factories shared by the test modules (import with: from factories import make_sale)."""
+
+
+def make_sale(nro_doc: int = 1, **overrides) -> dict:
+    """
+    Helper: builds a minimal sale line dict matching the API schema (alias keys).
+    overrides replaces or adds keys, e.g. make_sale(2, fechaComprobate="2025-02-01").
+    subtotalNeto is a string, as the API sometimes sends it.
+    """
+    sale = {
+        "idEmpresa": 1,
+        "dsEmpresa": "Empresa Test",
+        "idDocumento": "FCVTA",
+        "letra": "A",
+        "serie": 1,
+        "nrodoc": nro_doc,
+        "fechaComprobate": "2025-01-15",
+        "idSucursal": 1,
+        "idCliente": 1,
+        "idLinea": 1,
+        "idArticulo": 101,
+        "subtotalNeto": "10.5",
+        "subtotalFinal": 12.1,
+    }
+    sale.update(overrides)
+    return sale
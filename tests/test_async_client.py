@@ -0,0 +1,206 @@
+"""Tests for AsyncChessClient."""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from chesserp.async_client import AsyncChessClient
+from chesserp.exceptions import ApiError
+from chesserp.models.clients import Cliente
+from chesserp.models.sales import Sale
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+LOGIN_PATH = API_PATH + "auth/login"
+
+
+def _sales_page(nro_lote: int, total_lotes: int):
+    return {
+        "dsReporteComprobantesApi": {"VentasResumen": [make_sale(nro_lote)]},
+        "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{total_lotes}. Cantidad de comprobantes totales: {total_lotes}",
+    }
+
+
+class FakeServer:
+    """Handler para httpx.MockTransport que simula login + endpoints paginados."""
+
+    def __init__(self, total_lotes: int = 1, delay: float = 0.0):
+        self.total_lotes = total_lotes
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        if request.url.path == LOGIN_PATH:
+            return httpx.Response(200, json={"sessionId": "JSESSIONID=abc123"})
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        nro_lote = int(request.url.params.get("nroLote", 1))
+        if request.url.path.endswith("ventas/"):
+            return httpx.Response(200, json=_sales_page(nro_lote, self.total_lotes))
+        if request.url.path.endswith("clientes/"):
+            return httpx.Response(200, json={
+                "Clientes": {"eClientes": [{"idSucursal": 1, "idCliente": nro_lote}]},
+                "cantClientes": f"Numero de lote obtenido: {nro_lote}/{self.total_lotes}.",
+            })
+        if request.url.path.endswith("personalComercial/"):
+            return httpx.Response(500, text="boom")
+        return httpx.Response(404)
+
+
+def _make_client(server: FakeServer, **kwargs) -> AsyncChessClient:
+    c = AsyncChessClient(api_url=BASE_URL, username="u", password="p", **kwargs)
+    c._http = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return c
+
+
+class TestAsyncChessClient:
+
+    def test_get_sales_all_lotes_in_order(self):
+        server = FakeServer(total_lotes=5)
+
+        async def _run():
+            async with _make_client(server) as c:
+                return await c.get_sales("2025-01-01", "2025-01-31")
+
+        result = asyncio.run(_run())
+
+        assert all(isinstance(s, Sale) for s in result)
+        assert [s.nro_doc for s in result] == [1, 2, 3, 4, 5]
+
+    def test_concurrency_bounded_by_semaphore(self):
+        server = FakeServer(total_lotes=10, delay=0.01)
+
+        async def _run():
+            async with _make_client(server, max_concurrency=3) as c:
+                return await c.get_sales("2025-01-01", "2025-01-31", raw=True)
+
+        result = asyncio.run(_run())
+
+        assert len(result) == 10
+        assert 1 < server.max_in_flight <= 3
+
+    def test_login_once_and_cookie_sent(self):
+        server = FakeServer(total_lotes=3)
+
+        async def _run():
+            async with _make_client(server) as c:
+                await c.get_customers()
+
+        asyncio.run(_run())
+
+        logins = [r for r in server.requests if r.url.path == LOGIN_PATH]
+        assert len(logins) == 1
+        assert server.requests[-1].headers["Cookie"] == "JSESSIONID=abc123"
+
+    def test_get_customers_models(self):
+        server = FakeServer(total_lotes=2)
+
+        async def _run():
+            async with _make_client(server) as c:
+                return await c.get_customers()
+
+        result = asyncio.run(_run())
+
+        assert [c.id_cliente for c in result] == [1, 2]
+        assert all(isinstance(c, Cliente) for c in result)
+
+    def test_error_status_raises_api_error(self):
+        server = FakeServer()
+
+        async def _run():
+            async with _make_client(server) as c:
+                await c.get_staff()
+
+        with pytest.raises(ApiError) as exc_info:
+            asyncio.run(_run())
+
+        assert exc_info.value.status_code == 500
+
+
+def test_max_in_flight_limits_server_requests():
+    from chesserp.throttle import reset_limiters
+
+    reset_limiters()
+    server = FakeServer(total_lotes=8, delay=0.01)
+
+    async def _run():
+        async with _make_client(server, max_concurrency=5, max_in_flight=2) as c:
+            return await c.get_sales("2025-01-01", "2025-01-31", raw=True)
+
+    try:
+        result = asyncio.run(_run())
+    finally:
+        reset_limiters()
+
+    assert len(result) == 8
+    assert server.max_in_flight <= 2
+
+
+def test_concurrent_401_triggers_one_relogin():
+    logins = []
+
+    async def handler(request):
+        if request.url.path == LOGIN_PATH:
+            await asyncio.sleep(0.02)
+            logins.append(1)
+            return httpx.Response(200, json={"sessionId": f"JSESSIONID=s{len(logins)}"})
+        if request.headers.get("Cookie") != f"JSESSIONID=s{len(logins)}" or len(logins) < 2:
+            return httpx.Response(401, text="expired")
+        return httpx.Response(200, json={"PersonalComercial": {"ePersCom": []}})
+
+    async def _run():
+        c = AsyncChessClient(api_url=BASE_URL, username="u", password="p")
+        c._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with c:
+            await c.login()
+            return await asyncio.gather(*(c.get_staff() for _ in range(5)))
+
+    assert asyncio.run(_run()) == [[]] * 5
+    assert len(logins) == 2
+
+
+def test_export_sales_report_goes_through_limiter():
+    from chesserp.throttle import reset_limiters
+
+    reset_limiters()
+    sessions = []
+
+    async def handler(request):
+        if request.url.path == LOGIN_PATH:
+            sessions.append(f"JSESSIONID=s{len(sessions) + 1}")
+            return httpx.Response(200, json={"sessionId": sessions[-1]})
+        if request.headers.get("Cookie") != sessions[-1] or len(sessions) < 2:
+            return httpx.Response(401, text="expired")
+        if request.url.path.endswith("reporteComprobantesVta/exportarExcel"):
+            return httpx.Response(200, json={"pcArchivo": "/temp/ventas.xls"})
+        if request.url.path == "/temp/ventas.xls":
+            return httpx.Response(200, content=b"xls")
+        return httpx.Response(404)
+
+    async def _run():
+        c = AsyncChessClient(api_url=BASE_URL, username="u", password="p", max_in_flight=1)
+        c._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with c:
+            return await c.export_sales_report("2025-01-01", "2025-01-31"), c.limiter.stats()
+
+    try:
+        content, stats = asyncio.run(_run())
+    finally:
+        reset_limiters()
+
+    assert content == b"xls"
+    # 2 logins + POST rechazado (401) + POST reintentado + descarga
+    assert stats["requests"] == 5
@@ -0,0 +1,65 @@
+"""Smoke tests for the offline benchmark suite (fake server, client scenarios, model micro-benchmarks)."""
+
+import pytest
+
+from benchmarks.bench_client import SCENARIOS, run_scenario
+from benchmarks.bench_models import MODELS, compare, run_benchmarks
+from benchmarks.fake_server import FakeChessServer
+from chesserp.client import ChessClient
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeChessServer(lotes=3, records_per_lote=20, price_items=30) as s:
+        yield s
+
+
+class TestFakeServer:
+
+    def test_serves_paginated_sales(self, server):
+        client = ChessClient(api_url=server.url, username="bench", password="bench")
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31")
+
+        assert len(ventas) == server.records_per_endpoint
+        assert [v.nro_doc for v in ventas[:5]] == [0, 0, 0, 0, 1]
+
+
+class TestRunScenario:
+
+    @pytest.mark.parametrize("name", sorted(SCENARIOS))
+    def test_reports_throughput_and_stages(self, server, name):
+        result = run_scenario(server, name, workers=2, repeat=1)
+
+        expected = 30 if name == "price_list_items" else server.records_per_endpoint
+        assert result["records"] == expected
+        assert result["records_per_sec"] > 0
+        assert result["peak_mb"] > 0
+        assert result["requests"] == (1 if name == "price_list_items" else 3)
+        assert set(result["stages"]) == {"http", "decode", "parse"}
+
+
+class TestBenchModels:
+
+    def test_runs_every_stage(self):
+        results = run_benchmarks(count=10, repeat=1, models=["sale"])
+
+        assert set(results) == {"sale.parse_list", "sale.parse_item", "sale.model_dump", "sale.flatten",
+                                "sale.lazy_flatten", "sale.projected_parse", "sale.to_frame"}
+        assert all(r["items_per_sec"] > 0 for r in results.values())
+
+    def test_all_models_have_payloads(self):
+        results = run_benchmarks(count=3, repeat=1, models=sorted(MODELS))
+        assert len(results) == 6 * len(MODELS) + 1
+
+    def test_compare_flags_regressions_past_threshold(self):
+        baseline = {"sale.parse_list": {"items_per_sec": 1000.0, "peak_bytes_per_item": 100.0},
+                    "sale.flatten": {"items_per_sec": 1000.0, "peak_bytes_per_item": 100.0}}
+        results = {"sale.parse_list": {"items_per_sec": 850.0, "peak_bytes_per_item": 100.0},
+                   "sale.flatten": {"items_per_sec": 700.0, "peak_bytes_per_item": 130.0},
+                   "cliente.flatten": {"items_per_sec": 1.0, "peak_bytes_per_item": 1.0}}
+
+        regressions = compare(results, baseline, threshold=0.2)
+
+        assert len(regressions) == 2
+        assert all(r.startswith("sale.flatten") for r in regressions)
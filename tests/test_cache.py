@@ -0,0 +1,184 @@
+"""Tests for the GET response cache (chesserp.cache + ChessClient integration)."""
+
+import time
+
+import pytest
+
+from chesserp.cache import MemoryCache, SQLiteCache, make_cache_key
+from chesserp.client import ChessClient
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+STAFF_URL = BASE_URL + API_PATH + "personalComercial/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+STAFF_RESPONSE = {"PersonalComercial": {"ePersCom": [{"idSucursal": 1, "idPersonal": 1, "desPersonal": "Vendedor 1"}]}}
+
+
+def _api_gets(mock_api, fragment):
+    return [r for r in mock_api.request_history if fragment in r.path]
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class TestMemoryCache:
+
+    def test_set_and_get(self):
+        cache = MemoryCache()
+        cache.set("k", b"v", ttl=60)
+        assert cache.get("k") == b"v"
+
+    def test_expired_entry_is_miss(self):
+        cache = MemoryCache()
+        cache.set("k", b"v", ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1", ttl=60)
+        cache.set("b", b"2", ttl=60)
+        cache.get("a")  # "b" queda como menos reciente
+        cache.set("c", b"3", ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+
+    def test_eviction_by_bytes(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"x" * 6, ttl=60)
+        cache.set("b", b"y" * 6, ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"y" * 6
+
+
+class TestSQLiteCache:
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SQLiteCache(path).set("k", b"v", ttl=60)
+
+        assert SQLiteCache(path).get("k") == b"v"
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("k", b"v", ttl=-1)
+        assert cache.get("k") is None
+
+    def test_eviction_keeps_most_recent(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2)
+        cache.set("a", b"1", ttl=60)
+        time.sleep(0.01)
+        cache.set("b", b"2", ttl=60)
+        time.sleep(0.01)
+        cache.set("c", b"3", ttl=60)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+
+def test_cache_key_ignores_param_order():
+    assert make_cache_key(BASE_URL, "u", "clientes/", {"a": 1, "b": 2}) == \
+        make_cache_key(BASE_URL + "/", "u", "clientes/", {"b": 2, "a": 1})
+
+
+def test_cache_key_includes_server_and_user():
+    key = make_cache_key(BASE_URL, "u", "clientes/")
+
+    assert key != make_cache_key(BASE_URL, "otro", "clientes/")
+    assert key != make_cache_key("http://otro-servidor", "u", "clientes/")
+
+
+# ---------------------------------------------------------------------------
+# ChessClient integration
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def cached_client(mock_api):
+    c = ChessClient(api_url=BASE_URL, username="u", password="p", cache=MemoryCache())
+    c.login()
+    return c
+
+
+class TestClientCache:
+
+    def test_second_call_served_from_cache(self, cached_client, mock_api):
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+
+        first = cached_client.get_staff()
+        second = cached_client.get_staff()
+
+        assert len(_api_gets(mock_api, "personalcomercial")) == 1
+        assert [p.id_personal for p in first] == [p.id_personal for p in second]
+
+    def test_refresh_bypasses_cache(self, cached_client, mock_api):
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+
+        cached_client.get_staff()
+        cached_client.get_staff(refresh=True)
+        cached_client.get_staff()
+
+        assert len(_api_gets(mock_api, "personalcomercial")) == 2
+
+    def test_different_params_are_different_entries(self, cached_client, mock_api):
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+
+        cached_client.get_staff(sucursal=1)
+        cached_client.get_staff(sucursal=2)
+
+        assert len(_api_gets(mock_api, "personalcomercial")) == 2
+
+    def test_endpoint_without_ttl_not_cached(self, cached_client, mock_api):
+        mock_api.get(SALES_URL, json={
+            "dsReporteComprobantesApi": {"VentasResumen": []},
+            "cantComprobantesVentas": "Numero de lote obtenido: 1/1.",
+        })
+
+        cached_client.get_sales("2025-01-01", "2025-01-31")
+        cached_client.get_sales("2025-01-01", "2025-01-31")
+
+        assert len(_api_gets(mock_api, "ventas")) == 2
+
+    def test_ttl_override_disables_endpoint(self, mock_api):
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+        c = ChessClient(api_url=BASE_URL, username="u", password="p",
+                        cache=MemoryCache(), cache_ttls={"personalComercial/": 0})
+
+        c.get_staff()
+        c.get_staff()
+
+        assert len(_api_gets(mock_api, "personalcomercial")) == 2
+
+    def test_clients_sharing_cache_do_not_mix_data(self, mock_api):
+        other_url = "http://otra-empresa.local"
+        mock_api.post(other_url + "/web/api/chess/v1/auth/login", json={"sessionId": "JSESSIONID=xyz"})
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+        mock_api.get(other_url + API_PATH + "personalComercial/",
+                     json={"PersonalComercial": {"ePersCom": [{"idSucursal": 2, "idPersonal": 9,
+                                                               "desPersonal": "Vendedor 9"}]}})
+        cache = MemoryCache()
+        empresa1 = ChessClient(api_url=BASE_URL, username="u", password="p", cache=cache)
+        empresa2 = ChessClient(api_url=other_url, username="u", password="p", cache=cache)
+        otro_usuario = ChessClient(api_url=BASE_URL, username="u2", password="p", cache=cache)
+
+        assert [p.id_personal for p in empresa1.get_staff()] == [1]
+        assert [p.id_personal for p in empresa2.get_staff()] == [9]
+        otro_usuario.get_staff()
+
+        assert len(_api_gets(mock_api, "personalcomercial")) == 3
+
+    def test_cache_hit_needs_no_login(self, mock_api, tmp_path):
+        mock_api.get(STAFF_URL, json=STAFF_RESPONSE)
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        ChessClient(api_url=BASE_URL, username="u", password="p", cache=cache).get_staff()
+        mock_api.reset_mock()
+
+        result = ChessClient(api_url=BASE_URL, username="u", password="p", cache=cache).get_staff()
+
+        assert len(result) == 1
+        assert mock_api.call_count == 0
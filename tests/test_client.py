@@ -0,0 +1,299 @@
+"""Tests for ChessClient transport behaviour (session, pooling, decoding)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import PropertyMock, patch
+
+import pytest
+import requests
+
+from chesserp.client import ChessClient
+from chesserp.retry import NO_RETRY
+from chesserp.exceptions import ApiError, DeadlineExceeded
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+STAFF_URL = BASE_URL + API_PATH + "personalComercial/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+ARTICLES_URL = BASE_URL + API_PATH + "articulos/"
+
+
+# ---------------------------------------------------------------------------
+# Session / connection pool
+# ---------------------------------------------------------------------------
+
+class TestSession:
+
+    def test_requests_go_through_client_session(self, client, mock_api):
+        mock_api.get(STAFF_URL, json={"PersonalComercial": {"ePersCom": []}})
+
+        with patch.object(client._session, "get", wraps=client._session.get) as spy:
+            client.get_staff()
+
+        assert spy.call_count == 1
+
+    def test_session_cookie_sent_as_header(self, client, mock_api):
+        mock_api.get(STAFF_URL, json={"PersonalComercial": {"ePersCom": []}})
+
+        client.get_staff()
+
+        assert mock_api.last_request.headers["Cookie"] == "JSESSIONID=abc123"
+
+    def test_pool_size_follows_max_workers(self):
+        c = ChessClient(api_url=BASE_URL, username="u", password="p", max_workers=32)
+
+        adapter = c._session.get_adapter(BASE_URL)
+
+        assert adapter._pool_maxsize == 32
+
+    def test_explicit_pool_size(self):
+        c = ChessClient(api_url=BASE_URL, username="u", password="p",
+                        pool_connections=2, pool_maxsize=5)
+
+        adapter = c._session.get_adapter(BASE_URL)
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+
+    def test_context_manager_closes_session(self):
+        c = ChessClient(api_url=BASE_URL, username="u", password="p")
+
+        with patch.object(c._session, "close") as mock_close:
+            with c:
+                pass
+
+        mock_close.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# from_env
+# ---------------------------------------------------------------------------
+
+class TestFromEnv:
+
+    def test_forwards_constructor_kwargs(self, monkeypatch):
+        monkeypatch.setenv("TEST_API_URL", BASE_URL)
+        monkeypatch.setenv("TEST_USERNAME", "u")
+        monkeypatch.setenv("TEST_PASSWORD", "p")
+
+        c = ChessClient.from_env(prefix="TEST_", max_workers=3)
+
+        assert c.max_workers == 3
+        assert c.name == "TEST"
+
+
+# ---------------------------------------------------------------------------
+# Response decoding
+# ---------------------------------------------------------------------------
+
+class TestResponseDecoding:
+
+    def test_success_path_never_decodes_text(self, client, mock_api):
+        """El body se decodifica una sola vez desde bytes; response.text no se construye."""
+        mock_api.get(STAFF_URL, json={"PersonalComercial": {"ePersCom": []}})
+
+        with patch.object(requests.Response, "text", new_callable=PropertyMock,
+                          side_effect=AssertionError("response.text no debe usarse")):
+            assert client.get_staff() == []
+
+    def test_invalid_json_raises_api_error(self, client, mock_api):
+        mock_api.get(STAFF_URL, text="<html>login</html>")
+
+        with pytest.raises(ApiError, match="Invalid JSON"):
+            client.get_staff()
+
+
+# ---------------------------------------------------------------------------
+# Re-login single-flight
+# ---------------------------------------------------------------------------
+
+LOGIN_URL = BASE_URL + API_PATH + "auth/login"
+
+
+class RotatingLoginServer:
+    """Login entrega JSESSIONID=s1, s2, ...; solo la última sesión emitida es válida."""
+
+    def __init__(self, login_delay: float = 0.0):
+        self.login_delay = login_delay
+        self.logins = 0
+        self.lock = threading.Lock()
+
+    @property
+    def current(self):
+        return f"JSESSIONID=s{self.logins}"
+
+    def login(self, request, context):
+        time.sleep(self.login_delay)
+        with self.lock:
+            self.logins += 1
+            return {"sessionId": self.current}
+
+    def staff(self, request, context):
+        if request.headers.get("Cookie") != self.current:
+            context.status_code = 401
+            return {"error": "Unauthorized"}
+        return {"PersonalComercial": {"ePersCom": []}}
+
+
+class TestSingleFlightLogin:
+
+    def _setup(self, mock_api, server):
+        mock_api.post(LOGIN_URL, json=server.login)
+        mock_api.get(STAFF_URL, json=server.staff)
+
+    def test_concurrent_401_triggers_one_relogin(self, mock_api):
+        server = RotatingLoginServer(login_delay=0.05)
+        self._setup(mock_api, server)
+        client = ChessClient(api_url=BASE_URL, username="u", password="p")
+        client.login()
+        server.logins += 1  # el servidor invalida s1
+
+        barrier = threading.Barrier(6)
+
+        def _worker():
+            barrier.wait()
+            return client.get_staff()
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(lambda _: _worker(), range(6)))
+
+        assert results == [[]] * 6
+        # login inicial + un único re-login
+        assert sum(1 for r in mock_api.request_history if r.method == "POST") == 2
+
+    def test_first_use_logs_in_once(self, mock_api):
+        server = RotatingLoginServer(login_delay=0.05)
+        self._setup(mock_api, server)
+        client = ChessClient(api_url=BASE_URL, username="u", password="p")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.get_staff(), range(4)))
+
+        assert server.logins == 1
+
+    def test_base_headers_not_mutated_on_relogin(self, mock_api):
+        server = RotatingLoginServer()
+        self._setup(mock_api, server)
+        client = ChessClient(api_url=BASE_URL, username="u", password="p")
+        client.login()
+        old_headers = client.base_headers
+        server.logins += 1
+
+        client.get_staff()
+
+        assert old_headers == {"Cookie": "JSESSIONID=s1"}
+        assert client.base_headers == {"Cookie": "JSESSIONID=s3"}
+
+    def test_session_refreshed_proactively(self, mock_api):
+        server = RotatingLoginServer()
+        self._setup(mock_api, server)
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", session_max_age=0.05)
+        client.get_staff()
+        time.sleep(0.06)
+
+        client.get_staff()
+
+        # Sin ningún 401: la sesión se renovó antes de usarla
+        assert server.logins == 2
+        assert [r.method for r in mock_api.request_history] == ["POST", "GET", "POST", "GET"]
+        assert client.session_age < 0.05
+
+
+# ---------------------------------------------------------------------------
+# Timeouts / deadline
+# ---------------------------------------------------------------------------
+
+def _slow_sales(total_lotes, delay):
+    """Un lote de ventas por nroLote; cada respuesta tarda delay segundos."""
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        time.sleep(delay)
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": []},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{total_lotes}. "
+                                      f"Cantidad de comprobantes totales: 0",
+        }
+    return _callback
+
+
+def _sales_requests(mock_api):
+    return [r for r in mock_api.request_history if "ventas" in r.path]
+
+
+class TestTimeouts:
+
+    def test_default_timeout_on_every_request(self, mock_api):
+        mock_api.get(STAFF_URL, json={"PersonalComercial": {"ePersCom": []}})
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", timeout=12)
+
+        client.get_staff()
+
+        assert [r.timeout for r in mock_api.request_history] == [(12, 12), (12, 12)]
+
+    def test_separate_connect_and_read_timeouts(self, mock_api):
+        mock_api.get(STAFF_URL, json={"PersonalComercial": {"ePersCom": []}})
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", connect_timeout=3, read_timeout=45)
+
+        client.get_staff()
+
+        assert mock_api.last_request.timeout == (3, 45)
+
+
+class TestDeadline:
+
+    def test_sequential_stops_when_deadline_expires(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_slow_sales(10, delay=0.1))
+
+        with pytest.raises(DeadlineExceeded):
+            client.get_sales("2025-01-01", "2025-01-31", deadline=0.25)
+
+        assert 2 <= len(_sales_requests(mock_api)) <= 4
+
+    def test_parallel_cancels_pending_lotes(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_slow_sales(20, delay=0.1))
+
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get_sales("2025-01-01", "2025-01-31", max_workers=4, deadline=0.25)
+
+        assert time.monotonic() - start < 0.5
+        time.sleep(0.15)  # los lotes en vuelo terminan solos
+        assert len(_sales_requests(mock_api)) < 20
+
+    def test_request_timeout_capped_to_remaining_time(self, mock_api):
+        mock_api.get(SALES_URL, json=_slow_sales(1, delay=0))
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", timeout=30)
+
+        client.get_sales("2025-01-01", "2025-01-31", deadline=5)
+
+        connect, read = _sales_requests(mock_api)[0].timeout
+        assert connect <= 5 and read <= 5
+
+    def test_deadline_not_exceeded(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_slow_sales(3, delay=0))
+
+        assert client.get_sales("2025-01-01", "2025-01-31", max_workers=2, deadline=5) == []
+        assert len(_sales_requests(mock_api)) == 3
+
+    def test_timeout_after_deadline_raises_deadline_exceeded(self, client, mock_api):
+        def _hang(request, context):
+            time.sleep(0.15)
+            raise requests.ReadTimeout("read timed out")
+
+        mock_api.get(SALES_URL, json=_hang)
+        client.retry = NO_RETRY
+
+        with pytest.raises(DeadlineExceeded):
+            client.get_sales("2025-01-01", "2025-01-31", deadline=0.1)
+
+    def test_retry_after_longer_than_deadline(self, client, mock_api):
+        # El reintento esperaría 3s: se corta por el deadline sin dormir
+        mock_api.get(ARTICLES_URL, status_code=503, headers={"Retry-After": "3"}, json={})
+
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get_articles(deadline=0.5)
+
+        assert time.monotonic() - start < 0.5
+        assert len([r for r in mock_api.request_history if "articulos" in r.path]) == 1
@@ -0,0 +1,134 @@
+"""Tests for compact records (chesserp.compact) and compact=True on the clients."""
+
+import pickle
+import tracemalloc
+
+import pytest
+
+from benchmarks import payloads
+from chesserp.compact import CompactRecord, compact_class, parse_compact, to_compact
+from chesserp.models.inventory import StockFisico
+from chesserp.models.sales import Sale
+from chesserp.parsing import parse_list, projection
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+STOCK_URL = BASE_URL + API_PATH + "stock/"
+
+
+def _make_stock(id_articulo: int = 1):
+    return {"idDeposito": 1, "idArticulo": id_articulo, "dsArticulo": f"ART {id_articulo}",
+            "cantBultos": "2", "cantUnidades": 24}
+
+
+class TestCompactRecord:
+
+    def test_same_values_as_model(self):
+        model = Sale.model_validate(make_sale())
+        record = compact_class(Sale).from_model(model)
+
+        for name in Sale.model_fields:
+            assert getattr(record, name) == getattr(model, name), name
+
+    def test_no_instance_dict(self):
+        record = compact_class(Sale).from_raw(make_sale())
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.otro_campo = 1
+
+    def test_round_trip_to_model(self):
+        model = Sale.model_validate(make_sale())
+
+        assert compact_class(Sale).from_model(model).to_model() == model
+
+    def test_from_raw_validates(self):
+        record = compact_class(StockFisico).from_raw(_make_stock())
+
+        assert record.cant_bultos == 2.0
+        with pytest.raises(ValueError):
+            compact_class(StockFisico).from_raw({"idDeposito": 1})
+
+    def test_to_dict_and_equality(self):
+        a, b = parse_compact([_make_stock(1), _make_stock(1)], StockFisico)
+
+        assert a == b
+        assert a.to_dict()["id_articulo"] == 1
+        assert list(a.to_dict()) == list(StockFisico.model_fields)
+
+    def test_pickle(self):
+        record = parse_compact([make_sale(5)], Sale)[0]
+
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_class_is_cached_per_model(self):
+        cls = compact_class(Sale)
+
+        assert cls is compact_class(Sale)
+        assert issubclass(cls, CompactRecord)
+        assert cls.__name__ == "CompactSale"
+
+    def test_to_compact_keeps_order(self):
+        models = parse_list([_make_stock(3), _make_stock(1)], StockFisico)
+
+        assert [r.id_articulo for r in to_compact(models, StockFisico)] == [3, 1]
+
+    def test_invalid_items_dropped(self):
+        assert len(parse_compact([_make_stock(1), {"idDeposito": "x"}], StockFisico)) == 1
+
+    def test_uses_less_memory_than_models(self):
+        records = payloads.sale_records(500)
+
+        def retained(build):
+            tracemalloc.start()
+            result = build()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del result
+            return size
+
+        models = retained(lambda: parse_list(records, Sale))
+        compact = retained(lambda: parse_compact(records, Sale))
+
+        assert compact < models / 3
+
+
+class TestClientCompact:
+
+    def _response(self, sales):
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": sales},
+            "cantComprobantesVentas": "Numero de lote obtenido: 1/1. Cantidad de comprobantes totales: 2",
+        }
+
+    def test_get_sales_compact(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._response([make_sale(1), make_sale(2)]))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", compact=True)
+
+        assert [type(v).__name__ for v in ventas] == ["CompactSale", "CompactSale"]
+        assert [v.nro_doc for v in ventas] == [1, 2]
+        assert ventas[0].subtotal_neto == 10.5
+
+    def test_compact_with_fields(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._response([make_sale(3)]))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", compact=True, fields=["nro_doc"])
+
+        assert ventas[0].to_dict() == {"nro_doc": 3}
+        assert ventas[0].model_class is projection(Sale, ["nro_doc"])[0]
+
+    def test_modes_are_exclusive(self, client):
+        with pytest.raises(ValueError):
+            client.get_sales("2025-01-01", "2025-01-31", lazy=True, compact=True)
+
+    def test_get_stock_compact(self, client, mock_api):
+        mock_api.get(STOCK_URL, json={"dsStockFisicoApi": {"dsStock": [_make_stock(1), _make_stock(2)]}})
+
+        stock = client.get_stock(id_deposito=1, compact=True)
+
+        assert [s.id_articulo for s in stock] == [1, 2]
+        assert stock[0].to_model() == StockFisico.model_validate(_make_stock(1))
+
@@ -30,6 +30,24 @@ def _make_response(customers: list, lote_actual: int, total_lotes: int):
     }
 
 
+class TestGetCustomersFields:
+
+    def test_all_lotes(self, client, mock_api):
+        mock_api.get(CUSTOMERS_URL, json=_make_response([_make_customer(1), _make_customer(2)], 1, 1))
+
+        result = client.get_customers(fields=["id_cliente", "des_sucursal"])
+
+        assert [c.model_dump() for c in result] == [{"des_sucursal": "Sucursal 1", "id_cliente": 1},
+                                                    {"des_sucursal": "Sucursal 1", "id_cliente": 2}]
+
+    def test_specific_lote_raw(self, client, mock_api):
+        mock_api.get(CUSTOMERS_URL, json=_make_response([_make_customer(5)], 2, 3))
+
+        result = client.get_customers(nro_lote=2, raw=True, fields=["id_cliente"])
+
+        assert result == [{"idCliente": 5}]
+
+
 # ---------------------------------------------------------------------------
 # get_customers — single lote
 # ---------------------------------------------------------------------------
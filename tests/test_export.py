@@ -0,0 +1,125 @@
+"""Tests for columnar sales export (chesserp.export)."""
+
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from chesserp.export import SalesDatasetWriter, arrow_schema, export_sales, records_to_table
+from chesserp.models.sales import Sale
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+
+class TestSchema:
+
+    def test_types_follow_model(self):
+        schema = arrow_schema(Sale)
+
+        assert schema.field("id_cliente").type == pa.int64()
+        assert schema.field("subtotal_final").type == pa.float64()
+        assert schema.field("anulado").type == pa.bool_()
+        assert schema.field("ds_empresa").type == pa.string()
+        assert schema.field("serie").type == pa.string()  # Union[str, int]
+
+    def test_field_subset(self):
+        schema = arrow_schema(Sale, ["id_cliente", "subtotal_final"])
+        assert schema.names == ["id_cliente", "subtotal_final"]
+
+    def test_unknown_field_raises(self):
+        with pytest.raises(ValueError, match="no_existe"):
+            arrow_schema(Sale, ["no_existe"])
+
+
+class TestRecordsToTable:
+
+    def test_from_raw_dicts(self):
+        table = records_to_table([make_sale(1), make_sale(2)])
+
+        assert table.column("nro_doc").to_pylist() == [1, 2]
+        assert table.column("serie").to_pylist() == ["1", "1"]
+
+    def test_from_models(self):
+        table = records_to_table([Sale(**make_sale(3))])
+        assert table.column("nro_doc").to_pylist() == [3]
+
+    def test_bad_values_coerced_to_null(self):
+        table = records_to_table([make_sale(1, idVendedor=""), make_sale(2, idVendedor=5)])
+        assert table.column("id_vendedor").to_pylist() == [None, 5]
+
+
+class TestSalesDatasetWriter:
+
+    def test_partitions_by_company_and_month(self, tmp_path):
+        writer = SalesDatasetWriter(str(tmp_path), "EMPRESA1")
+
+        files = writer.write_batch([make_sale(1, fechaComprobate="2025-01-31"),
+                                    make_sale(2, fechaComprobate="2025-02-01")])
+
+        assert len(files) == 2
+        assert os.path.isdir(tmp_path / "empresa=EMPRESA1" / "mes=2025-01")
+        assert os.path.isdir(tmp_path / "empresa=EMPRESA1" / "mes=2025-02")
+        assert pq.read_metadata(files[0]).row_group(0).column(0).compression == "ZSTD"
+
+    def test_arrow_ipc_format(self, tmp_path):
+        writer = SalesDatasetWriter(str(tmp_path), "EMPRESA1", format="arrow", compression="lz4")
+
+        [path] = writer.write_batch([make_sale(1)])
+
+        with pa.ipc.open_file(path) as reader:
+            assert reader.read_all().column("nro_doc").to_pylist() == [1]
+
+    def test_company_name_sanitized(self, tmp_path):
+        writer = SalesDatasetWriter(str(tmp_path), "http://srv:8080/")
+        assert writer.company == "http_srv_8080"
+
+    def test_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            SalesDatasetWriter(str(tmp_path), "E", format="csv")
+
+
+def test_export_sales_streams_each_batch(client, mock_api, tmp_path):
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(nro_lote)]},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/3.",
+        }
+    mock_api.get(SALES_URL, json=_callback)
+
+    writer = export_sales(client, str(tmp_path), "2025-01-01", "2025-01-31", company="EMPRESA1")
+
+    assert writer.rows_written == 3
+    assert len(writer.files) == 3
+    table = ds.dataset(str(tmp_path), partitioning="hive").to_table(columns=["nro_doc", "empresa", "mes"])
+    assert sorted(table.column("nro_doc").to_pylist()) == [1, 2, 3]
+    assert set(table.column("mes").to_pylist()) == {"2025-01"}
+
+
+def test_reexport_replaces_partitions(client, mock_api, tmp_path):
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(nro_lote)]},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{total_lotes}.",
+        }
+    mock_api.get(SALES_URL, json=_callback)
+    # Otra partición que la segunda corrida no toca
+    SalesDatasetWriter(str(tmp_path), "EMPRESA1").write_batch([make_sale(9, fechaComprobate="2024-12-10")])
+
+    total_lotes = 3
+    export_sales(client, str(tmp_path), "2025-01-01", "2025-01-31", company="EMPRESA1")
+    total_lotes = 2
+    export_sales(client, str(tmp_path), "2025-01-01", "2025-01-31", company="EMPRESA1")
+
+    table = ds.dataset(str(tmp_path), partitioning="hive").to_table(columns=["nro_doc", "mes"])
+    assert table.num_rows == 3
+    assert sorted(zip(table.column("mes").to_pylist(), table.column("nro_doc").to_pylist())) == \
+        [("2024-12", 9), ("2025-01", 1), ("2025-01", 2)]
@@ -0,0 +1,102 @@
+"""Tests for chesserp.frames.sales_to_frame (raw VentasResumen -> line DataFrame)."""
+
+import pandas as pd
+
+from benchmarks import payloads
+from chesserp.frames import COLUMNS, sales_to_frame
+from chesserp.models.sales import Sale
+from chesserp.parsing import parse_list
+import live_test
+
+
+def _make_line(nro_doc: int, id_linea: int, **overrides):
+    line = {
+        "idEmpresa": 1,
+        "dsEmpresa": "Empresa Test",
+        "idDocumento": "FCVTA",
+        "letra": "A",
+        "serie": 66,
+        "nrodoc": nro_doc,
+        "fechaComprobate": "2025-01-15",
+        "idSucursal": 1,
+        "idCliente": 10 + nro_doc,
+        "nombreCliente": f"Cliente {nro_doc}",
+        "idLinea": id_linea,
+        "idArticulo": 100 + id_linea,
+        "subtotalNeto": 10.0 * id_linea,
+        "subtotalFinal": 12.1 * id_linea,
+    }
+    line.update(overrides)
+    return line
+
+
+def _flatten(records):
+    """Camino de referencia: validar con Sale, _flatten_sales y DataFrame."""
+    return pd.DataFrame(object.__new__(live_test.Testing)._flatten_sales(parse_list(records, Sale)))
+
+
+class TestSalesToFrame:
+
+    def test_matches_flatten_sales(self):
+        records = payloads.sale_records(40)
+
+        pd.testing.assert_frame_equal(sales_to_frame(records), _flatten(records), check_dtype=False)
+
+    def test_one_row_per_line_with_header_columns(self):
+        records = [_make_line(1, 1), _make_line(1, 2), _make_line(2, 1)]
+
+        df = sales_to_frame(records)
+
+        assert list(df.columns) == COLUMNS
+        assert df["nro_doc"].tolist() == [1, 1, 2]
+        assert df["nombre_cliente"].tolist() == ["Cliente 1", "Cliente 1", "Cliente 2"]
+        assert df["linea_id_linea"].tolist() == [1, 2, 1]
+        assert df["linea_subtotal_neto"].tolist() == [10.0, 20.0, 10.0]
+
+    def test_header_taken_from_first_line_of_each_comprobante(self):
+        # Mismo número con distinta letra: son comprobantes distintos
+        records = [_make_line(1, 1), _make_line(1, 1, letra="B", idCliente=99), _make_line(1, 2)]
+
+        df = sales_to_frame(records)
+
+        assert df["id_cliente"].tolist() == [11, 99, 11]
+
+    def test_numeric_strings_coerced_and_invalid_become_null(self):
+        records = [_make_line(1, 1, subtotalNeto="10.5", idVendedor=None),
+                   _make_line(2, 1, subtotalNeto="no es numero", idVendedor=3)]
+
+        df = sales_to_frame(records)
+
+        assert df["subtotal_neto"].iloc[0] == 10.5
+        assert pd.isna(df["subtotal_neto"].iloc[1])
+        assert str(df["id_vendedor"].dtype) == "Int64"
+        assert df["id_vendedor"].tolist()[1] == 3
+
+    def test_int_with_decimals_not_truncated(self):
+        records = [_make_line(1, 1, idArticulo=1.7), _make_line(1, 2, idArticulo=2.0), _make_line(1, 3, idArticulo=3)]
+
+        df = sales_to_frame(records)
+
+        assert pd.isna(df["linea_id_articulo"].iloc[0])
+        assert df["linea_id_articulo"].tolist()[1:] == [2, 3]
+
+    def test_missing_keys_are_null(self):
+        line = _make_line(1, 1)
+        del line["nombreCliente"], line["subtotalFinal"]
+
+        df = sales_to_frame([line, _make_line(2, 1)])
+
+        assert pd.isna(df["nombre_cliente"].iloc[0])
+        assert pd.isna(df["subtotal_final"].iloc[0])
+
+    def test_accepts_raw_response(self):
+        response = {"dsReporteComprobantesApi": {"VentasResumen": [_make_line(1, 1)]},
+                    "cantComprobantesVentas": "Numero de lote obtenido: 1/1. Cantidad de comprobantes totales: 1"}
+
+        assert len(sales_to_frame(response)) == 1
+
+    def test_empty(self):
+        df = sales_to_frame([])
+
+        assert df.empty
+        assert list(df.columns) == COLUMNS
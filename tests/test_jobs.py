@@ -0,0 +1,96 @@
+"""Tests for ResumableJob (checkpointed batch extraction)."""
+
+import json
+import os
+
+import pytest
+
+from chesserp.exceptions import ApiError
+from chesserp.jobs import ResumableJob
+from chesserp.models.sales import Sale
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+TOTAL_LOTES = 5
+
+
+def _lotes_callback(failing=()):
+    """Un registro por lote (nrodoc = nroLote); los lotes en failing responden 500."""
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        if nro_lote in failing:
+            context.status_code = 500
+            return {"error": "Internal Server Error"}
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(nro_lote)]},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{TOTAL_LOTES}. "
+                                      f"Cantidad de comprobantes totales: {TOTAL_LOTES}",
+        }
+    return _callback
+
+
+def _requested_lotes(mock_api):
+    return sorted(int(r.qs["nrolote"][0]) for r in mock_api.request_history if "ventas" in r.path)
+
+
+def _job(client, tmp_path):
+    return ResumableJob.sales(client, str(tmp_path / "job"), "2025-01-01", "2025-01-31", detallado=True)
+
+
+class TestResumableJob:
+
+    def test_full_run_saves_every_lote(self, client, mock_api, tmp_path):
+        mock_api.get(SALES_URL, json=_lotes_callback())
+        job = _job(client, tmp_path)
+
+        assert job.run(max_workers=3) == TOTAL_LOTES
+
+        assert job.done
+        assert [s.nro_doc for s in job.records()] == [1, 2, 3, 4, 5]
+        assert all(isinstance(s, Sale) for s in job.records())
+        with open(tmp_path / "job" / "manifest.json") as f:
+            manifest = json.load(f)
+        assert manifest["total_lotes"] == TOTAL_LOTES
+        assert manifest["docs"] == TOTAL_LOTES
+        assert manifest["params"]["detallado"] is True
+
+    def test_failed_lote_keeps_the_rest_and_resumes(self, client, mock_api, tmp_path):
+        mock_api.get(SALES_URL, json=_lotes_callback(failing={4}))
+        job = _job(client, tmp_path)
+
+        with pytest.raises(ApiError):
+            job.run(max_workers=2)
+
+        assert job.missing_lotes() == [4]
+        assert os.path.exists(tmp_path / "job" / "lote_00005.json")
+
+        # Reinicio con un job nuevo sobre el mismo directorio: solo pide el lote 4
+        mock_api.reset_mock()
+        mock_api.get(SALES_URL, json=_lotes_callback())
+        resumed = _job(client, tmp_path)
+
+        assert resumed.run() == 1
+        assert _requested_lotes(mock_api) == [4]
+        assert [s["nrodoc"] for s in resumed.records(raw=True)] == [1, 2, 3, 4, 5]
+
+    def test_completed_job_does_not_call_api(self, client, mock_api, tmp_path):
+        mock_api.get(SALES_URL, json=_lotes_callback())
+        _job(client, tmp_path).run()
+        mock_api.reset_mock()
+
+        assert _job(client, tmp_path).run() == 0
+        assert _requested_lotes(mock_api) == []
+
+    def test_different_params_rejected(self, client, mock_api, tmp_path):
+        mock_api.get(SALES_URL, json=_lotes_callback())
+        _job(client, tmp_path).run()
+
+        with pytest.raises(ValueError, match="job distinto"):
+            ResumableJob.sales(client, str(tmp_path / "job"), "2025-02-01", "2025-02-28")
+
+    def test_unknown_endpoint(self, client, tmp_path):
+        with pytest.raises(ValueError):
+            ResumableJob(client, str(tmp_path), "pedidos")
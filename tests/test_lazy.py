@@ -0,0 +1,127 @@
+"""Tests for lazy records (chesserp.lazy) and get_sales(lazy=True)."""
+
+import pytest
+from pydantic import ValidationError
+
+from chesserp.lazy import LazyRecord, lazy_class, parse_lazy
+from chesserp.models.inventory import Articulo, AgrupacionArticulo
+from chesserp.models.routes import ClienteRuta, RutaVenta
+from chesserp.models.sales import Sale
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+
+class TestLazyRecord:
+
+    def test_values_match_pydantic_model(self):
+        raw = make_sale()
+        record = parse_lazy([raw], Sale)[0]
+        model = Sale.model_validate(raw)
+
+        for name in Sale.model_fields:
+            assert getattr(record, name) == getattr(model, name), name
+
+    @pytest.mark.parametrize("model_class, raw", [
+        (RutaVenta, {"idSucursal": 1, "idFuerzaVentas": 2, "idModoAtencion": "PRE", "idRuta": 3,
+                     "idPersonal": "", "periodicidadVisita": "2", "semanaVisita": None}),
+        (ClienteRuta, {"idSucursal": 1, "idFuerzaVentas": 2, "idModoAtencion": "PRE", "idRuta": 3,
+                       "idCliente": 4, "intercalacionVisita": "", "intercalacionEntrega": "7"}),
+    ])
+    def test_annotated_validators_match_eager(self, model_class, raw):
+        record = parse_lazy([raw], model_class)[0]
+        model = model_class.model_validate(raw)
+
+        for name in model_class.model_fields:
+            assert getattr(record, name) == getattr(model, name), name
+
+    def test_empty_string_to_none(self):
+        record = parse_lazy([{"idSucursal": 1, "idFuerzaVentas": 2, "idModoAtencion": "PRE",
+                              "idRuta": 3, "idPersonal": ""}], RutaVenta)[0]
+
+        assert record.id_personal is None
+
+    def test_only_read_fields_are_validated(self):
+        record = parse_lazy([make_sale()], Sale)[0]
+
+        assert record.subtotal_neto == 10.5
+        assert record.nro_doc == 1
+        assert list(record._values) == ["subtotal_neto", "nro_doc"]
+
+    def test_invalid_field_fails_on_access_only(self):
+        record = parse_lazy([make_sale(subtotalNeto="no es numero")], Sale)[0]
+
+        assert record.nro_doc == 1
+        with pytest.raises(ValidationError):
+            record.subtotal_neto
+
+    def test_missing_required_and_optional_fields(self):
+        raw = make_sale()
+        del raw["letra"]
+        record = parse_lazy([raw], Sale)[0]
+
+        assert record.ds_documento is None
+        with pytest.raises(ValidationError):
+            record.letra
+
+    def test_nested_models_are_validated(self):
+        raw = {"idArticulo": 1, "desArticulo": "ART",
+               "eAgrupaciones": [{"idFormaAgrupar": "05", "idAgrupacion": 1162}]}
+        record = parse_lazy([raw], Articulo)[0]
+
+        assert isinstance(record.agrupaciones[0], AgrupacionArticulo)
+        assert record.agrupaciones[0].id_agrupacion == 1162
+
+    def test_read_only_and_slots(self):
+        record = parse_lazy([make_sale()], Sale)[0]
+
+        with pytest.raises(AttributeError):
+            record.nro_doc = 5
+        with pytest.raises(AttributeError):
+            record.otro_campo = 1
+
+    def test_to_model_and_raw(self):
+        raw = make_sale()
+        record = parse_lazy([raw], Sale)[0]
+
+        assert record.raw is raw
+        assert record.to_model() == Sale.model_validate(raw)
+
+    def test_class_is_cached_per_model(self):
+        cls = lazy_class(Sale)
+
+        assert cls is lazy_class(Sale)
+        assert issubclass(cls, LazyRecord)
+        assert cls.__name__ == "LazySale"
+
+    def test_non_dict_items_dropped(self):
+        assert len(parse_lazy([make_sale(), "basura", None], Sale)) == 1
+        assert parse_lazy({"no": "lista"}, Sale) == []
+
+
+class TestGetSalesLazy:
+
+    def _response(self, sales):
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": sales},
+            "cantComprobantesVentas": "Numero de lote obtenido: 1/1. Cantidad de comprobantes totales: 2",
+        }
+
+    def test_returns_lazy_records(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._response([make_sale(1), make_sale(2)]))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", lazy=True)
+
+        assert [type(v).__name__ for v in ventas] == ["LazySale", "LazySale"]
+        assert [v.nro_doc for v in ventas] == [1, 2]
+
+    def test_iter_sales_lazy(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._response([make_sale(7)]))
+
+        assert [v.nro_doc for v in client.iter_sales("2025-01-01", "2025-01-31", lazy=True)] == [7]
+
+    def test_raw_and_lazy_are_exclusive(self, client):
+        with pytest.raises(ValueError):
+            client.get_sales("2025-01-01", "2025-01-31", raw=True, lazy=True)
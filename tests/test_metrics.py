@@ -0,0 +1,218 @@
+"""Tests for metrics hooks (InMemoryMetrics, OpenTelemetryMetrics) in the clients."""
+
+import json
+
+import requests
+import requests_mock as rm
+
+from chesserp.client import ChessClient
+from chesserp.metrics import BaseMetrics, InMemoryMetrics, OpenTelemetryMetrics
+from chesserp.retry import RetryPolicy
+from chesserp.web_client import ChessWebClient
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+LOGIN_URL = BASE_URL + API_PATH + "auth/login"
+STAFF_URL = BASE_URL + API_PATH + "personalComercial/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+EXPORT_URL = BASE_URL + API_PATH + "reporteComprobantesVta/exportarExcel"
+WEB_VIGENCIAS_URL = BASE_URL + "/web/api/precios/obtenerVigenciasListas"
+
+STAFF_OK = {"json": {"PersonalComercial": {"ePersCom": [{"idSucursal": 1, "idPersonal": 1, "desPersonal": "Vendedor"}]}},
+            "status_code": 200}
+
+
+def _sales_lotes(total_lotes):
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        sales = [{"idEmpresa": 1, "dsEmpresa": "Empresa Test", "idDocumento": "FCVTA", "letra": "A", "serie": 1,
+                  "nrodoc": nro_lote * 10 + i, "fechaComprobate": "2025-01-15", "idSucursal": 1, "idCliente": 1,
+                  "idLinea": 1, "idArticulo": 101, "subtotalNeto": 10.0, "subtotalFinal": 12.1}
+                 for i in range(nro_lote)]
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": sales},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{total_lotes}. "
+                                      f"Cantidad de comprobantes totales: 6",
+        }
+    return _callback
+
+
+def _client(metrics, **kwargs):
+    return ChessClient(api_url=BASE_URL, username="u", password="p", metrics=metrics, **kwargs)
+
+
+class TestInMemoryMetrics:
+
+    def test_request_decode_and_parse(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.get(STAFF_URL, **STAFF_OK)
+
+        _client(metrics).get_staff()
+
+        summary = metrics.summary()
+        staff = summary["endpoints"]["personalComercial/"]
+        assert staff["count"] == 1
+        assert staff["bytes"] == len(json.dumps(STAFF_OK["json"]))
+        assert staff["errors"] == 0
+        assert staff["decode"] >= 0
+        assert summary["endpoints"]["auth/login"]["count"] == 1
+        assert summary["parse"]["PersonalComercial"]["records"] == 1
+
+    def test_batches_ranked_by_elapsed(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.get(SALES_URL, json=_sales_lotes(3))
+
+        _client(metrics).get_sales("2025-01-01", "2025-01-31")
+
+        summary = metrics.summary()
+        assert summary["batches"]["VentasResumen"]["count"] == 3
+        assert summary["parse"]["Sale"]["records"] == 6
+        slowest = metrics.slowest_batches(2)
+        assert len(slowest) == 2
+        assert slowest[0]["elapsed"] >= slowest[1]["elapsed"]
+        assert {b["nro_lote"] for b in metrics.slowest_batches(10)} == {1, 2, 3}
+
+    def test_top_batches_is_bounded(self, mock_api):
+        metrics = InMemoryMetrics(top_batches=2)
+        mock_api.get(SALES_URL, json=_sales_lotes(4))
+
+        _client(metrics, max_workers=2).get_sales("2025-01-01", "2025-01-31")
+
+        assert len(metrics.slowest_batches(10)) == 2
+        assert metrics.summary()["batches"]["VentasResumen"]["count"] == 4
+
+    def test_retries_and_errors(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.get(STAFF_URL, [{"status_code": 503, "text": "busy"}, STAFF_OK])
+
+        _client(metrics, retry=RetryPolicy(sleep=lambda _: None)).get_staff()
+
+        summary = metrics.summary()
+        assert summary["retries"] == {"status 503": 1}
+        assert summary["endpoints"]["personalComercial/"]["count"] == 2
+        assert summary["endpoints"]["personalComercial/"]["errors"] == 1
+
+    def test_connection_error_recorded(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.get(STAFF_URL, [{"exc": requests.ConnectionError("reset")}, STAFF_OK])
+
+        _client(metrics, retry=RetryPolicy(sleep=lambda _: None)).get_staff()
+
+        summary = metrics.summary()
+        assert summary["retries"] == {"ConnectionError": 1}
+        assert summary["endpoints"]["personalComercial/"]["errors"] == 1
+
+    def test_export_sales_report_recorded(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.post(EXPORT_URL, json={"pcArchivo": "/temp/ventas.xls"})
+        mock_api.get(BASE_URL + "/temp/ventas.xls", content=b"xls")
+
+        _client(metrics).export_sales_report("2025-01-01", "2025-01-31")
+
+        endpoints = metrics.summary()["endpoints"]
+        assert endpoints["reporteComprobantesVta/exportarExcel"]["count"] == 1
+        assert endpoints["reporteComprobantesVta/exportarExcel/archivo"]["bytes"] == 3
+
+    def test_relogin_on_401(self, mock_api):
+        metrics = InMemoryMetrics()
+        mock_api.get(STAFF_URL, [{"status_code": 401, "json": {}}, STAFF_OK])
+        client = _client(metrics)
+        client.login()
+
+        client.get_staff()
+
+        assert metrics.summary()["relogins"] == {"401": 1}
+
+    def test_slowest_endpoints(self, mock_api):
+        metrics = InMemoryMetrics()
+        metrics.on_request("c", "rapido/", 200, 0.1, 10)
+        metrics.on_request("c", "lento/", 200, 2.0, 10)
+        metrics.on_request("c", "lento/", 200, 1.0, 10)
+
+        ranked = metrics.slowest_endpoints(1)
+
+        assert ranked == [{"endpoint": "lento/", "count": 2, "total": 3.0, "mean": 1.5, "max": 2.0,
+                           "bytes": 20, "errors": 0, "decode": 0.0}]
+
+    def test_reset(self):
+        metrics = InMemoryMetrics()
+        metrics.on_relogin("c", "401")
+        metrics.reset()
+        assert metrics.summary()["relogins"] == {}
+
+
+class TestCustomHooks:
+
+    def test_subclass_receives_events(self, mock_api):
+        events = []
+
+        class Recorder(BaseMetrics):
+            def on_request(self, client, endpoint, status, elapsed, size):
+                events.append(("request", endpoint, status))
+
+            def on_parse(self, client, model, records, elapsed):
+                events.append(("parse", model, records))
+
+        mock_api.get(STAFF_URL, **STAFF_OK)
+
+        _client(Recorder(), name="EMPRESA1").get_staff()
+
+        assert events == [("request", "auth/login", 200), ("request", "personalComercial/", 200),
+                          ("parse", "PersonalComercial", 1)]
+
+
+class TestWebClientMetrics:
+
+    def test_request_and_parse(self):
+        metrics = InMemoryMetrics()
+        client = ChessWebClient(api_url=BASE_URL, username="u", password="p", metrics=metrics)
+        client._authenticated = True
+        lista = {"listaspre": 1, "titulis": "LISTA", "idvigencia": 10, "vigente": True,
+                 "fecvigenciadesde": "2026-01-01T00:00:00.000", "fecvigenciahasta": None}
+        with rm.Mocker() as m:
+            m.get(WEB_VIGENCIAS_URL, json={"eListaPrecios": [lista]})
+
+            client.get_price_lists()
+
+        summary = metrics.summary()
+        assert summary["endpoints"]["precios/obtenerVigenciasListas"]["count"] == 1
+        assert summary["parse"]["ListaPrecio"]["records"] == 1
+
+
+class FakeInstrument:
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def record(self, value, attributes=None):
+        self.points.append((value, attributes))
+
+    add = record
+
+
+class FakeMeter:
+    def __init__(self):
+        self.instruments = {}
+
+    def _create(self, name, unit="", description=""):
+        self.instruments[name] = FakeInstrument(name)
+        return self.instruments[name]
+
+    create_histogram = _create
+    create_counter = _create
+
+
+class TestOpenTelemetryMetrics:
+
+    def test_records_instruments(self, mock_api):
+        meter = FakeMeter()
+        mock_api.get(STAFF_URL, [{"status_code": 503, "text": "busy"}, STAFF_OK])
+
+        _client(OpenTelemetryMetrics(meter=meter), name="EMPRESA1",
+                retry=RetryPolicy(sleep=lambda _: None)).get_staff()
+
+        durations = meter.instruments["chesserp.request.duration"].points
+        assert [attrs["status"] for _, attrs in durations] == [200, 503, 200]
+        assert durations[-1][1] == {"client": "EMPRESA1", "endpoint": "personalComercial/", "status": 200}
+        assert meter.instruments["chesserp.retries"].points == [(1, {"client": "EMPRESA1", "reason": "status 503"})]
+        assert len(meter.instruments["chesserp.parse.duration"].points) == 1
@@ -0,0 +1,100 @@
+"""Tests for chesserp.parsing (bulk validation with per-item fallback)."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from chesserp.models.clients import Cliente
+from chesserp.parsing import (list_adapter, loads, parse_doc_count, parse_list, parse_lote_info,
+                              project_records, projection)
+
+
+def _make_customer(id_cliente):
+    return {"idSucursal": 1, "idCliente": id_cliente, "razonSocial": f"Cliente {id_cliente}"}
+
+
+class TestParseList:
+
+    def test_bulk_returns_models(self):
+        result = parse_list([_make_customer(1), _make_customer(2)], Cliente)
+
+        assert [c.id_cliente for c in result] == [1, 2]
+        assert all(isinstance(c, Cliente) for c in result)
+
+    def test_bulk_uses_single_validation_call(self):
+        with patch.object(Cliente, "__init__", side_effect=AssertionError("no debe usarse")):
+            result = parse_list([_make_customer(1)], Cliente)
+
+        assert len(result) == 1
+
+    def test_invalid_item_falls_back_and_is_skipped(self, caplog):
+        data = [_make_customer(1), {"idSucursal": 1, "idCliente": "no-es-int"}, _make_customer(3)]
+
+        with caplog.at_level(logging.ERROR):
+            result = parse_list(data, Cliente)
+
+        assert [c.id_cliente for c in result] == [1, 3]
+        assert "Error parseando ítem #1 en Cliente" in caplog.text
+
+    def test_per_item_mode(self):
+        result = parse_list([_make_customer(1)], Cliente, bulk=False)
+        assert result[0].id_cliente == 1
+
+    def test_not_a_list(self):
+        assert parse_list({"a": 1}, Cliente) == []
+
+    def test_adapter_is_cached(self):
+        assert list_adapter(Cliente) is list_adapter(Cliente)
+
+
+class TestProjection:
+
+    def test_model_keeps_alias_type_and_order(self):
+        model, aliases = projection(Cliente, ["id_cliente", "id_sucursal"])
+
+        assert list(model.model_fields) == ["id_sucursal", "id_cliente"]
+        assert aliases == ("idSucursal", "idCliente")
+        assert model.model_validate({"idSucursal": 1, "idCliente": "7"}).id_cliente == 7
+
+    def test_is_cached_regardless_of_order(self):
+        assert projection(Cliente, ["id_cliente", "fecha_alta"]) is projection(Cliente, ["fecha_alta", "id_cliente"])
+
+    def test_unknown_fields_raise(self):
+        with pytest.raises(ValueError, match="idCliente"):
+            projection(Cliente, ["id_cliente", "idCliente"])
+        with pytest.raises(ValueError):
+            projection(Cliente, [])
+
+    def test_project_records_drops_other_keys(self):
+        records = project_records([_make_customer(1), {"idSucursal": 2}, "basura"], ("idCliente", "razonSocial"))
+
+        assert records == [{"idCliente": 1, "razonSocial": "Cliente 1"}, {}, "basura"]
+
+
+class TestLoads:
+
+    def test_decodes_bytes(self):
+        assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_stdlib_fallback_without_orjson(self):
+        with patch("chesserp.parsing.orjson", None):
+            assert loads('{"a": "ñ"}'.encode("utf-8")) == {"a": "ñ"}
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            loads(b"<html>")
+
+
+class TestLoteInfo:
+
+    CANT = "Numero de lote obtenido: 3/70. Cantidad de comprobantes totales: 69041"
+
+    def test_lote_info(self):
+        assert parse_lote_info(self.CANT) == (3, 70)
+        assert parse_lote_info("sin lotes") is None
+        assert parse_lote_info(None) is None
+
+    def test_doc_count(self):
+        assert parse_doc_count(self.CANT) == 69041
+        assert parse_doc_count("Numero de lote obtenido: 1/1.") is None
@@ -94,6 +94,37 @@ class TestChessWebClientAuth:
         with pytest.raises(AuthError):
             client.get_price_lists()  # 401 dispara relogin, pero mock POST no da cookie
 
+    def test_concurrent_401_triggers_one_relogin(self, client, mock_api):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _login(request, context):
+            time.sleep(0.05)
+            # Como Spring Security: la sesión nueva queda en la cookie JSESSIONID
+            client._session.cookies.set("JSESSIONID", "renewed", domain="test-api.local")
+            return ""
+
+        def _vigencias(request, context):
+            if "JSESSIONID=renewed" not in request.headers.get("Cookie", ""):
+                context.status_code = 401
+                return {}
+            return {"eListaPrecios": []}
+
+        mock_api.post(LOGIN_URL, text=_login)
+        mock_api.get(VIGENCIAS_URL, json=_vigencias)
+        barrier = threading.Barrier(5)
+
+        def _worker(_):
+            barrier.wait()
+            return client.get_price_lists()
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(_worker, range(5)))
+
+        assert results == [[]] * 5
+        assert sum(1 for r in mock_api.request_history if r.method == "POST") == 1
+
 
 # ---------------------------------------------------------------------------
 # get_price_lists
@@ -192,6 +223,24 @@ class TestGetPriceListItems:
         assert isinstance(result[0], dict)
         assert result[0]["codart"] == "A001"
 
+    def test_fields_projection(self, client, mock_api):
+        mock_api.get(LISTA_URL, json={"dsPrecios": {"ePrecios": [_make_precio("A001", precio=50.0)]}})
+
+        result = client.get_price_list_items(id_lista=1, id_vigencia=100, fields=["cod_articulo", "precio"])
+        raw = client.get_price_list_items(id_lista=1, id_vigencia=100, raw=True, fields=["precio"])
+
+        assert result[0].model_dump() == {"cod_articulo": "A001", "precio": 50.0}
+        assert raw == [{"precio": 50.0}]
+
+    def test_compact_records(self, client, mock_api):
+        mock_api.get(LISTA_URL, json={"dsPrecios": {"ePrecios": [_make_precio("A001", precio=50.0)]}})
+
+        result = client.get_price_list_items(id_lista=1, id_vigencia=100, compact=True)
+
+        assert type(result[0]).__name__ == "CompactPrecioArticulo"
+        assert (result[0].cod_articulo, result[0].precio) == ("A001", 50.0)
+        assert result[0].to_model() == PrecioArticulo.model_validate(_make_precio("A001", precio=50.0))
+
     def test_sends_correct_params(self, client, mock_api):
         mock_api.get(LISTA_URL, json={"dsPrecios": {"ePrecios": []}})
 
@@ -234,6 +283,15 @@ class TestFromEnv:
         assert c.api_url == "http://test.local"
         assert c.username == "user"
 
+    def test_from_env_forwards_kwargs(self, monkeypatch):
+        monkeypatch.setenv("TEST_API_URL", "http://test.local")
+        monkeypatch.setenv("TEST_USERNAME", "user")
+        monkeypatch.setenv("TEST_PASSWORD", "pass")
+
+        c = ChessWebClient.from_env(prefix="TEST_", timeout=5)
+
+        assert c.timeout == 5
+
     def test_from_env_missing_vars_raises(self, monkeypatch):
         monkeypatch.delenv("TEST_API_URL", raising=False)
         monkeypatch.delenv("TEST_USERNAME", raising=False)
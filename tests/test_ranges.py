@@ -0,0 +1,55 @@
+"""Tests for chesserp.ranges (date window splitting)."""
+
+from datetime import date
+
+import pytest
+
+from chesserp.ranges import halve_range, split_date_range
+
+
+class TestSplitDateRange:
+
+    def test_month_windows_trimmed_to_range(self):
+        assert split_date_range("2025-01-15", "2025-03-10", "month") == [
+            ("2025-01-15", "2025-01-31"),
+            ("2025-02-01", "2025-02-28"),
+            ("2025-03-01", "2025-03-10"),
+        ]
+
+    def test_week_windows_follow_calendar(self):
+        # 2025-01-01 es miércoles
+        assert split_date_range("2025-01-01", "2025-01-14", "week") == [
+            ("2025-01-01", "2025-01-05"),
+            ("2025-01-06", "2025-01-12"),
+            ("2025-01-13", "2025-01-14"),
+        ]
+
+    def test_day_windows(self):
+        assert split_date_range(date(2024, 2, 28), date(2024, 3, 1), "day") == [
+            ("2024-02-28", "2024-02-28"),
+            ("2024-02-29", "2024-02-29"),
+            ("2024-03-01", "2024-03-01"),
+        ]
+
+    def test_single_day_range(self):
+        assert split_date_range("2025-05-05", "2025-05-05") == [("2025-05-05", "2025-05-05")]
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            split_date_range("2025-01-01", "2025-01-31", "year")
+
+    def test_reversed_range(self):
+        with pytest.raises(ValueError):
+            split_date_range("2025-02-01", "2025-01-01")
+
+
+class TestHalveRange:
+
+    def test_halves_are_contiguous(self):
+        assert halve_range("2025-01-01", "2025-01-31") == [("2025-01-01", "2025-01-16"), ("2025-01-17", "2025-01-31")]
+
+    def test_two_days(self):
+        assert halve_range("2025-01-01", "2025-01-02") == [("2025-01-01", "2025-01-01"), ("2025-01-02", "2025-01-02")]
+
+    def test_single_day_not_split(self):
+        assert halve_range("2025-01-01", "2025-01-01") == [("2025-01-01", "2025-01-01")]
@@ -0,0 +1,173 @@
+"""Tests for RetryPolicy and its use in ChessClient / ChessWebClient."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+import requests_mock as rm
+
+from chesserp.client import ChessClient
+from chesserp.exceptions import ApiError
+from chesserp.jobs import ResumableJob
+from chesserp.retry import NO_RETRY, RetryPolicy, parse_retry_after
+from chesserp.web_client import ChessWebClient
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+STAFF_URL = BASE_URL + API_PATH + "personalComercial/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+EXPORT_URL = BASE_URL + API_PATH + "reporteComprobantesVta/exportarExcel"
+REPORT_FILE_URL = BASE_URL + "/temp/ventas.xls"
+WEB_VIGENCIAS_URL = BASE_URL + "/web/api/precios/obtenerVigenciasListas"
+
+STAFF_OK = {"json": {"PersonalComercial": {"ePersCom": []}}, "status_code": 200}
+
+
+class SleepRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, seconds):
+        self.calls.append(seconds)
+
+
+@pytest.fixture
+def sleeps():
+    return SleepRecorder()
+
+
+def _client(sleeps, **policy):
+    return ChessClient(api_url=BASE_URL, username="u", password="p",
+                       retry=RetryPolicy(sleep=sleeps, **policy))
+
+
+class TestParseRetryAfter:
+
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("pronto") is None
+
+
+class TestRetryPolicy:
+
+    def test_backoff_is_bounded_and_grows(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for _ in range(50):
+            assert 0 <= policy.backoff(1) <= 1.0
+            assert 0 <= policy.backoff(3) <= 4.0
+            assert 0 <= policy.backoff(10) <= 5.0
+
+    def test_retryable_errors(self):
+        policy = RetryPolicy(retry_read_timeouts=False)
+        assert policy.is_retryable_error(requests.ConnectionError())
+        assert policy.is_retryable_error(requests.ConnectTimeout())
+        assert not policy.is_retryable_error(requests.ReadTimeout())
+        assert not policy.is_retryable_error(requests.TooManyRedirects())
+
+
+class TestChessClientRetry:
+
+    def test_503_then_success(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, [{"status_code": 503, "text": "busy"}, {"status_code": 502, "text": "bad gw"}, STAFF_OK])
+
+        assert _client(sleeps).get_staff() == []
+        assert len(sleeps.calls) == 2
+
+    def test_retry_after_is_honored(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, [{"status_code": 429, "headers": {"Retry-After": "3"}}, STAFF_OK])
+
+        _client(sleeps).get_staff()
+
+        assert sleeps.calls == [3.0]
+
+    def test_connection_error_retried(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, [{"exc": requests.ConnectionError("reset")}, STAFF_OK])
+
+        assert _client(sleeps).get_staff() == []
+        assert len(sleeps.calls) == 1
+
+    def test_gives_up_after_max_attempts(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, status_code=503, text="busy")
+
+        with pytest.raises(ApiError) as exc_info:
+            _client(sleeps, max_attempts=3).get_staff()
+
+        assert exc_info.value.status_code == 503
+        assert len(sleeps.calls) == 2
+
+    def test_deadline_stops_retries(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, [{"status_code": 429, "headers": {"Retry-After": "60"}}, STAFF_OK])
+
+        with pytest.raises(ApiError) as exc_info:
+            _client(sleeps, deadline=10).get_staff()
+
+        assert exc_info.value.status_code == 429
+        assert sleeps.calls == []
+
+    def test_500_not_retried(self, mock_api, sleeps):
+        mock_api.get(STAFF_URL, status_code=500, text="error")
+
+        with pytest.raises(ApiError):
+            _client(sleeps).get_staff()
+
+        assert sleeps.calls == []
+
+    def test_export_sales_report_retried(self, mock_api, sleeps):
+        mock_api.post(EXPORT_URL, [{"status_code": 503, "text": "busy"},
+                                   {"json": {"pcArchivo": "/temp/ventas.xls"}, "status_code": 200}])
+        mock_api.get(REPORT_FILE_URL, [{"exc": requests.ConnectionError("reset")},
+                                       {"content": b"xls", "status_code": 200}])
+
+        assert _client(sleeps).export_sales_report("2025-01-01", "2025-01-31") == b"xls"
+        assert len(sleeps.calls) == 2
+
+    def test_no_retry_policy(self, mock_api):
+        mock_api.get(STAFF_URL, [{"status_code": 503, "text": "busy"}, STAFF_OK])
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", retry=NO_RETRY)
+
+        with pytest.raises(ApiError):
+            client.get_staff()
+
+    def test_resumable_job_lote_retried(self, mock_api, sleeps, tmp_path):
+        # Un 503 pasajero en el lote 2 lo absorbe la política: el lote no queda pendiente
+        sales = {"dsReporteComprobantesApi": {"VentasResumen": [make_sale(1)]},
+                 "cantComprobantesVentas": "Numero de lote obtenido: 1/2. Cantidad de comprobantes totales: 2"}
+        mock_api.get(SALES_URL, [{"json": sales, "status_code": 200},
+                                 {"status_code": 503, "text": "busy"},
+                                 {"json": sales, "status_code": 200}])
+        job = ResumableJob.sales(_client(sleeps), str(tmp_path / "job"), "2025-01-01", "2025-01-31")
+
+        assert job.run() == 2
+        assert job.missing_lotes() == []
+        assert len(sleeps.calls) == 1
+
+
+class TestWebClientRetry:
+
+    def test_503_then_success(self, sleeps):
+        client = ChessWebClient(api_url=BASE_URL, username="u", password="p", retry=RetryPolicy(sleep=sleeps))
+        client._authenticated = True
+        with rm.Mocker() as m:
+            m.get(WEB_VIGENCIAS_URL, [{"status_code": 503, "text": "busy"},
+                                      {"json": {"eListaPrecios": []}, "status_code": 200}])
+
+            assert client.get_price_lists() == []
+
+        assert len(sleeps.calls) == 1
+
+    def test_from_env_forwards_retry(self, monkeypatch):
+        monkeypatch.setenv("TEST_API_URL", BASE_URL)
+        monkeypatch.setenv("TEST_USERNAME", "u")
+        monkeypatch.setenv("TEST_PASSWORD", "p")
+        retry = RetryPolicy(max_attempts=2)
+
+        assert ChessWebClient.from_env(prefix="TEST_", retry=retry).retry is retry
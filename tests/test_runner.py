@@ -0,0 +1,128 @@
+"""Tests for MultiCompanyRunner."""
+
+import threading
+import time
+
+import pytest
+
+from chesserp.exceptions import ApiError
+from chesserp.runner import ExtractionTask, MultiCompanyRunner
+
+API_PATH = "/web/api/chess/v1/"
+SERVERS = {"EMPRESA1_": "http://srv1.local", "EMPRESA2_": "http://srv2.local"}
+
+
+def _sales_page(request, context):
+    empresa = 1 if "srv1" in request.url else 2
+    return {
+        "dsReporteComprobantesApi": {"VentasResumen": [{
+            "idEmpresa": empresa, "idDocumento": "FCVTA", "letra": "A", "serie": 1,
+            "nrodoc": 1, "fechaComprobate": request.qs["fechadesde"][0], "idSucursal": 1,
+            "idCliente": 1, "idLinea": 1, "idArticulo": 100,
+        }]},
+        "cantComprobantesVentas": "Numero de lote obtenido: 1/1.",
+    }
+
+
+@pytest.fixture
+def servers(mock_api, monkeypatch):
+    for prefix, url in SERVERS.items():
+        monkeypatch.setenv(f"{prefix}API_URL", url)
+        monkeypatch.setenv(f"{prefix}USERNAME", "u")
+        monkeypatch.setenv(f"{prefix}PASSWORD", "p")
+        mock_api.post(url + API_PATH + "auth/login", json={"sessionId": "JSESSIONID=x"})
+        mock_api.get(url + API_PATH + "ventas/", json=_sales_page)
+    return mock_api
+
+
+class TestExtractionTask:
+
+    def test_for_ranges(self):
+        tasks = ExtractionTask.for_ranges("get_sales", [("2025-01-01", "2025-01-31"), ("2025-02-01", "2025-02-28")],
+                                          detallado=True)
+
+        assert [t.key for t in tasks] == ["get_sales[2025-01-01..2025-01-31]", "get_sales[2025-02-01..2025-02-28]"]
+        assert tasks[0].params["detallado"] is True
+
+    def test_unknown_endpoint_rejected(self):
+        with pytest.raises(ValueError):
+            MultiCompanyRunner(["E_"], [ExtractionTask(endpoint="login")])
+
+
+class TestMultiCompanyRunner:
+
+    def test_results_per_company(self, servers):
+        tasks = ExtractionTask.for_ranges("get_sales", [("2025-01-01", "2025-01-31"), ("2025-02-01", "2025-02-28")])
+
+        results = MultiCompanyRunner(list(SERVERS), tasks).run()
+
+        assert set(results) == set(SERVERS)
+        for prefix, empresa in (("EMPRESA1_", 1), ("EMPRESA2_", 2)):
+            assert results[prefix].ok
+            sales = results[prefix].results["get_sales[2025-02-01..2025-02-28]"]
+            assert sales[0].id_empresa == empresa
+            assert sales[0].fecha_comprobante == "2025-02-01"
+
+    def test_streaming_sink_without_keeping_results(self, servers):
+        received = []
+        lock = threading.Lock()
+
+        def sink(company, task, batch):
+            with lock:
+                received.append((company, len(batch)))
+
+        results = MultiCompanyRunner(
+            list(SERVERS),
+            ExtractionTask.for_ranges("iter_sales_batches", [("2025-01-01", "2025-01-31")], raw=True),
+            sinks=[sink],
+            keep_results=False,
+        ).run()
+
+        assert sorted(received) == [("EMPRESA1_", 1), ("EMPRESA2_", 1)]
+        assert results["EMPRESA1_"].results == {}
+
+    def test_error_isolated_per_company(self, servers):
+        servers.get(SERVERS["EMPRESA2_"] + API_PATH + "ventas/", status_code=500, text="boom")
+
+        results = MultiCompanyRunner(list(SERVERS), [ExtractionTask(endpoint="get_sales", params={
+            "fecha_desde": "2025-01-01", "fecha_hasta": "2025-01-31"})]).run()
+
+        assert results["EMPRESA1_"].ok
+        assert isinstance(results["EMPRESA2_"].errors["get_sales[2025-01-01..2025-01-31]"], ApiError)
+
+    def test_per_server_limit(self):
+        """Dos empresas en el mismo servidor comparten el limite max_per_server."""
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        class FakeClient:
+            api_url = "http://same-server"
+            name = "fake"
+
+            def get_staff(self):
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[0] -= 1
+                return []
+
+        tasks = [ExtractionTask(endpoint="get_staff", name=f"staff{i}") for i in range(4)]
+        MultiCompanyRunner(["A_", "B_"], tasks, max_workers=8, max_per_server=2,
+                           client_factory=lambda prefix: FakeClient()).run()
+
+        assert peak[0] == 2
+
+    def test_client_kwargs_forwarded_to_from_env(self, servers):
+        runner = MultiCompanyRunner(["EMPRESA1_"], [ExtractionTask(endpoint="get_staff", params={"raw": True})],
+                                    client_kwargs={"max_workers": 3})
+        staff = {"idSucursal": 1, "idPersonal": 7, "desPersonal": "Vendedor"}
+        servers.get(SERVERS["EMPRESA1_"] + API_PATH + "personalComercial/", json={"PersonalComercial": {"ePersCom": [staff]}})
+
+        result = runner.run()["EMPRESA1_"]
+
+        assert result.ok, result.errors
+        assert list(result.results.values()) == [[staff]]
+        assert runner.clients["EMPRESA1_"].max_workers == 3
+        assert runner.clients["EMPRESA1_"].name == "EMPRESA1"
@@ -0,0 +1,301 @@
+"""Tests for get_sales / get_sales_raw."""
+
+import time
+
+import pytest
+
+from chesserp.client import ChessClient
+from chesserp.models.sales import Sale
+from chesserp.ranges import WorkUnit
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+
+def _make_response(sales: list, lote_actual: int, total_lotes: int):
+    """Helper: wraps sales list in the API response structure."""
+    return {
+        "dsReporteComprobantesApi": {"VentasResumen": sales},
+        "cantComprobantesVentas": f"Numero de lote obtenido: {lote_actual}/{total_lotes}. Cantidad de comprobantes totales: {len(sales) * total_lotes}",
+    }
+
+
+def _lotes_callback(total_lotes: int, delay_for=None):
+    """Helper: responde segun el nroLote pedido (independiente del orden de llegada)."""
+    def _callback(request, context):
+        nro_lote = int(request.qs["nrolote"][0])
+        if delay_for:
+            time.sleep(delay_for(nro_lote))
+        return _make_response([make_sale(nro_lote)], nro_lote, total_lotes)
+    return _callback
+
+
+# ---------------------------------------------------------------------------
+# get_sales — pagination
+# ---------------------------------------------------------------------------
+
+class TestGetSalesLotes:
+
+    def test_single_lote(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_make_response([make_sale(1), make_sale(2)], 1, 1))
+
+        result = client.get_sales("2025-01-01", "2025-01-31")
+
+        assert len(result) == 2
+        assert all(isinstance(s, Sale) for s in result)
+
+    def test_fetches_all_lotes_in_order(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(4))
+
+        result = client.get_sales("2025-01-01", "2025-01-31")
+
+        assert [s.nro_doc for s in result] == [1, 2, 3, 4]
+
+    def test_unparseable_lote_string_assumes_one_lote(self, client, mock_api):
+        mock_api.get(SALES_URL, json={
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(1)]},
+            "cantComprobantesVentas": "",
+        })
+
+        result = client.get_sales("2025-01-01", "2025-01-31", raw=True)
+
+        assert len(result) == 1
+        assert len([r for r in mock_api.request_history if "ventas" in r.path]) == 1
+
+
+class TestGetSalesConcurrent:
+
+    def test_concurrent_keeps_lote_order(self, client, mock_api):
+        """Los lotes bajos tardan mas: el resultado igual respeta el orden de nroLote."""
+        mock_api.get(SALES_URL, json=_lotes_callback(6, delay_for=lambda n: 0.05 if n < 4 else 0))
+
+        result = client.get_sales("2025-01-01", "2025-01-31", max_workers=4)
+
+        assert [s.nro_doc for s in result] == [1, 2, 3, 4, 5, 6]
+
+    def test_concurrent_raw(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(3))
+
+        result = client.get_sales("2025-01-01", "2025-01-31", raw=True, max_workers=3)
+
+        assert [s["nrodoc"] for s in result] == [1, 2, 3]
+
+    def test_client_level_max_workers(self, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(5))
+        c = ChessClient(api_url=BASE_URL, username="u", password="p", max_workers=3)
+
+        result = c.get_sales("2025-01-01", "2025-01-31")
+
+        nro_lotes = sorted(int(r.qs["nrolote"][0]) for r in mock_api.request_history if "ventas" in r.path)
+        assert nro_lotes == [1, 2, 3, 4, 5]
+        assert [s.nro_doc for s in result] == [1, 2, 3, 4, 5]
+
+
+# ---------------------------------------------------------------------------
+# iter_sales / iter_sales_batches — streaming
+# ---------------------------------------------------------------------------
+
+def _sales_requests(mock_api):
+    return [r for r in mock_api.request_history if "ventas" in r.path]
+
+
+class TestIterSales:
+
+    def test_batches_yielded_as_they_arrive(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(5))
+
+        batches = client.iter_sales_batches("2025-01-01", "2025-01-31")
+        first = next(batches)
+
+        assert [s.nro_doc for s in first] == [1]
+        assert len(_sales_requests(mock_api)) == 1
+
+        rest = list(batches)
+        assert [[s.nro_doc for s in b] for b in rest] == [[2], [3], [4], [5]]
+
+    def test_iter_sales_yields_records(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(3))
+
+        result = list(client.iter_sales("2025-01-01", "2025-01-31", raw=True))
+
+        assert [s["nrodoc"] for s in result] == [1, 2, 3]
+
+    def test_concurrent_window_is_bounded(self, client, mock_api):
+        """Con max_workers=2, tras el primer lote concurrente hay a lo sumo 2 lotes pedidos por delante."""
+        mock_api.get(SALES_URL, json=_lotes_callback(10))
+
+        batches = client.iter_sales_batches("2025-01-01", "2025-01-31", max_workers=2)
+        next(batches)  # lote 1
+        next(batches)  # lote 2 (ventana: 3 pendiente + 4 repuesto)
+        time.sleep(0.05)
+
+        assert len(_sales_requests(mock_api)) <= 4
+        assert [s.nro_doc for b in batches for s in b] == [3, 4, 5, 6, 7, 8, 9, 10]
+
+    def test_get_sales_matches_iter_sales(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_callback(3))
+
+        assert ([s.nro_doc for s in client.get_sales("2025-01-01", "2025-01-31")]
+                == [s.nro_doc for s in client.iter_sales("2025-01-01", "2025-01-31")])
+
+
+# ---------------------------------------------------------------------------
+# get_sales_range — ventanas de fechas en paralelo
+# ---------------------------------------------------------------------------
+
+class TestGetSalesFields:
+
+    def test_models_only_have_requested_fields(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_make_response([make_sale(1), make_sale(2)], 1, 1))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", fields=["nro_doc", "subtotal_final"])
+
+        assert [v.model_dump() for v in ventas] == [{"nro_doc": 1, "subtotal_final": 12.1},
+                                                     {"nro_doc": 2, "subtotal_final": 12.1}]
+
+    def test_raw_keeps_only_aliases(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_make_response([make_sale(1)], 1, 1))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", raw=True, fields=["nro_doc", "id_cliente"])
+
+        assert ventas == [{"nrodoc": 1, "idCliente": 1}]
+
+    def test_lazy_with_fields(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_make_response([make_sale(3)], 1, 1))
+
+        ventas = client.get_sales("2025-01-01", "2025-01-31", lazy=True, fields=["nro_doc"])
+
+        assert ventas[0].nro_doc == 3
+        assert ventas[0].raw == {"nrodoc": 3}
+
+    def test_unknown_field_raises_before_request(self, client, mock_api):
+        with pytest.raises(ValueError, match="nrodoc"):
+            client.get_sales("2025-01-01", "2025-01-31", fields=["nrodoc"])
+
+        assert not any(r.path.endswith("/ventas/") for r in mock_api.request_history)
+
+
+class TestGetSalesRange:
+
+    @staticmethod
+    def _window_callback(request, context):
+        """Un lote por ventana con 2 lotes; nro_doc codifica el mes y el lote."""
+        desde = request.qs["fechadesde"][0]
+        nro_lote = int(request.qs["nrolote"][0])
+        # Enero responde lento para comprobar que el orden no depende de la llegada
+        if desde.startswith("2025-01"):
+            time.sleep(0.05)
+        nro_doc = int(desde[5:7]) * 10 + nro_lote
+        return _make_response([make_sale(nro_doc)], nro_lote, 2)
+
+    def test_windows_stitched_in_date_order(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._window_callback)
+
+        result = client.get_sales_range("2025-01-10", "2025-03-05", window="month", max_windows=3)
+
+        assert [s.nro_doc for s in result] == [11, 12, 21, 22, 31, 32]
+        desdes = sorted({(r.qs["fechadesde"][0], r.qs["fechahasta"][0]) for r in mock_api.request_history
+                         if "ventas" in r.path})
+        assert desdes == [("2025-01-10", "2025-01-31"), ("2025-02-01", "2025-02-28"), ("2025-03-01", "2025-03-05")]
+
+    def test_sequential_raw(self, client, mock_api):
+        mock_api.get(SALES_URL, json=self._window_callback)
+
+        result = client.get_sales_range("2025-01-30", "2025-02-02", window="month", raw=True, max_windows=1)
+
+        assert [s["nrodoc"] for s in result] == [11, 12, 21, 22]
+
+
+# ---------------------------------------------------------------------------
+# plan_sales_range / fetch_sales_plan — ventanas adaptativas
+# ---------------------------------------------------------------------------
+
+def _lotes_by_day(lotes_per_day):
+    """
+    Helper: simula un servidor donde cada día aporta lotes_per_day(día) lotes.
+    Los registros de un rango son los lotes de sus días en orden; nro_doc = dia*100 + lote del día.
+    """
+    from datetime import date, timedelta
+
+    def _callback(request, context):
+        desde = date.fromisoformat(request.qs["fechadesde"][0])
+        hasta = date.fromisoformat(request.qs["fechahasta"][0])
+        nro_lote = int(request.qs["nrolote"][0])
+        lotes = []
+        day = desde
+        while day <= hasta:
+            lotes.extend(day.day * 100 + i for i in range(1, lotes_per_day(day.day) + 1))
+            day += timedelta(days=1)
+        total = max(1, len(lotes))
+        sales = [make_sale(lotes[nro_lote - 1])] if lotes else []
+        return {
+            "dsReporteComprobantesApi": {"VentasResumen": sales},
+            "cantComprobantesVentas": f"Numero de lote obtenido: {nro_lote}/{total}. "
+                                      f"Cantidad de comprobantes totales: {len(lotes)}",
+        }
+    return _callback
+
+
+class TestAdaptiveSalesRange:
+
+    def test_heavy_window_is_split(self, client, mock_api):
+        # Día 1 pesado (8 lotes), el resto 1 lote por día
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 8 if d == 1 else 1))
+
+        units = client.plan_sales_range("2025-01-01", "2025-01-08", window="week", max_lotes=4)
+
+        assert all(u.lotes <= 4 or u.fecha_desde == u.fecha_hasta for u in units)
+        assert units[0].windows == [("2025-01-01", "2025-01-01")]
+        assert units[0].lotes == 8 and units[0].docs == 8
+
+    def test_tiny_windows_are_merged(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 1))
+
+        units = client.plan_sales_range("2025-01-01", "2025-01-06", window="day", max_lotes=3)
+
+        assert [(u.fecha_desde, u.fecha_hasta, u.lotes) for u in units] == [
+            ("2025-01-01", "2025-01-03", 3),
+            ("2025-01-04", "2025-01-06", 3),
+        ]
+
+    def test_fetch_reuses_probe_and_keeps_order(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 3 if d % 2 else 1))
+
+        units = client.plan_sales_range("2025-01-01", "2025-01-05", window="month", max_lotes=3)
+        probes = mock_api.call_count
+        result = client.fetch_sales_plan(units, max_units=3)
+
+        assert [s.nro_doc for s in result] == [101, 102, 103, 201, 301, 302, 303, 401, 501, 502, 503]
+        # Solo se piden los lotes 2..N de cada ventana: el lote 1 viene del sondeo
+        assert mock_api.call_count - probes == sum(u.lotes - len(u.windows) for u in units)
+        assert all(u.elapsed is not None and u.records for u in units)
+        assert sum(u.records for u in units) == len(result)
+
+    def test_fetch_plan_twice(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 2))
+
+        units = client.plan_sales_range("2025-01-01", "2025-01-04", window="day", max_lotes=3)
+        first = client.fetch_sales_plan(units, raw=True)
+        second = client.fetch_sales_plan(units, raw=True)
+
+        assert second == first
+        assert [s["nrodoc"] for s in second] == [101, 102, 201, 202, 301, 302, 401, 402]
+
+    def test_fetch_unit_without_probe(self, client, mock_api):
+        # Unidad armada a mano: sin respuesta del sondeo, se pide también el lote 1
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 2))
+        unit = WorkUnit()
+        unit.windows = [("2025-01-01", "2025-01-01"), ("2025-01-02", "2025-01-02")]
+
+        result = client.fetch_sales_plan([unit], raw=True)
+
+        assert [s["nrodoc"] for s in result] == [101, 102, 201, 202]
+
+    def test_get_sales_range_adaptive(self, client, mock_api):
+        mock_api.get(SALES_URL, json=_lotes_by_day(lambda d: 2))
+
+        result = client.get_sales_range("2025-01-01", "2025-01-04", window="month", max_lotes=3, raw=True)
+
+        assert [s["nrodoc"] for s in result] == [101, 102, 201, 202, 301, 302, 401, 402]
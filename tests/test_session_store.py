@@ -0,0 +1,217 @@
+"""Tests for session stores and session reuse across client instances."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+import requests_mock as rm
+
+from chesserp.async_client import AsyncChessClient
+from chesserp.client import ChessClient
+from chesserp.session_store import FileSessionStore, SQLiteSessionStore, make_session_key
+from chesserp.transport import load_stored_session
+from chesserp.web_client import ChessWebClient
+
+BASE_URL = "http://test-api.local"
+LOGIN_URL = BASE_URL + "/web/api/chess/v1/auth/login"
+STAFF_URL = BASE_URL + "/web/api/chess/v1/personalComercial/"
+WEB_LOGIN_URL = BASE_URL + "/static/auth/j_spring_security_check"
+WEB_VIGENCIAS_URL = BASE_URL + "/web/api/precios/obtenerVigenciasListas"
+
+API_KEY = make_session_key(BASE_URL, "u")
+WEB_KEY = make_session_key(BASE_URL, "u", kind="web")
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        yield FileSessionStore(str(tmp_path / "sessions.json"))
+    else:
+        s = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+        yield s
+        s.close()
+
+
+def _staff(valid_cookie):
+    def _callback(request, context):
+        if request.headers.get("Cookie") != valid_cookie:
+            context.status_code = 401
+            return {"error": "Unauthorized"}
+        return {"PersonalComercial": {"ePersCom": []}}
+    return _callback
+
+
+def _logins(m):
+    return sum(1 for r in m.request_history if r.method == "POST")
+
+
+class TestSessionStore:
+
+    def test_set_get_delete(self, store):
+        assert store.get(API_KEY) is None
+
+        store.set(API_KEY, "JSESSIONID=abc", created_at=1000.0)
+        assert store.get(API_KEY) == ("JSESSIONID=abc", 1000.0)
+
+        store.delete(API_KEY)
+        assert store.get(API_KEY) is None
+
+    def test_delete_only_matching_session(self, store):
+        store.set(API_KEY, "JSESSIONID=new")
+
+        store.delete(API_KEY, "JSESSIONID=old")
+        assert store.get(API_KEY)[0] == "JSESSIONID=new"
+
+        store.delete(API_KEY, "JSESSIONID=new")
+        assert store.get(API_KEY) is None
+
+    def test_keys_are_independent(self, store):
+        store.set(API_KEY, "api-session")
+        store.set(WEB_KEY, "web-session")
+        store.clear()
+        assert store.get(API_KEY) is None and store.get(WEB_KEY) is None
+
+    def test_file_is_private(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        FileSessionStore(str(path)).set(API_KEY, "secret")
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_concurrent_writers_do_not_clash(self, tmp_path):
+        # Instancias separadas (sin lock compartido), como dos procesos
+        path = str(tmp_path / "sessions.json")
+        errors = []
+
+        def _relogin(n):
+            store = FileSessionStore(path)
+            try:
+                for i in range(50):
+                    store.set(f"{API_KEY}{n}", f"s{i}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_relogin, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        with open(path, encoding="utf-8") as f:
+            assert isinstance(json.load(f), dict)
+        assert [f for f in os.listdir(tmp_path) if f.endswith(".tmp")] == []
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "sessions.json"
+        path.write_text("{no es json")
+        assert FileSessionStore(str(path)).get(API_KEY) is None
+
+    def test_load_stored_session(self, store):
+        store.set(API_KEY, "S1", created_at=time.time() - 100)
+
+        session_id, age = load_stored_session(store, API_KEY)
+        assert session_id == "S1" and age >= 100
+        assert load_stored_session(store, API_KEY, rejected="S1") is None
+        assert load_stored_session(store, API_KEY, max_age=50) is None
+        assert load_stored_session(None, API_KEY) is None
+
+
+class TestClientSessionReuse:
+
+    def test_login_saves_session(self, store):
+        with rm.Mocker() as m:
+            m.post(LOGIN_URL, json={"sessionId": "JSESSIONID=s1"})
+            ChessClient(api_url=BASE_URL, username="u", password="p", session_store=store).login()
+
+        assert store.get(API_KEY)[0] == "JSESSIONID=s1"
+
+    def test_stored_session_skips_login(self, store):
+        store.set(API_KEY, "JSESSIONID=s1")
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", session_store=store)
+        with rm.Mocker() as m:
+            m.post(LOGIN_URL, json={"sessionId": "JSESSIONID=s2"})
+            m.get(STAFF_URL, json=_staff("JSESSIONID=s1"))
+
+            assert client.get_staff() == []
+            assert _logins(m) == 0
+
+    def test_rejected_session_relogins_and_is_replaced(self, store):
+        store.set(API_KEY, "JSESSIONID=expired")
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", session_store=store)
+        with rm.Mocker() as m:
+            m.post(LOGIN_URL, json={"sessionId": "JSESSIONID=s2"})
+            m.get(STAFF_URL, json=_staff("JSESSIONID=s2"))
+
+            assert client.get_staff() == []
+            assert _logins(m) == 1
+
+        assert store.get(API_KEY)[0] == "JSESSIONID=s2"
+
+    def test_session_older_than_max_age_not_reused(self, store):
+        store.set(API_KEY, "JSESSIONID=old", created_at=time.time() - 3600)
+        client = ChessClient(api_url=BASE_URL, username="u", password="p",
+                             session_store=store, session_max_age=600)
+        with rm.Mocker() as m:
+            m.post(LOGIN_URL, json={"sessionId": "JSESSIONID=s2"})
+            m.get(STAFF_URL, json=_staff("JSESSIONID=s2"))
+
+            client.get_staff()
+            assert _logins(m) == 1
+
+    def test_async_client_reuses_stored_session(self, store):
+        store.set(API_KEY, "JSESSIONID=s1")
+        seen = []
+
+        async def _run():
+            async with AsyncChessClient(api_url=BASE_URL, username="u", password="p",
+                                        session_store=store) as client:
+                await client._ensure_session()
+                seen.append(client.base_headers["Cookie"])
+
+        asyncio.run(_run())
+        assert seen == ["JSESSIONID=s1"]
+
+
+class TestWebClientSessionReuse:
+
+    def test_stored_cookie_skips_login(self, store):
+        store.set(WEB_KEY, "web-s1")
+        client = ChessWebClient(api_url=BASE_URL, username="u", password="p", session_store=store)
+
+        def _vigencias(request, context):
+            if "JSESSIONID=web-s1" not in request.headers.get("Cookie", ""):
+                context.status_code = 401
+                return {}
+            return {"eListaPrecios": []}
+
+        with rm.Mocker() as m:
+            m.post(WEB_LOGIN_URL, text="")
+            m.get(WEB_VIGENCIAS_URL, json=_vigencias)
+
+            assert client.get_price_lists() == []
+            assert _logins(m) == 0
+
+    def test_rejected_cookie_relogins_and_is_replaced(self, store):
+        store.set(WEB_KEY, "expired")
+        client = ChessWebClient(api_url=BASE_URL, username="u", password="p", session_store=store)
+
+        def _login(request, context):
+            client._session.cookies.set("JSESSIONID", "renewed", domain="test-api.local")
+            return ""
+
+        def _vigencias(request, context):
+            if "JSESSIONID=renewed" not in request.headers.get("Cookie", ""):
+                context.status_code = 401
+                return {}
+            return {"eListaPrecios": []}
+
+        with rm.Mocker() as m:
+            m.post(WEB_LOGIN_URL, text=_login)
+            m.get(WEB_VIGENCIAS_URL, json=_vigencias)
+
+            assert client.get_price_lists() == []
+            assert _logins(m) == 1
+
+        assert store.get(WEB_KEY)[0] == "renewed"
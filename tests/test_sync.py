@@ -0,0 +1,133 @@
+"""Tests for SalesSync (incremental sales sync)."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from chesserp.sync import SalesSync, group_ranges
+from factories import make_sale
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+TODAY = date(2025, 3, 10)
+
+
+def _sales_by_range(request, context):
+    """Una venta por día del rango pedido (nrodoc = día del mes)."""
+    desde = datetime.strptime(request.qs["fechadesde"][0], "%Y-%m-%d").date()
+    hasta = datetime.strptime(request.qs["fechahasta"][0], "%Y-%m-%d").date()
+    sales = []
+    day = desde
+    while day <= hasta:
+        sales.append(make_sale(day.day, fechaComprobate=day.isoformat()))
+        day += timedelta(days=1)
+    return {
+        "dsReporteComprobantesApi": {"VentasResumen": sales},
+        "cantComprobantesVentas": f"Numero de lote obtenido: 1/1. Cantidad de comprobantes totales: {len(sales)}",
+    }
+
+
+def _sales_requests(mock_api):
+    return [(r.qs["fechadesde"][0], r.qs["fechahasta"][0])
+            for r in mock_api.request_history if "ventas" in r.path]
+
+
+@pytest.fixture
+def sync(client, tmp_path):
+    return SalesSync(client, data_dir=str(tmp_path), company="EMPRESA1", recheck_days=2)
+
+
+def test_group_ranges_splits_gaps_and_long_runs():
+    days = [date(2025, 1, d) for d in (1, 2, 3, 5, 6)]
+    assert group_ranges(days) == [(date(2025, 1, 1), date(2025, 1, 3)), (date(2025, 1, 5), date(2025, 1, 6))]
+    assert group_ranges(days[:3], max_days=2) == [(date(2025, 1, 1), date(2025, 1, 2)), (date(2025, 1, 3), date(2025, 1, 3))]
+
+
+class TestSalesSync:
+
+    def test_first_sync_downloads_whole_range(self, sync, mock_api):
+        mock_api.get(SALES_URL, json=_sales_by_range)
+
+        written = sync.sync("2025-03-01", today=TODAY)
+
+        assert len(written) == 10
+        assert _sales_requests(mock_api) == [("2025-03-01", "2025-03-10")]
+        assert [r["nrodoc"] for r in sync.load()] == list(range(1, 11))
+
+    def test_second_sync_only_rechecks_trailing_window(self, sync, mock_api):
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        sync.sync("2025-03-01", today=TODAY)
+        mock_api.reset_mock()
+
+        sync.sync("2025-03-01", today=TODAY)
+
+        assert _sales_requests(mock_api) == [("2025-03-08", "2025-03-10")]
+
+    def test_new_days_fetched_next_day(self, sync, mock_api):
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        sync.sync("2025-03-01", today=TODAY)
+        mock_api.reset_mock()
+
+        sync.sync("2025-03-01", today=TODAY + timedelta(days=3))
+
+        assert _sales_requests(mock_api) == [("2025-03-11", "2025-03-13")]
+
+    def test_mark_for_refresh(self, sync, mock_api):
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        sync.sync("2025-03-01", today=TODAY)
+        sync.mark_for_refresh("2025-03-02")
+        mock_api.reset_mock()
+
+        sync.sync("2025-03-01", today=TODAY)
+
+        assert _sales_requests(mock_api) == [("2025-03-02", "2025-03-02"), ("2025-03-08", "2025-03-10")]
+        assert sync.state["refresh"] == []
+
+    def test_refetched_day_replaces_records(self, sync, mock_api):
+        """Un comprobante anulado que desaparece del dia se refleja en el dataset."""
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        sync.sync("2025-03-09", today=TODAY)
+
+        mock_api.get(SALES_URL, json={
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(99, fechaComprobate="2025-03-10")]},
+            "cantComprobantesVentas": "Numero de lote obtenido: 1/1.",
+        })
+        sync.sync("2025-03-09", today=TODAY)
+
+        assert [r["nrodoc"] for r in sync.load("2025-03-10", "2025-03-10")] == [99]
+        assert list(sync.load("2025-03-09", "2025-03-09")) == []
+
+    def test_empty_days_synced_only_when_confirmed(self, sync, mock_api):
+        mock_api.get(SALES_URL, json={
+            "dsReporteComprobantesApi": {"VentasResumen": [make_sale(1, fechaComprobate="2025-03-09"),
+                                                           make_sale(2, fechaComprobate="sin fecha")]},
+            "cantComprobantesVentas": "Numero de lote obtenido: 1/1. Cantidad de comprobantes totales: 2",
+        })
+
+        written = sync.sync("2025-03-08", today=TODAY)
+
+        # El registro sin fecha podría ser del 8 o del 10: esos días no se dan por vacíos
+        assert written == {"2025-03-09": 1}
+        assert sorted(sync.synced_days()) == ["2025-03-09"]
+
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        sync.sync("2025-03-08", today=TODAY)
+
+        assert sorted(sync.synced_days()) == ["2025-03-08", "2025-03-09", "2025-03-10"]
+
+    def test_recheck_window_is_today_plus_recheck_days(self, sync):
+        sync.state["days"] = {f"2025-03-{d:02d}": "x" for d in range(1, 11)}
+
+        assert sync.pending_days("2025-03-01", today=TODAY) == [date(2025, 3, 8), date(2025, 3, 9), TODAY]
+
+    def test_state_persists_between_instances(self, client, mock_api, tmp_path):
+        mock_api.get(SALES_URL, json=_sales_by_range)
+        SalesSync(client, data_dir=str(tmp_path), company="EMPRESA1", recheck_days=0).sync("2025-03-01", today=TODAY)
+        mock_api.reset_mock()
+
+        again = SalesSync(client, data_dir=str(tmp_path), company="EMPRESA1", recheck_days=0)
+
+        assert again.pending_days("2025-03-01", today=TODAY) == [TODAY]
+        assert len(again.synced_days()) == 10
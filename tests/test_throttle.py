@@ -0,0 +1,232 @@
+"""Tests for chesserp.throttle (per-host rate limiter / in-flight governor)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chesserp.client import ChessClient
+from chesserp.exceptions import DeadlineExceeded
+from chesserp.throttle import HostLimiter, limiter_for, reset_limiters
+from chesserp.web_client import ChessWebClient
+
+BASE_URL = "http://test-api.local"
+API_PATH = "/web/api/chess/v1/"
+SALES_URL = BASE_URL + API_PATH + "ventas/"
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    reset_limiters()
+    yield
+    reset_limiters()
+
+
+class TestHostLimiter:
+
+    def test_rate_limit_spaces_requests(self):
+        limiter = HostLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            with limiter.slot():
+                pass
+        elapsed = time.monotonic() - start
+
+        # 1 token inicial + 5 a 50/s => al menos 0.1s
+        assert elapsed >= 0.09
+        stats = limiter.stats()
+        assert stats["requests"] == 6
+        assert stats["waited"] == 5
+        assert stats["rate_wait"] >= 0.09
+
+    def test_burst_goes_through_without_waiting(self):
+        limiter = HostLimiter(rate=1, burst=5)
+        for _ in range(5):
+            with limiter.slot():
+                pass
+        assert limiter.stats()["waited"] == 0
+
+    def test_max_in_flight_across_threads(self):
+        limiter = HostLimiter(max_in_flight=2)
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def _work():
+            with limiter.slot():
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[0] -= 1
+
+        threads = [threading.Thread(target=_work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 2
+        assert limiter.stats()["slot_wait"] > 0
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_async_slots(self):
+        limiter = HostLimiter(max_in_flight=2)
+        in_flight, peak = [0], [0]
+
+        async def _work():
+            async with limiter.aslot():
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+
+        async def _run():
+            await asyncio.gather(*(_work() for _ in range(6)))
+
+        asyncio.run(_run())
+
+        assert peak[0] == 2
+        assert limiter.stats()["requests"] == 6
+
+    def test_async_cancel_during_rate_wait_releases_slot(self):
+        limiter = HostLimiter(rate=1, burst=1, max_in_flight=1)
+
+        async def _hold():
+            async with limiter.aslot():
+                pass
+
+        async def _run():
+            await _hold()  # consume el token inicial
+            # Sin token: cada intento espera ~1s de tasa y se cancela con el slot tomado
+            for _ in range(3):
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(_hold(), timeout=0.01)
+
+        asyncio.run(_run())
+
+        assert limiter._free == 1
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_async_cancel_while_waiting_for_slot(self):
+        limiter = HostLimiter(max_in_flight=1)
+
+        async def _run():
+            async with limiter.aslot():
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(limiter.aslot().__aenter__(), timeout=0.01)
+            # El slot sigue disponible para la próxima tarea
+            await asyncio.wait_for(_use(), timeout=1)
+
+        async def _use():
+            async with limiter.aslot():
+                pass
+
+        asyncio.run(_run())
+
+        assert limiter._free == 1
+        assert limiter._async_waiters == []
+
+    def test_async_waiter_woken_by_thread_release(self):
+        limiter = HostLimiter(max_in_flight=1)
+        ctx = limiter.slot()
+        ctx.__enter__()
+
+        async def _run():
+            threading.Timer(0.05, ctx.__exit__, (None, None, None)).start()
+            start = time.monotonic()
+            async with limiter.aslot():
+                return time.monotonic() - start
+
+        waited = asyncio.run(_run())
+
+        assert 0.03 < waited < 1
+        assert limiter.stats()["slot_wait"] > 0
+
+    def test_sync_error_during_rate_wait_releases_slot(self, monkeypatch):
+        limiter = HostLimiter(rate=1, burst=1, max_in_flight=1)
+        with limiter.slot():
+            pass
+
+        def _interrupted(_):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr("chesserp.throttle.time.sleep", _interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            with limiter.slot():
+                pass
+
+        assert limiter._free == 1
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_slot_wait_bounded_by_expires(self):
+        limiter = HostLimiter(max_in_flight=1)
+        with limiter.slot():
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                with limiter.slot(expires=time.monotonic() + 0.05):
+                    pass
+            assert 0.04 < time.monotonic() - start < 0.5
+
+        assert limiter._free == 1
+        assert limiter.stats()["requests"] == 1
+
+    def test_rate_wait_past_expires_not_slept(self):
+        limiter = HostLimiter(rate=1, burst=1)
+        with limiter.slot():
+            pass
+
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            with limiter.slot(expires=time.monotonic() + 0.1):
+                pass
+
+        assert time.monotonic() - start < 0.1
+        # El token no usado se devuelve: el próximo request no espera de más
+        assert limiter._reserve() <= 1.0
+
+
+class TestRegistry:
+
+    def test_shared_per_api_url(self):
+        assert limiter_for("http://a/", rate=5) is limiter_for("http://a")
+        assert limiter_for("http://a") is not limiter_for("http://b")
+
+    def test_first_configuration_wins(self):
+        limiter_for("http://a", rate=5)
+        assert limiter_for("http://a", rate=50).rate == 5
+
+    def test_clients_of_same_host_share_limiter(self, mock_api):
+        client = ChessClient(api_url=BASE_URL, username="u", password="p", rate_limit=100, max_in_flight=2)
+        web = ChessWebClient(api_url=BASE_URL + "/", username="u", password="p", max_in_flight=2)
+
+        assert client.limiter is web.limiter
+
+    def test_no_limiter_by_default(self):
+        assert ChessClient(api_url=BASE_URL, username="u", password="p").limiter is None
+
+
+def test_client_requests_go_through_limiter(mock_api):
+    mock_api.get(SALES_URL, json={
+        "dsReporteComprobantesApi": {"VentasResumen": []},
+        "cantComprobantesVentas": "Numero de lote obtenido: 1/1.",
+    })
+    client = ChessClient(api_url=BASE_URL, username="u", password="p", max_in_flight=1)
+
+    client.get_sales("2025-01-01", "2025-01-31")
+
+    # login + lote 1
+    assert client.limiter.stats()["requests"] == 2
+
+
+def test_client_limiter_wait_bounded_by_deadline(mock_api):
+    client = ChessClient(api_url=BASE_URL, username="u", password="p", max_in_flight=1)
+
+    with client.limiter.slot():
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get_sales("2025-01-01", "2025-01-31", deadline=0.1)
+
+    assert time.monotonic() - start < 0.5
+    assert not any("ventas" in r.path for r in mock_api.request_history)